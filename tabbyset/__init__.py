@@ -1,12 +1,16 @@
 """
 Module for the business logic utilities around the model.
 """
-from .utils import (Folder, PathParam, walk_tests_folder,
-                    FlexTable, ParsableQueryStatement, DictQuery, sort_with_priority,
-                    chunkify_csv1_file, shuffle_csv1, shuffle_csv2,
+from .utils import (Folder, PathParam, walk_tests_folder, read_tests_files, TestsFilesCache,
+                    FlexTable, ColumnarFlexTable, ParsableQueryStatement, DictQuery, sort_with_priority,
+                    chunkify_csv1_file, split_csv1_file, merge_csv1_files, shuffle_csv1, shuffle_csv2,
+                    convert_to_csv2,
                     global_columns, queries,
                     dhash, group_by,
+                    find_duplicates, write_duplicates_report,
                     floor_to_tick, ceil_to_tick, round_to_tick, is_multiple_of_tick,
+                    floor_to_tick_many, ceil_to_tick_many, round_to_tick_many, is_multiple_of_tick_many,
+                    round_column_to_tick,
                     MultiTestCaseWriter, TestCasesPlainReader)
 from .entities import TestCase, TestScript
 from .file_formats import (Csv1Reader, Csv1Writer, Csv2Reader, Csv2Writer,
@@ -15,5 +19,6 @@ from .file_formats import (Csv1Reader, Csv1Writer, Csv2Reader, Csv2Writer,
                            set_default_multiheader_config,
                            MHdrCsvReader, MHdrCsvWriter,
                            RawTestCasesWriter, RawTestCasesReader,
-                           FileParsingLogger, GlobPatterns)
+                           BinaryTestCasesWriter, BinaryTestCasesReader,
+                           FileParsingLogger, ParsingDiagnostics, ParsingRecord, GlobPatterns)
 from .db.tests_tracker import TestsTracker
\ No newline at end of file
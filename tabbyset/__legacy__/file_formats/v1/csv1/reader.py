@@ -2,6 +2,7 @@ from typing import Optional, List, Union, TextIO
 from ..abc import AbstractTestCasesReader
 from tabbyset.utils.folder import PathParam
 from tabbyset.file_formats.common.parsing_logger import FileParsingLogger
+from tabbyset.file_formats.common.parsing_diagnostics import ParsingDiagnostics
 from tabbyset.file_formats.exceptions import FileParsingException
 from tabbyset.file_formats.common import zip_columns_with_values
 from tabbyset.entities.test_case import TestCase
@@ -26,7 +27,7 @@ class Csv1Reader(AbstractTestCasesReader):
     def __init__(self, file: Union[PathParam, TextIO],
                  *,
                  tolerant_mode: bool = False,
-                 parsing_logger: Optional[FileParsingLogger] = None):
+                 parsing_logger: Optional[Union[FileParsingLogger, ParsingDiagnostics]] = None):
         AbstractTestCasesReader.__init__(self, file, tolerant_mode=tolerant_mode, parsing_logger=parsing_logger)
 
     def _parse_as_text(self):
@@ -54,7 +55,7 @@ class Csv1Reader(AbstractTestCasesReader):
                 'filepath': self._file_path or 'virtual file',
                 'lineno': line_number,
                 'test_case_index': test_case_index,
-                'original_line': str(orig_row)
+                'original_line': lambda: str(orig_row)
             }
 
         def reset_and_get_test_case():
@@ -1,5 +1,7 @@
-from typing import Sequence, Literal
+from typing import Sequence, Literal, Optional
 from tabbyset.utils.folder import PathParam, Folder
+from tabbyset.utils.fs_utils import read_tests_files
+from tabbyset.utils.tests_cache import TestsFilesCache
 from tabbyset.utils.global_columns import global_columns
 from tabbyset.file_formats.glob_patterns import GlobPatterns
 from tabbyset.entities import TestCase
@@ -47,10 +49,19 @@ class TestsTracker:
         return test_copy
 
     @classmethod
-    def read_file(cls, file_path: PathParam, file_format: FileFormat = 'csv1') -> list[TestCase]:
+    def read_file(cls, file_path: PathParam, file_format: FileFormat = 'csv1',
+                  *,
+                  cache: Optional[TestsFilesCache] = None) -> list[TestCase]:
         """
         Reads tests from a file.
+
+        If `cache` is given, the tests of the unchanged file are loaded from it instead of parsing.
         """
+        if file_format not in ('csv1', 'csv2'):
+            raise ValueError(f"Unsupported file format: {file_format}")
+        if cache is not None:
+            _, test_cases = next(read_tests_files([file_path], file_format, cache=cache))
+            return test_cases
         if file_format == 'csv1':
             with Csv1Reader(file_path) as reader:
                 return list(reader)
@@ -61,24 +72,28 @@ class TestsTracker:
             raise ValueError(f"Unsupported file format: {file_format}")
 
     @classmethod
-    def read_folder(cls, folder_path: PathParam, file_format: FileFormat = 'csv1', deep=False) -> list[TestCase]:
+    def read_folder(cls, folder_path: PathParam, file_format: FileFormat = 'csv1', deep=False,
+                    *,
+                    workers: Optional[int] = None,
+                    cache: Optional[TestsFilesCache] = None) -> list[TestCase]:
         """
         Reads tests from a folder.
+
+        If `workers` is given, the files are parsed in parallel by the given number of processes.
+        Tests are returned in the order of the files either way.
+        If `cache` is given, the tests of the unchanged files are loaded from it instead of parsing.
         """
         folder = Folder(folder_path)
         if file_format == 'csv1':
-            test_cases = []
-            for file in folder.glob(GlobPatterns.csv1_pattern(deep)):
-                with Csv1Reader(file) as reader:
-                    test_cases.extend(reader)
-            return test_cases
-        if file_format == 'csv2':
-            test_cases = []
-            for file in folder.glob(GlobPatterns.csv2_pattern(deep)):
-                with Csv2Reader(file) as reader:
-                    test_cases.extend(reader)
-            return test_cases
-        raise ValueError(f"Unsupported file format: {file_format}")
+            files = folder.glob(GlobPatterns.csv1_pattern(deep))
+        elif file_format == 'csv2':
+            files = folder.glob(GlobPatterns.csv2_pattern(deep))
+        else:
+            raise ValueError(f"Unsupported file format: {file_format}")
+        test_cases = []
+        for _, file_test_cases in read_tests_files(files, file_format, workers=workers, cache=cache):
+            test_cases.extend(file_test_cases)
+        return test_cases
 
     @classmethod
     def write_to_file(cls, file_path: PathParam, test_cases: Sequence[TestCase], file_format: FileFormat = 'csv1') -> None:
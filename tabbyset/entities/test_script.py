@@ -29,13 +29,10 @@ class TestScript:
 
     @property
     def all_columns(self) -> List[str]:
-        columns = []
+        columns: Dict[str, None] = {}
         for tc in self._test_cases_data:
-            current_columns = tc.steps.columns
-            for column in current_columns:
-                if column not in columns:
-                    columns.append(column)
-        return columns
+            columns.update(dict.fromkeys(tc.steps.columns))
+        return list(columns)
 
     def remove_test_case(self, name: str):
         self._test_cases_data.remove(self._test_cases_index[name])
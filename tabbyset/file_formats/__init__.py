@@ -1,8 +1,10 @@
 from .csv1 import *
 from .csv2 import *
 from .exceptions import *
-from .common import MultiheaderConfig, MultiheaderCategorizer, set_default_multiheader_config, FileParsingLogger
+from .common import (MultiheaderConfig, MultiheaderCategorizer, set_default_multiheader_config, FileParsingLogger,
+                     ParsingDiagnostics, ParsingRecord)
 from .tc_jsonl import *
 from .multiheader_csv import *
 from .tcs_jsonl import *
+from .binary import *
 from .glob_patterns import GlobPatterns
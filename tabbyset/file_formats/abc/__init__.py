@@ -1,2 +1,3 @@
 from .abstract_test_cases_reader import AbstractTestCasesReader
+from .indexed_csv_reader import IndexedCsvTestCasesReader, TestCasesIndex, TestCaseIndexEntry
 from .abstract_test_cases_writer import AbstractTestCasesWriter, ITestCasesWriter
@@ -1,11 +1,15 @@
+import csv
 from abc import ABC, abstractmethod
-from collections.abc import Iterator, Iterable
+from collections import deque
+from collections.abc import Iterator, Iterable, Callable
+from itertools import islice
 from typing import Optional, Union, Generator, TextIO
 
 from tabbyset.db.id_utils import get_id_from_steps, is_valid_id
 from .source_io import SourceIO
 from ..exceptions import FileParsingException, VirtualFileParsingException
 from tabbyset.file_formats.common.parsing_logger import FileParsingLogger
+from tabbyset.file_formats.common.parsing_diagnostics import ParsingDiagnostics
 from tabbyset.entities.test_case import TestCase
 from tabbyset.utils.folder import PathParam
 
@@ -19,12 +23,17 @@ class AbstractTestCasesReader(SourceIO, Iterable[TestCase], ABC):
     _iterator: Optional[Iterator[TestCase]] = None
     _is_iterator_done: bool = False
     _tolerant_mode: bool
+    # Last raw lines of the source, kept only for the virtual files and the logging
+    _recent_lines: Optional[deque] = None
+    _RECENT_LINES_LIMIT = 5
+    # Number of the lines after the failed one shown in the exception of the virtual file
+    _FOLLOWING_LINES_LIMIT = 2
 
     def __init__(self,
                  file: Union[PathParam, TextIO],
                  *,
                  tolerant_mode: bool = False,
-                 parsing_logger: Optional[FileParsingLogger] = None):
+                 parsing_logger: Optional[Union[FileParsingLogger, ParsingDiagnostics]] = None):
         SourceIO.__init__(self, file)
         self._tolerant_mode = tolerant_mode
         self._parsing_logger = parsing_logger
@@ -71,14 +80,23 @@ class AbstractTestCasesReader(SourceIO, Iterable[TestCase], ABC):
         """
         try:
             self.restart_reading()
-            for _ in iter(self):
-                pass
+            self._validate_as_text()
             self.restart_reading()
             return True
         except FileParsingException as e:
             self.restart_reading()
             return False
 
+    def _validate_as_text(self) -> None:
+        """
+        Parses the whole file only to find the errors.
+
+        The readers may override it to check the structure without building the test cases.
+        :raises tabbyset.FileParsingException: If the file is not valid.
+        """
+        for _ in self._parse_as_text():
+            pass
+
     def __iter__(self) -> Iterator[TestCase]:
         """
         Iterate over test cases in the file.
@@ -93,14 +111,49 @@ class AbstractTestCasesReader(SourceIO, Iterable[TestCase], ABC):
     def __next__(self) -> TestCase:
         return next(iter(self))
 
+    def _prepare_lines_readable(self) -> Iterator[str]:
+        """
+        Prepares the lines of the source.
+
+        The last lines are recorded for the exceptions of the virtual files and for the parsing logger.
+        """
+        textio = self._prepare_textio_readable()
+        if self._file_path is not None and self._parsing_logger is None:
+            self._recent_lines = None
+            return textio
+        self._recent_lines = deque(maxlen=self._RECENT_LINES_LIMIT)
+        return self._record_lines(textio, self._recent_lines.append)
+
+    def _prepare_csv_reader(self):
+        return csv.reader(self._prepare_lines_readable())
+
+    @staticmethod
+    def _record_lines(lines: Iterable[str], record: Callable[[str], None]) -> Iterator[str]:
+        for line in lines:
+            record(line)
+            yield line
+
+    def _get_recent_text(self, lines_count: int = 1) -> str:
+        """
+        Returns the last raw lines read from the source.
+
+        :param lines_count: The number of the lines, it is limited by the number of the recorded ones.
+        """
+        if not self._recent_lines or lines_count <= 0:
+            return ''
+        if lines_count == 1:
+            return self._recent_lines[-1]
+        return ''.join(list(self._recent_lines)[-lines_count:])
+
     def _create_reader_exception(self, message: str, line_number: int) -> FileParsingException:
         file = self._file_path
         if file:
             return FileParsingException(file_path=file, line_number=line_number, message=message)
-        if self._textio is not None:
-            self._textio.seek(0)
-            file = self._textio.read()
-        return VirtualFileParsingException(file=file, line_number=line_number, message=message)
+        # Only a few lines around the failed one are shown, the source may be too large to be read again
+        context = self._get_recent_text(self._RECENT_LINES_LIMIT)
+        if self._textio is not None and not self._textio.closed:
+            context += ''.join(islice(self._textio, self._FOLLOWING_LINES_LIMIT))
+        return VirtualFileParsingException(file=context, line_number=line_number, message=message)
 
     @staticmethod
     def _postprocess_test_case(test_case: TestCase) -> TestCase:
@@ -1,7 +1,9 @@
+import csv
+import io
 from abc import ABC, abstractmethod
 from collections.abc import Iterable
 from contextlib import AbstractContextManager
-from typing import Union, TextIO
+from typing import Union, TextIO, Optional
 
 from .source_io import SourceIO
 from tabbyset.entities.test_case import TestCase
@@ -40,22 +42,83 @@ class AbstractTestCasesWriter(SourceIO, ITestCasesWriter, ABC):
     """
     An abstract class for writing test scripts to files.
 
+    In the buffered mode the test cases are serialized to the memory and written to the file by large blocks,
+    when the buffer exceeds the given size, on `flush` and on `close`.
+    `write_many` always writes the test cases through the buffer, and flushes it before returning.
+
     :param file: The path of the file or an open file object.
+    :param buffer_size: The size of the buffer in characters. By default, the test cases are written
+                        to the file directly.
     """
+    DEFAULT_BUFFER_SIZE = 1024 * 1024
+
+    _buffer_size: Optional[int] = None
+    _buffer: Optional[io.StringIO] = None
+    # CSV writer bound to the current output (the file or the buffer)
+    _csv_writer = None
+    _csv_writer_output: Optional[TextIO] = None
 
-    def __init__(self, file: Union[PathParam, TextIO]):
+    def __init__(self, file: Union[PathParam, TextIO], *, buffer_size: Optional[int] = None):
         SourceIO.__init__(self, file)
+        if buffer_size is not None:
+            self._start_buffering(buffer_size)
 
     def write(self, test_case: TestCase):
         test_case_to_write = test_case
         if not is_valid_id(test_case.id):
-            test_case_to_write = test_case.copy()
-            test_case_to_write.id = new_id()
+            # The new id is set to a test case sharing the steps, so the given one is neither changed nor copied
+            test_case_to_write = TestCase(name=test_case.name,
+                                          steps=test_case.steps,
+                                          description=test_case.description,
+                                          id=new_id())
         self._write_test_case(test_case_to_write)
+        if self._buffer is not None and self._buffer.tell() >= self._buffer_size:
+            self.flush()
 
     def write_many(self, test_cases: Iterable[TestCase]):
-        for test_case in test_cases:
-            self.write(test_case)
+        if self._buffer is not None:
+            for test_case in test_cases:
+                self.write(test_case)
+            return
+        self._start_buffering(self.DEFAULT_BUFFER_SIZE)
+        try:
+            for test_case in test_cases:
+                self.write(test_case)
+        finally:
+            self.flush()
+            self._buffer = None
+
+    def flush(self):
+        """
+        Writes the buffered test cases to the file.
+        """
+        if self._buffer is None or not self._buffer.tell():
+            return
+        SourceIO._prepare_textio_writable(self).write(self._buffer.getvalue())
+        self._buffer.seek(0)
+        self._buffer.truncate()
+
+    def close(self):
+        self.flush()
+        SourceIO.close(self)
+
+    def _start_buffering(self, buffer_size: int):
+        if buffer_size <= 0:
+            raise ValueError(f"Buffer size should be positive, got {buffer_size}")
+        self._buffer_size = buffer_size
+        self._buffer = io.StringIO(newline='')
+
+    def _prepare_textio_writable(self):
+        if self._buffer is not None:
+            return self._buffer
+        return SourceIO._prepare_textio_writable(self)
+
+    def _prepare_csv_writer(self):
+        output = self._prepare_textio_writable()
+        if self._csv_writer_output is not output:
+            self._csv_writer = csv.writer(output)
+            self._csv_writer_output = output
+        return self._csv_writer
 
     @abstractmethod
     def _write_test_case(self, test_case: TestCase):
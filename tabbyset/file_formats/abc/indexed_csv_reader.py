@@ -0,0 +1,362 @@
+import csv
+import hashlib
+import io
+import json
+import os
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from pathlib import Path
+from typing import Optional, NamedTuple, BinaryIO
+
+from tabbyset.entities.test_case import TestCase
+from tabbyset.file_formats.constants import TEST_CASE_START_LABEL
+from tabbyset.utils.folder import Folder, PathParam
+from .abstract_test_cases_reader import AbstractTestCasesReader
+from ..exceptions import FileParsingException
+
+INDEX_FILE_SUFFIX = '.tbsidx'
+_INDEX_FORMAT_VERSION = 1
+
+
+class TestCaseIndexEntry(NamedTuple):
+    """
+    Position of a test case in the file.
+    """
+    offset: int
+    """Byte offset of the row with the start label."""
+    line_number: int
+    """Number of the line with the start label, starting from 1."""
+    name: str
+    id: str
+
+
+class TestCasesIndex:
+    """
+    Positions of the test cases in a file, which allow reading any of them without parsing the previous ones.
+
+    The index is valid while the size and the modification time of the file are the same as on its building.
+
+    :param entries: The positions of the test cases in the order of the file.
+    :param prefix_end: The byte offset of the first test case, the file part before it (e.g. CSV2 header)
+                       is read before any test case.
+    :param file_size: The size of the indexed file.
+    :param file_mtime_ns: The modification time of the indexed file.
+    """
+    entries: list[TestCaseIndexEntry]
+    prefix_end: int
+    file_size: int
+    file_mtime_ns: int
+    _positions_by_name: Optional[dict[str, int]] = None
+    _positions_by_id: Optional[dict[str, int]] = None
+
+    def __init__(self, entries: Iterable[TestCaseIndexEntry], prefix_end: int, file_size: int, file_mtime_ns: int):
+        self.entries = list(entries)
+        self.prefix_end = prefix_end
+        self.file_size = file_size
+        self.file_mtime_ns = file_mtime_ns
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def __getitem__(self, index: int) -> TestCaseIndexEntry:
+        return self.entries[index]
+
+    def find_by_name(self, name: str) -> Optional[TestCaseIndexEntry]:
+        """
+        :return: The entry of the first test case with the given name, or None if there is no such test case.
+        """
+        if self._positions_by_name is None:
+            self._positions_by_name = self._first_positions(entry.name for entry in self.entries)
+        position = self._positions_by_name.get(name)
+        return None if position is None else self.entries[position]
+
+    def find_by_id(self, test_case_id: str) -> Optional[TestCaseIndexEntry]:
+        """
+        :return: The entry of the first test case with the given id, or None if there is no such test case.
+        """
+        if self._positions_by_id is None:
+            self._positions_by_id = self._first_positions(entry.id for entry in self.entries)
+        position = self._positions_by_id.get(test_case_id)
+        return None if position is None else self.entries[position]
+
+    def is_up_to_date(self, file_path: os.PathLike) -> bool:
+        """
+        :return: True if the file was not changed since the index building.
+        """
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            return False
+        return stat.st_size == self.file_size and stat.st_mtime_ns == self.file_mtime_ns
+
+    def save(self, index_path: os.PathLike) -> None:
+        """
+        Saves the index to the given file.
+        """
+        content = {
+            'format_version': _INDEX_FORMAT_VERSION,
+            'file_size': self.file_size,
+            'file_mtime_ns': self.file_mtime_ns,
+            'prefix_end': self.prefix_end,
+            'test_cases': [list(entry) for entry in self.entries],
+        }
+        with open(index_path, 'w', encoding='utf-8') as file:
+            json.dump(content, file)
+
+    @classmethod
+    def load(cls, index_path: os.PathLike) -> Optional['TestCasesIndex']:
+        """
+        :return: The index saved to the given file, or None if the file doesn't exist or has an unknown format.
+        """
+        try:
+            with open(index_path, 'r', encoding='utf-8') as file:
+                content = json.load(file)
+            if content.get('format_version') != _INDEX_FORMAT_VERSION:
+                return None
+            return cls(entries=(TestCaseIndexEntry(*entry) for entry in content['test_cases']),
+                       prefix_end=content['prefix_end'],
+                       file_size=content['file_size'],
+                       file_mtime_ns=content['file_mtime_ns'])
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    @staticmethod
+    def _first_positions(keys: Iterable[str]) -> dict[str, int]:
+        positions = {}
+        for position, key in enumerate(keys):
+            positions.setdefault(key, position)
+        return positions
+
+
+class _CsvRecordsWithOffsets(Iterator[list[str]]):
+    """
+    CSV rows of the binary file, which remember the positions of the rows with the start label.
+
+    :param file: The file opened in binary mode.
+    :param record_line: The function called with each decoded line, e.g. to keep the recent lines for the logging.
+    """
+
+    def __init__(self, file: BinaryIO, record_line: Optional[Callable[[str], None]] = None):
+        self._file = file
+        self._offset = file.tell()
+        self._line_number = 0
+        self._record_line = record_line
+        self._reader = csv.reader(self._decode_lines())
+        self.first_start: Optional[tuple[int, int]] = None
+        self.last_start: Optional[tuple[int, int]] = None
+        self.previous_start: Optional[tuple[int, int]] = None
+        self.is_last_row_start = False
+
+    def _decode_lines(self) -> Iterator[str]:
+        for line in self._file:
+            self._offset += len(line)
+            self._line_number += 1
+            decoded_line = line.decode('utf-8')
+            if self._record_line is not None:
+                self._record_line(decoded_line)
+            yield decoded_line
+
+    def __next__(self) -> list[str]:
+        position = (self._offset, self._line_number + 1)
+        row = next(self._reader)
+        self.is_last_row_start = bool(row) and row[0] == TEST_CASE_START_LABEL
+        if self.is_last_row_start:
+            self.previous_start, self.last_start = self.last_start, position
+            if self.first_start is None:
+                self.first_start = position
+        return row
+
+    @property
+    def line_num(self) -> int:
+        """
+        :return: The number of the lines read from the file, as `line_num` of `csv.reader`.
+        """
+        return self._reader.line_num
+
+    @property
+    def current_test_case_start(self) -> tuple[int, int]:
+        """
+        :return: The offset and the line number of the start label of the last parsed test case.
+        """
+        # Test case may be yielded on the start label of the next one (e.g. in the tolerant mode)
+        if self.is_last_row_start:
+            return self.previous_start
+        return self.last_start
+
+
+class IndexedCsvTestCasesReader(AbstractTestCasesReader):
+    """
+    An abstract class for reading test scripts from CSV files with random access to the test cases.
+
+    On the first access by position, name or id the reader builds the index of the test cases positions.
+    By default the index is kept only by the reader instance. If the index folder is set
+    by `set_index_folder`, the index is saved there, so the following reader instances reuse it
+    until the file is changed.
+    Random access is available only for the files given by path.
+    """
+    _index_folder: Optional[Folder] = None
+    _index: Optional[TestCasesIndex] = None
+    # Shift of the line numbers of the test case read by `_read_at`: (lines of the prefix, shift of the next lines)
+    _lines_shift: Optional[tuple[int, int]] = None
+    # Rows to parse instead of the file, used for the index building and random access
+    _rows_source: Optional[Iterator[list[str]]] = None
+
+    @classmethod
+    def set_index_folder(cls, folder: Optional[PathParam]) -> None:
+        """
+        Sets the folder to save the indexes of the test cases positions in for all the readers.
+
+        :param folder: The folder for the indexes, or None to keep the indexes only in the reader instances.
+        """
+        IndexedCsvTestCasesReader._index_folder = None if folder is None else Folder(folder)
+
+    @property
+    def index_file_path(self) -> Optional[Path]:
+        """
+        :return: The path of the file, where the index of the test cases positions is stored,
+                 or None if the index folder is not set.
+        """
+        if self._file_path is None:
+            raise ValueError('Random access is supported only for the files given by path')
+        if self._index_folder is None:
+            return None
+        key = hashlib.sha256(os.path.abspath(self._file_path).encode('utf-8')).hexdigest()
+        return self._index_folder.get_file_path(key + INDEX_FILE_SUFFIX)
+
+    def build_index(self, *, save: bool = True) -> TestCasesIndex:
+        """
+        Reads the whole file and records the positions of the test cases.
+
+        :param save: If True, the index is saved to the index folder, if it is set.
+        :return: The index of the test cases positions.
+        :raises tabbyset.FileParsingException: If the file is not valid.
+        """
+        index_file_path = self.index_file_path
+        stat = os.stat(self._file_path)
+        entries = []
+        prefix_end = 0
+        for entry, _ in self._read_with_positions():
+            if not entries:
+                prefix_end = entry.offset
+            entries.append(entry)
+        self._index = TestCasesIndex(entries, prefix_end, stat.st_size, stat.st_mtime_ns)
+        if save and index_file_path is not None:
+            try:
+                self._index.save(index_file_path)
+            except OSError:
+                # Index is still usable by this reader
+                pass
+        return self._index
+
+    def iter_with_positions(self) -> Iterator[tuple[TestCaseIndexEntry, TestCase]]:
+        """
+        Reads the whole file from the beginning.
+
+        :return: An iterator of the test cases with their positions in the file.
+        :raises tabbyset.FileParsingException: If the file is not valid.
+        """
+        if self._file_path is None:
+            raise ValueError('Positions of the test cases are supported only for the files given by path')
+        return self._read_with_positions()
+
+    def _read_with_positions(self) -> Iterator[tuple[TestCaseIndexEntry, TestCase]]:
+        with open(self._file_path, 'rb') as file:
+            records = _CsvRecordsWithOffsets(file, self._prepare_recent_lines())
+            self._rows_source = records
+            try:
+                for test_case in self._parse_as_text():
+                    offset, line_number = records.current_test_case_start
+                    yield TestCaseIndexEntry(offset, line_number, test_case.name, test_case.id), test_case
+            finally:
+                self._rows_source = None
+
+    def get_index(self) -> TestCasesIndex:
+        """
+        :return: The index of the test cases positions. It is loaded from the saved file or built, if it is outdated.
+        """
+        if self._index is not None and self._index.is_up_to_date(self._file_path):
+            return self._index
+        index_file_path = self.index_file_path
+        if index_file_path is not None:
+            index = TestCasesIndex.load(index_file_path)
+            if index is not None and index.is_up_to_date(self._file_path):
+                self._index = index
+                return index
+        return self.build_index()
+
+    def get_by_name(self, name: str) -> Optional[TestCase]:
+        """
+        :return: The first test case with the given name, or None if there is no such test case.
+        """
+        entry = self.get_index().find_by_name(name)
+        return None if entry is None else self._read_at(entry)
+
+    def get_by_id(self, test_case_id: str) -> Optional[TestCase]:
+        """
+        :return: The first test case with the given id, or None if there is no such test case.
+        """
+        entry = self.get_index().find_by_id(test_case_id)
+        return None if entry is None else self._read_at(entry)
+
+    def __getitem__(self, index: int) -> TestCase:
+        """
+        :return: The test case at the given position in the file.
+        """
+        if not isinstance(index, int):
+            raise TypeError(f"Invalid index type: {type(index)}")
+        return self._read_at(self.get_index()[index])
+
+    def _read_at(self, entry: TestCaseIndexEntry) -> TestCase:
+        prefix_end = self._index.prefix_end
+        # The prefix ends right before the first test case
+        prefix_lines = self._index[0].line_number - 1
+        self._lines_shift = (prefix_lines, entry.line_number - 1 - prefix_lines)
+        with open(self._file_path, 'rb') as file:
+            prefix = io.BytesIO(file.read(prefix_end))
+            file.seek(entry.offset)
+            lines = self._join_lines(prefix, file)
+            record_line = self._prepare_recent_lines()
+            if record_line is not None:
+                lines = self._record_lines(lines, record_line)
+            self._rows_source = csv.reader(lines)
+            parser = self._parse_as_text()
+            try:
+                return next(parser)
+            finally:
+                parser.close()
+                self._rows_source = None
+                self._lines_shift = None
+
+    @staticmethod
+    def _join_lines(prefix: BinaryIO, file: BinaryIO) -> Iterator[str]:
+        for lines in (prefix, file):
+            for line in lines:
+                yield line.decode('utf-8')
+
+    def _get_file_line_number(self, line_number: int) -> int:
+        """
+        :param line_number: The line number counted by the parser.
+        :return: The line number in the file. They differ for the test case read by position,
+                 as the parser doesn't see the lines between the prefix and the test case.
+        """
+        if self._lines_shift is None:
+            return line_number
+        prefix_lines, shift = self._lines_shift
+        return line_number if line_number <= prefix_lines else line_number + shift
+
+    def _create_reader_exception(self, message: str, line_number: int) -> FileParsingException:
+        return super()._create_reader_exception(message, self._get_file_line_number(line_number))
+
+    def _prepare_recent_lines(self) -> Optional[Callable[[str], None]]:
+        """
+        :return: The function recording the recent lines for the parsing logger, or None if there is no logger.
+        """
+        if self._parsing_logger is None:
+            return None
+        self._recent_lines = deque(maxlen=self._RECENT_LINES_LIMIT)
+        return self._recent_lines.append
+
+    def _prepare_csv_reader(self):
+        if self._rows_source is not None:
+            return self._rows_source
+        return super()._prepare_csv_reader()
@@ -0,0 +1,2 @@
+from .writer import BinaryTestCasesWriter
+from .reader import BinaryTestCasesReader
\ No newline at end of file
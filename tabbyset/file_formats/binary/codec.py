@@ -0,0 +1,200 @@
+"""
+Encoding of the test cases to the blocks of the binary format.
+
+Layout of the file (all numbers are unsigned and little-endian):
+
+- magic `TBS\\x01`;
+- a block per test case: tag `C`, payload size (uint64), payload;
+- the index block: tag `X`, payload size (uint64), payload;
+- footer: offset of the index block (uint64), magic `TBSX`.
+
+Payload of a test case:
+
+- flags (uint8), numbers of the rows, columns, distinct values and cells, size of the strings in bytes
+  (uint32 each);
+- lengths of the strings in characters (uint32 each);
+- the strings in UTF-8: name, id, description, columns, distinct values;
+- numbers of the cells in the rows, only the cells present in the rows are stored;
+- numbers of the columns of the cells;
+- numbers of the values of the cells.
+
+The numbers of the cells, columns and values are uint8, uint16 or uint32, the smallest one fitting all of them.
+
+Payload of the index: number of the test cases (uint32), offsets of the blocks (uint64 each),
+size of the strings in bytes (uint32), lengths of the strings, the names and then the ids.
+"""
+import struct
+import sys
+from array import array
+from itertools import accumulate, islice
+from typing import Optional
+
+from tabbyset.entities.test_case import TestCase
+from tabbyset.utils.flex_table import FlexTable
+
+MAGIC = b'TBS\x01'
+FOOTER_MAGIC = b'TBSX'
+TEST_CASE_TAG = b'C'
+INDEX_TAG = b'X'
+
+BLOCK_HEADER = struct.Struct('<cQ')
+FOOTER = struct.Struct('<Q4s')
+_TEST_CASE_HEADER = struct.Struct('<BIIIII')
+_INDEX_HEADER = struct.Struct('<I')
+_STRINGS_SIZE = struct.Struct('<I')
+
+_NO_ID = 1
+_NO_DESCRIPTION = 2
+
+_UINT32 = next(typecode for typecode in 'ILH' if array(typecode).itemsize == 4)
+_UINT64 = next(typecode for typecode in 'LQ' if array(typecode).itemsize == 8)
+_IS_BIG_ENDIAN = sys.byteorder == 'big'
+
+
+class BinaryFormatError(ValueError):
+    """
+    The block of the binary file is corrupted.
+    """
+
+
+def encode_test_case(test_case: TestCase) -> bytes:
+    steps = test_case.steps
+    columns = list(steps.columns)
+    column_codes = {column: code for code, column in enumerate(columns)}
+    cells_columns = [column for row in steps for column in row]
+    cells_values = [value for row in steps for value in row.values()]
+    value_codes = {value: code for code, value in enumerate(dict.fromkeys(cells_values))}
+    row_lengths = array(_codes_typecode(len(columns) + 1), map(len, steps))
+
+    flags = 0
+    if test_case.id is None:
+        flags |= _NO_ID
+    if test_case.description is None:
+        flags |= _NO_DESCRIPTION
+    strings = [test_case.name or '', test_case.id or '', test_case.description or '']
+    strings.extend(map(_to_str, columns))
+    strings.extend(map(_to_str, value_codes))
+    lengths, strings_data = _encode_strings(strings)
+    header = _TEST_CASE_HEADER.pack(flags, len(row_lengths), len(columns), len(value_codes), len(cells_values),
+                                    len(strings_data))
+    return b''.join((header, lengths, strings_data,
+                     _array_to_bytes(row_lengths),
+                     _array_to_bytes(array(_codes_typecode(len(columns)),
+                                           map(column_codes.__getitem__, cells_columns))),
+                     _array_to_bytes(array(_codes_typecode(len(value_codes)),
+                                           map(value_codes.__getitem__, cells_values)))))
+
+
+def decode_test_case(payload: bytes) -> TestCase:
+    try:
+        (flags, rows_count, columns_count, values_count, cells_count,
+         strings_size) = _TEST_CASE_HEADER.unpack_from(payload)
+        offset = _TEST_CASE_HEADER.size
+        text, bounds, offset = _decode_strings_bounds(payload, offset, 3 + columns_count + values_count, strings_size)
+        strings = list(map(text.__getitem__, bounds[:3 + columns_count]))
+        row_lengths, offset = _read_array(payload, offset, _codes_typecode(columns_count + 1), rows_count)
+        cells_columns, offset = _read_array(payload, offset, _codes_typecode(columns_count), cells_count)
+        cells_values, offset = _read_array(payload, offset, _codes_typecode(values_count), cells_count)
+        if offset != len(payload) or sum(row_lengths) != cells_count:
+            raise ValueError('unexpected size of the cells')
+        columns = strings[3:3 + columns_count]
+        # Each cell gets its own string object as with the text formats, the hash of the steps depends on it
+        values_bounds = bounds[3 + columns_count:]
+        cells = zip(map(columns.__getitem__, cells_columns),
+                    map(text.__getitem__, map(values_bounds.__getitem__, cells_values)))
+        rows = [dict(islice(cells, row_length)) for row_length in row_lengths]
+    except (struct.error, UnicodeDecodeError, ValueError, IndexError) as e:
+        raise BinaryFormatError(f'Corrupted test case block: {e}') from None
+
+    name, test_case_id, description = strings[:3]
+    return TestCase(name=name,
+                    steps=FlexTable(rows),
+                    description=None if flags & _NO_DESCRIPTION else description,
+                    id=None if flags & _NO_ID else test_case_id)
+
+
+def encode_index(offsets: list[int], names: list[str], ids: list[Optional[str]]) -> bytes:
+    lengths, strings_data = _encode_strings([*names, *(test_case_id or '' for test_case_id in ids)])
+    return b''.join((_INDEX_HEADER.pack(len(offsets)),
+                     _array_to_bytes(array(_UINT64, offsets)),
+                     _STRINGS_SIZE.pack(len(strings_data)),
+                     lengths,
+                     strings_data))
+
+
+def decode_index(payload: bytes) -> tuple[list[int], list[str], list[str]]:
+    try:
+        count, = _INDEX_HEADER.unpack_from(payload)
+        offset = _INDEX_HEADER.size
+        offsets_end = offset + 8 * count
+        offsets = _array_from_bytes(_UINT64, payload[offset:offsets_end]).tolist()
+        strings_size, = _STRINGS_SIZE.unpack_from(payload, offsets_end)
+        strings, _ = _decode_strings(payload, offsets_end + _STRINGS_SIZE.size, 2 * count, strings_size)
+    except (struct.error, UnicodeDecodeError, ValueError) as e:
+        raise BinaryFormatError(f'Corrupted index block: {e}') from None
+    if len(offsets) != count:
+        raise BinaryFormatError('Corrupted index block: unexpected number of the offsets')
+    return offsets, strings[:count], strings[count:]
+
+
+def _to_str(value) -> str:
+    if type(value) is str:
+        return value
+    return '' if value is None else str(value)
+
+
+def _codes_typecode(codes_count: int) -> str:
+    if codes_count <= 0x100:
+        return 'B'
+    if codes_count <= 0x10000:
+        return 'H'
+    return _UINT32
+
+
+def _read_array(payload: bytes, offset: int, typecode: str, count: int) -> tuple[array, int]:
+    end = offset + array(typecode).itemsize * count
+    values = _array_from_bytes(typecode, payload[offset:end])
+    if len(values) != count:
+        raise ValueError('unexpected end of the block')
+    return values, end
+
+
+def _encode_strings(strings: list[str]) -> tuple[bytes, bytes]:
+    lengths = array(_UINT32, map(len, strings))
+    return _array_to_bytes(lengths), ''.join(strings).encode('utf-8')
+
+
+def _decode_strings(payload: bytes, offset: int, count: int, size: int) -> tuple[list[str], int]:
+    text, bounds, strings_end = _decode_strings_bounds(payload, offset, count, size)
+    return list(map(text.__getitem__, bounds)), strings_end
+
+
+def _decode_strings_bounds(payload: bytes, offset: int, count: int, size: int) -> tuple[str, list[slice], int]:
+    """
+    :return: The decoded text of the strings, the slices of the strings in it and the end of the strings.
+    """
+    lengths_end = offset + 4 * count
+    lengths = _array_from_bytes(_UINT32, payload[offset:lengths_end])
+    strings_end = lengths_end + size
+    text = payload[lengths_end:strings_end].decode('utf-8')
+    if len(lengths) != count or sum(lengths) != len(text):
+        raise ValueError('unexpected lengths of the strings')
+    ends = list(accumulate(lengths))
+    starts = [0]
+    starts.extend(ends[:-1])
+    return text, list(map(slice, starts, ends)), strings_end
+
+
+def _array_to_bytes(values: array) -> bytes:
+    if _IS_BIG_ENDIAN and values.itemsize > 1:
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values.tobytes()
+
+
+def _array_from_bytes(typecode: str, data: bytes) -> array:
+    values = array(typecode)
+    values.frombytes(data)
+    if _IS_BIG_ENDIAN and values.itemsize > 1:
+        values.byteswap()
+    return values
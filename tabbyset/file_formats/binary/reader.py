@@ -0,0 +1,177 @@
+import io
+import os
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Union, BinaryIO, Optional
+
+from . import codec
+from ..abc import AbstractTestCasesReader, TestCasesIndex, TestCaseIndexEntry
+from tabbyset.entities.test_case import TestCase
+from tabbyset.utils.folder import PathParam
+
+
+class BinaryTestCasesReader(AbstractTestCasesReader):
+    """
+    A reader for the test scripts in the binary format (.tbs).
+
+    The test cases are stored as the blocks of the dictionary-encoded cells. The file ends with the index
+    of the test cases, which gives the random access to them without reading the other ones, so a single test case
+    is loaded much faster than from CSV1 or CSV2 (`get_by_name`, `get_by_id`, `reader[number]`).
+
+    Reading the whole file is not faster: it takes about the same time as reading CSV1, as most of the time
+    goes to building the rows of the steps. Each cell gets its own string object, as with the text formats,
+    because the hash of the steps depends on it.
+
+    BinaryTestCasesReader is iterable. All Python iteration methods are supported.
+    In order  to iterate over all test cases, you also can use `for` loop:
+
+    >>> reader = BinaryTestCasesReader('path/to/file.tbs')
+    ... for test_case in reader:
+    ...     print(test_case)
+
+    The line numbers of the exceptions and index entries are the numbers of the test cases, starting from 1.
+
+    :param file: The path of the file or a file object opened in binary mode.
+    """
+    _binaryio: Optional[BinaryIO] = None
+    _binary_starting_position: int = 0
+    _index: Optional[TestCasesIndex] = None
+
+    def __init__(self, file: Union[PathParam, BinaryIO]):
+        if isinstance(file, io.TextIOBase):
+            raise ValueError(f"Binary file is expected, got a text one: {file}")
+        if isinstance(file, io.IOBase):
+            self._binaryio = file
+            self._binary_starting_position = file.tell()
+            self._tolerant_mode = False
+            self._parsing_logger = None
+        else:
+            AbstractTestCasesReader.__init__(self, file)
+
+    def _parse_as_text(self) -> Iterator[TestCase]:
+        for _, test_case in self._read_with_positions():
+            yield test_case
+
+    def iter_with_positions(self) -> Iterator[tuple[TestCaseIndexEntry, TestCase]]:
+        """
+        Reads the whole file from the beginning.
+
+        :return: An iterator of the test cases with their positions in the file.
+        :raises tabbyset.FileParsingException: If the file is not valid.
+        """
+        return self._read_with_positions()
+
+    def get_index(self) -> TestCasesIndex:
+        """
+        :return: The index of the test cases positions, read from the end of the file.
+        :raises tabbyset.FileParsingException: If the file is not valid.
+        """
+        if self._index is not None:
+            return self._index
+        with self._random_access_file() as file:
+            file_end = file.seek(0, os.SEEK_END)
+            if file_end - self._binary_starting_position < len(codec.MAGIC) + codec.FOOTER.size:
+                raise self._create_reader_exception('Index of the test cases not found', 0)
+            file.seek(file_end - codec.FOOTER.size)
+            index_offset, footer_magic = codec.FOOTER.unpack(self._read_exactly(file, codec.FOOTER.size, 0))
+            if footer_magic != codec.FOOTER_MAGIC:
+                raise self._create_reader_exception('Index of the test cases not found', 0)
+            file.seek(self._binary_starting_position + index_offset)
+            payload = self._read_block(file, codec.INDEX_TAG, 0)
+        try:
+            offsets, names, ids = codec.decode_index(payload)
+        except codec.BinaryFormatError as e:
+            raise self._create_reader_exception(str(e), 0) from None
+        entries = [TestCaseIndexEntry(offset, number, name, test_case_id or None)
+                   for number, (offset, name, test_case_id) in enumerate(zip(offsets, names, ids), start=1)]
+        file_mtime_ns = os.stat(self._file_path).st_mtime_ns if self._file_path is not None else 0
+        self._index = TestCasesIndex(entries, len(codec.MAGIC), file_end - self._binary_starting_position,
+                                     file_mtime_ns)
+        return self._index
+
+    def get_by_name(self, name: str) -> Optional[TestCase]:
+        """
+        :return: The first test case with the given name, or None if there is no such test case.
+        """
+        entry = self.get_index().find_by_name(name)
+        return None if entry is None else self._read_at(entry)
+
+    def get_by_id(self, test_case_id: str) -> Optional[TestCase]:
+        """
+        :return: The first test case with the given id, or None if there is no such test case.
+        """
+        entry = self.get_index().find_by_id(test_case_id)
+        return None if entry is None else self._read_at(entry)
+
+    def __getitem__(self, index: int) -> TestCase:
+        """
+        :return: The test case at the given position in the file.
+        """
+        if not isinstance(index, int):
+            raise TypeError(f"Invalid index type: {type(index)}")
+        return self._read_at(self.get_index()[index])
+
+    def close(self):
+        if self._binaryio is not None:
+            self._binaryio.close()
+        AbstractTestCasesReader.close(self)
+
+    def _read_with_positions(self) -> Iterator[tuple[TestCaseIndexEntry, TestCase]]:
+        file = self._prepare_binary_readable()
+        if self._read_exactly(file, len(codec.MAGIC), 0) != codec.MAGIC:
+            raise self._create_reader_exception('Not a binary test cases file', 0)
+        number = 0
+        while True:
+            number += 1
+            offset = file.tell() - self._binary_starting_position
+            tag, size = codec.BLOCK_HEADER.unpack(self._read_exactly(file, codec.BLOCK_HEADER.size, number))
+            if tag == codec.INDEX_TAG:
+                return
+            if tag != codec.TEST_CASE_TAG:
+                raise self._create_reader_exception(f'Unknown block {tag!r}', number)
+            test_case = self._decode_test_case(self._read_exactly(file, size, number), number)
+            yield TestCaseIndexEntry(offset, number, test_case.name, test_case.id), test_case
+
+    def _read_at(self, entry: TestCaseIndexEntry) -> TestCase:
+        with self._random_access_file() as file:
+            file.seek(self._binary_starting_position + entry.offset)
+            payload = self._read_block(file, codec.TEST_CASE_TAG, entry.line_number)
+        return self._decode_test_case(payload, entry.line_number)
+
+    def _decode_test_case(self, payload: bytes, number: int) -> TestCase:
+        try:
+            test_case = codec.decode_test_case(payload)
+        except codec.BinaryFormatError as e:
+            raise self._create_reader_exception(str(e), number) from None
+        return self._postprocess_test_case(test_case)
+
+    def _read_block(self, file: BinaryIO, expected_tag: bytes, number: int) -> bytes:
+        tag, size = codec.BLOCK_HEADER.unpack(self._read_exactly(file, codec.BLOCK_HEADER.size, number))
+        if tag != expected_tag:
+            raise self._create_reader_exception(f'Unexpected block {tag!r}', number)
+        return self._read_exactly(file, size, number)
+
+    def _read_exactly(self, file: BinaryIO, size: int, number: int) -> bytes:
+        data = file.read(size)
+        if len(data) != size:
+            raise self._create_reader_exception('Unexpected end of file', number)
+        return data
+
+    def _prepare_binary_readable(self) -> BinaryIO:
+        if self._binaryio is None:
+            self._binaryio = open(self._file_path, 'rb')
+        self._binaryio.seek(self._binary_starting_position)
+        return self._binaryio
+
+    @contextmanager
+    def _random_access_file(self) -> Iterator[BinaryIO]:
+        # The file of the iteration is not moved, so the random access doesn't break it
+        if self._file_path is not None:
+            with open(self._file_path, 'rb') as file:
+                yield file
+            return
+        position = self._binaryio.tell()
+        try:
+            yield self._binaryio
+        finally:
+            self._binaryio.seek(position)
@@ -0,0 +1,83 @@
+import io
+from collections.abc import Iterable
+from typing import Union, BinaryIO, Optional
+
+from . import codec
+from ..abc import AbstractTestCasesWriter
+from tabbyset.entities.test_case import TestCase
+from tabbyset.utils.folder import PathParam
+
+
+class BinaryTestCasesWriter(AbstractTestCasesWriter):
+    """
+    A writer for the test scripts in the binary format (.tbs).
+
+    Each test case is written as a block with its name, id, description, columns and distinct values,
+    and the cells refer to the values by numbers. The index of the test cases is written on `close`,
+    so the file is complete only after the writer is closed.
+
+    :param file: The path of the file or a file object opened in binary mode.
+    :param buffer_size: The size of the buffer in bytes of the file opened by the writer.
+                        By default, the default buffering of the system is used.
+    """
+    _binaryio: Optional[BinaryIO] = None
+    _position: int = 0
+    _closed: bool = False
+    _offsets: Optional[list[int]] = None
+
+    def __init__(self, file: Union[PathParam, BinaryIO], *, buffer_size: Optional[int] = None):
+        if isinstance(file, io.TextIOBase):
+            raise ValueError(f"Binary file is expected, got a text one: {file}")
+        if buffer_size is not None and buffer_size <= 0:
+            raise ValueError(f"Buffer size should be positive, got {buffer_size}")
+        if isinstance(file, io.IOBase):
+            self._binaryio = file
+        else:
+            # The blocks are written as they are, so the buffer of the writer is the one of the file
+            AbstractTestCasesWriter.__init__(self, file)
+        self._file_buffer_size = buffer_size
+        self._offsets = []
+        self._names: list[str] = []
+        self._ids: list[Optional[str]] = []
+
+    def write_many(self, test_cases: Iterable[TestCase]):
+        for test_case in test_cases:
+            self.write(test_case)
+
+    def flush(self):
+        if self._binaryio is not None:
+            self._binaryio.flush()
+
+    def close(self):
+        # The writer may be not initialized, when it is deleted after a failed construction
+        if self._closed or self._offsets is None:
+            return
+        self._closed = True
+        if self._binaryio is not None and self._binaryio.closed:
+            return
+        output = self._prepare_binary_writable()
+        index_offset = self._position
+        self._write_block(output, codec.INDEX_TAG, codec.encode_index(self._offsets, self._names, self._ids))
+        output.write(codec.FOOTER.pack(index_offset, codec.FOOTER_MAGIC))
+        output.close()
+
+    def _write_test_case(self, test_case: TestCase):
+        output = self._prepare_binary_writable()
+        self._offsets.append(self._position)
+        self._names.append(test_case.name)
+        self._ids.append(test_case.id)
+        self._write_block(output, codec.TEST_CASE_TAG, codec.encode_test_case(test_case))
+
+    def _write_block(self, output: BinaryIO, tag: bytes, payload: bytes):
+        output.write(codec.BLOCK_HEADER.pack(tag, len(payload)))
+        output.write(payload)
+        self._position += codec.BLOCK_HEADER.size + len(payload)
+
+    def _prepare_binary_writable(self) -> BinaryIO:
+        if self._binaryio is None:
+            buffering = -1 if self._file_buffer_size is None else self._file_buffer_size
+            self._binaryio = open(self._file_path, 'wb', buffering=buffering)
+        if not self._position:
+            self._binaryio.write(codec.MAGIC)
+            self._position = len(codec.MAGIC)
+        return self._binaryio
@@ -1,4 +1,5 @@
 from .reader import *
 from .multiheader_csv import MultiheaderConfig, Categorizer as MultiheaderCategorizer, set_default_multiheader_config
 from .parsing_logger import FileParsingLogger
+from .parsing_diagnostics import ParsingDiagnostics, ParsingRecord
 
@@ -0,0 +1,145 @@
+import csv
+import json
+import logging
+from collections import Counter
+from typing import Callable, Literal, NamedTuple, Optional, Union
+
+from tabbyset.utils.folder import PathParam
+
+DiagnosticsFormat = Literal['csv', 'jsonl']
+OriginalLine = Union[str, Callable[[], str], None]
+
+
+class ParsingRecord(NamedTuple):
+    """
+    A remark of the parser about a line of the file.
+    """
+    level: int
+    filepath: str
+    lineno: int
+    test_case_index: int
+    summary: str
+    original_line: Optional[str]
+
+    @property
+    def level_name(self) -> str:
+        return logging.getLevelName(self.level)
+
+
+class ParsingDiagnostics:
+    """
+    A collector of the parsing remarks, a lightweight replacement of `FileParsingLogger`.
+
+    The records are buffered and written to the file in bulk. The original line is rendered
+    only for the records passing the level. Counts of the records by file and summary are kept in memory.
+
+    >>> with ParsingDiagnostics('report.csv', level=logging.WARNING) as diagnostics:
+    ...     for file in files:
+    ...         with Csv1Reader(file, tolerant_mode=True, parsing_logger=diagnostics) as reader:
+    ...             reader.check_validity()
+    ... print(diagnostics.counts.most_common(10))
+
+    :param output_file: The path of the report file. If not given, the records are kept in `records`.
+    :param output_format: The format of the report file, 'csv' or 'jsonl'.
+    :param level: Minimum level of the collected records. Default: `logging.INFO`.
+    :param buffer_size: The number of the records written to the file at once.
+    """
+    records: list[ParsingRecord]
+    """The records not written to the file yet, or all the records if there is no output file."""
+    counts: Counter
+    """Numbers of the collected records by (filepath, summary)."""
+
+    def __init__(self, output_file: Optional[PathParam] = None,
+                 *,
+                 output_format: DiagnosticsFormat = 'csv',
+                 level: int = logging.INFO,
+                 buffer_size: int = 10_000):
+        if output_format not in ('csv', 'jsonl'):
+            raise ValueError(f"Unsupported diagnostics format: {output_format}")
+        self._output_file = output_file
+        self._output_format = output_format
+        self._level = level
+        self._buffer_size = buffer_size
+        self._output_started = False
+        self.records = []
+        self.counts = Counter()
+
+    def set_level(self, level: int):
+        self._level = level
+
+    def is_enabled_for(self, level: int) -> bool:
+        return level >= self._level
+
+    def record(self, level: int, msg: str, filepath: str, lineno: int, test_case_index: int,
+               original_line: OriginalLine = None):
+        if level < self._level:
+            return
+        if callable(original_line):
+            original_line = original_line()
+        filepath = str(filepath)
+        self.records.append(ParsingRecord(level, filepath, lineno, test_case_index, msg, original_line))
+        self.counts[filepath, msg] += 1
+        if self._output_file is not None and len(self.records) >= self._buffer_size:
+            self.flush()
+
+    def debug(self, msg: str, filepath: str, lineno: int, test_case_index: int, original_line: OriginalLine = None):
+        self.record(logging.DEBUG, msg, filepath, lineno, test_case_index, original_line)
+
+    def info(self, msg: str, filepath: str, lineno: int, test_case_index: int, original_line: OriginalLine = None):
+        self.record(logging.INFO, msg, filepath, lineno, test_case_index, original_line)
+
+    def warning(self, msg: str, filepath: str, lineno: int, test_case_index: int, original_line: OriginalLine = None):
+        self.record(logging.WARNING, msg, filepath, lineno, test_case_index, original_line)
+
+    def error(self, msg: str, filepath: str, lineno: int, test_case_index: int, original_line: OriginalLine = None):
+        self.record(logging.ERROR, msg, filepath, lineno, test_case_index, original_line)
+
+    def counts_by_summary(self) -> Counter:
+        """
+        :return: Numbers of the collected records by summary across all files.
+        """
+        result = Counter()
+        for (_, summary), count in self.counts.items():
+            result[summary] += count
+        return result
+
+    def flush(self):
+        """
+        Writes the buffered records to the output file.
+        """
+        if self._output_file is None or (not self.records and self._output_started):
+            return
+        mode = 'a' if self._output_started else 'w'
+        with open(self._output_file, mode, newline='', encoding='utf-8') as file:
+            if self._output_format == 'csv':
+                self._write_csv(file)
+            else:
+                self._write_jsonl(file)
+        self._output_started = True
+        self.records = []
+
+    def close(self):
+        self.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def _write_csv(self, file):
+        writer = csv.writer(file, lineterminator='\n')
+        if not self._output_started:
+            writer.writerow(['level', 'filepath', 'lineno', 'test_case_index', 'summary', 'original_line'])
+        writer.writerows((record.level_name, record.filepath, record.lineno, record.test_case_index,
+                          record.summary, record.original_line)
+                         for record in self.records)
+
+    def _write_jsonl(self, file):
+        file.writelines(json.dumps({'level': record.level_name,
+                                    'filepath': record.filepath,
+                                    'lineno': record.lineno,
+                                    'test_case_index': record.test_case_index,
+                                    'summary': record.summary,
+                                    'original_line': record.original_line}, ensure_ascii=False) + '\n'
+                        for record in self.records)
@@ -1,5 +1,6 @@
 import logging
 import csv
+from typing import Callable, Union
 
 class CSVFileHandler(logging.FileHandler):
     def __init__(self, filename: str):
@@ -7,12 +8,17 @@ class CSVFileHandler(logging.FileHandler):
         self._initialize_log_file()
 
     def _initialize_log_file(self):
-        writer = csv.writer(self.stream, lineterminator='\n')
-        writer.writerow(['level', 'filepath', 'lineno', 'test_case_index', 'summary', 'original_line'])
+        self._get_writer().writerow(['level', 'filepath', 'lineno', 'test_case_index', 'summary', 'original_line'])
+
+    def _get_writer(self):
+        # The writer is reused while the stream is the same
+        if getattr(self, '_writer_stream', None) is not self.stream:
+            self._writer = csv.writer(self.stream, lineterminator='\n')
+            self._writer_stream = self.stream
+        return self._writer
 
     def emit(self, record: logging.LogRecord):
-        writer = csv.writer(self.stream, lineterminator='\n')
-        writer.writerow([
+        self._get_writer().writerow([
             record.levelname,
             record.pathname,
             record.lineno,
@@ -39,7 +45,11 @@ class FileParsingLogger:
     def set_level(self, level: int):
         self.native_logger.setLevel(level)
 
-    def make_record(self, level: int, filepath: str, lineno: int, msg: str, test_case_index: int, original_line: str):
+    def make_record(self, level: int, filepath: str, lineno: int, msg: str, test_case_index: int,
+                    original_line: Union[str, Callable[[], str]]):
+        # The line may be given as a function to render it only for the enabled levels
+        if callable(original_line):
+            original_line = original_line()
         return self.native_logger.makeRecord(
             name=self.native_logger.name,
             level=level,
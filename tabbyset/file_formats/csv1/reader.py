@@ -1,16 +1,18 @@
+from collections.abc import Generator
 from typing import Optional, List, Union, TextIO
-from ..abc import AbstractTestCasesReader
+from ..abc import IndexedCsvTestCasesReader
 from ..exceptions import FileParsingException
-from ..common import zip_columns_with_values
+from ..common import zip_columns_with_values, complete_row
 from tabbyset.utils.folder import PathParam
 from tabbyset.db.id_utils import is_valid_id
 from tabbyset.file_formats.common.parsing_logger import FileParsingLogger
+from tabbyset.file_formats.common.parsing_diagnostics import ParsingDiagnostics
 from tabbyset.entities.test_case import TestCase
 from tabbyset.utils.flex_table import FlexTable
 from tabbyset.file_formats.constants import TEST_CASE_END_LABEL, TEST_CASE_START_LABEL
 
 
-class Csv1Reader(AbstractTestCasesReader):
+class Csv1Reader(IndexedCsvTestCasesReader):
     """
     A reader for the CSV1 format.
 
@@ -23,16 +25,19 @@ class Csv1Reader(AbstractTestCasesReader):
 
     :param file: The path of the file or an open file object.
     :param tolerant_mode: If True, the reader will try to read as much as possible from the file.
-    :param parsing_logger: A logger for parsing errors.
+    :param parsing_logger: A logger for parsing errors, `FileParsingLogger` or `ParsingDiagnostics`.
     """
 
     def __init__(self, file: Union[PathParam, TextIO],
                  *,
                  tolerant_mode: bool = False,
-                 parsing_logger: Optional[FileParsingLogger] = None):
-        AbstractTestCasesReader.__init__(self, file, tolerant_mode=tolerant_mode, parsing_logger=parsing_logger)
+                 parsing_logger: Optional[Union[FileParsingLogger, ParsingDiagnostics]] = None):
+        IndexedCsvTestCasesReader.__init__(self, file, tolerant_mode=tolerant_mode, parsing_logger=parsing_logger)
 
     def _parse_as_text(self):
+        if not self._tolerant_mode and self._parsing_logger is None:
+            yield from self._parse_as_text_strict()
+            return
 
         first_column_index = 0
 
@@ -48,6 +53,9 @@ class Csv1Reader(AbstractTestCasesReader):
 
         line_number = 0
         test_case_index = -1
+        # Physical lines of the current row, a quoted cell may take several lines
+        row_start_line_num = 0
+        row_end_line_num = 0
 
         def create_exception(message: str) -> FileParsingException:
             return self._create_reader_exception(message, line_number)
@@ -55,9 +63,10 @@ class Csv1Reader(AbstractTestCasesReader):
         def log_context() -> dict:
             return {
                 'filepath': self._file_path or 'virtual file',
-                'lineno': line_number,
+                'lineno': self._get_file_line_number(line_number),
                 'test_case_index': test_case_index,
-                'original_line': str(orig_row)
+                # Rendered by the logger only for the enabled levels
+                'original_line': lambda: self._get_recent_text(row_end_line_num - row_start_line_num)
             }
 
         def reset_and_get_test_case():
@@ -86,6 +95,7 @@ class Csv1Reader(AbstractTestCasesReader):
 
         for orig_row in csvreader:
             line_number += 1
+            row_start_line_num, row_end_line_num = row_end_line_num, csvreader.line_num
 
             row = self._strip_row_right(orig_row)
             row_length = len(row)
@@ -186,3 +196,91 @@ class Csv1Reader(AbstractTestCasesReader):
                 self._parsing_logger.error('Last test case is not closed', **log_context())
             if not self._tolerant_mode:
                 raise create_exception('Last test case is not closed')
+
+    def _validate_as_text(self) -> None:
+        if self._tolerant_mode or self._parsing_logger is not None:
+            # The whole parsing is needed for the logs
+            super()._validate_as_text()
+            return
+        for _ in self._parse_as_text_strict(build_test_cases=False):
+            pass
+
+    def _parse_as_text_strict(self, build_test_cases: bool = True) -> Generator[TestCase, None, None]:
+        """
+        Parses the file in the non-tolerant mode without logging.
+
+        Recognizes the same structure as the general parser, but reads each block of the test case
+        (header, columns, steps) with a separate loop, so the step rows are only checked for the labels
+        and emptiness. Step rows are converted to dictionaries at once, when the test case is closed.
+
+        :param build_test_cases: If False, only the structure is checked and nothing is yielded.
+        """
+        rows = enumerate(self._prepare_csv_reader(), 1)
+        line_number = 0
+        for line_number, row in rows:
+            first_row_item = row[0] if row else ''
+            if first_row_item == TEST_CASE_END_LABEL:
+                raise self._create_reader_exception('Not started case tries to end', line_number)
+            if first_row_item != TEST_CASE_START_LABEL:
+                # Rows outside the test cases are ignored
+                continue
+
+            # Name, id and description always go right after the start label, only the name is required
+            header: list[str] = []
+            is_closed = False
+            for line_number, row in rows:
+                first_row_item = row[0] if row else ''
+                if first_row_item == TEST_CASE_START_LABEL:
+                    raise self._create_reader_exception('Started test case is started again', line_number)
+                if first_row_item == TEST_CASE_END_LABEL:
+                    is_closed = True
+                    break
+                if not header and not first_row_item:
+                    raise self._create_reader_exception('Test case name not found', line_number)
+                header.append(first_row_item)
+                if len(header) == 3:
+                    break
+
+            columns: Optional[list[str]] = None
+            if not is_closed:
+                for line_number, row in rows:
+                    first_row_item = row[0] if row else ''
+                    if first_row_item == TEST_CASE_START_LABEL:
+                        raise self._create_reader_exception('Started test case is started again', line_number)
+                    if first_row_item == TEST_CASE_END_LABEL:
+                        is_closed = True
+                        break
+                    if any(row):
+                        columns = self._strip_row_right(row)
+                        break
+
+            raw_steps: list[list[str]] = []
+            if not is_closed and columns is not None:
+                for line_number, row in rows:
+                    first_row_item = row[0] if row else ''
+                    if first_row_item == TEST_CASE_END_LABEL:
+                        is_closed = True
+                        break
+                    if first_row_item == TEST_CASE_START_LABEL:
+                        raise self._create_reader_exception('Started test case is started again', line_number)
+                    if build_test_cases and any(row):
+                        raw_steps.append(row)
+
+            if not is_closed:
+                raise self._create_reader_exception('Last test case is not closed', line_number)
+            if not build_test_cases:
+                continue
+
+            # Cells beyond the columns are dropped, missing cells are empty
+            columns_length = len(columns) if columns is not None else 0
+            steps = [
+                dict(zip(columns, row if len(row) >= columns_length else complete_row(row, columns_length)))
+                for row in raw_steps
+            ]
+            name, tc_id, description = header + [None] * (3 - len(header))
+            yield self._postprocess_test_case(
+                test_case=TestCase(name=name or 'UNKNOWN',
+                                   steps=FlexTable(steps),
+                                   description=description,
+                                   id=tc_id)
+            )
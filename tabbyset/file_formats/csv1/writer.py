@@ -1,4 +1,4 @@
-from typing import Union, TextIO
+from typing import Union, TextIO, Optional
 from ..abc import AbstractTestCasesWriter
 from ...utils.flex_table.utils import sort_with_priority
 from tabbyset.utils.folder import PathParam
@@ -12,6 +12,8 @@ class Csv1Writer(AbstractTestCasesWriter):
     :param file: The path of the file or an open file object.
     :param first_priority_columns: The columns that should be written first. Default: `['Status', 'ID', 'PreviousID', 'Action', 'User', 'Symbol', 'Side', 'OrderType', 'TIF', 'OrderQty', 'Price']`.
     :param last_priority_columns: The columns that should be written last. Default: `[]`.
+    :param buffer_size: The size of the buffer in characters to write the test cases by large blocks.
+                        By default, only `write_many` is buffered.
     """
 
     # Default values are stored in the tuple to prevent modification of the default values.
@@ -25,8 +27,9 @@ class Csv1Writer(AbstractTestCasesWriter):
                  file: Union[PathParam, TextIO],
                  *_,
                  first_priority_columns: list[str] = None,
-                 last_priority_columns: list[str] = None):
-        AbstractTestCasesWriter.__init__(self, file)
+                 last_priority_columns: list[str] = None,
+                 buffer_size: Optional[int] = None):
+        AbstractTestCasesWriter.__init__(self, file, buffer_size=buffer_size)
         if first_priority_columns is not None:
             self._first_priority_columns = first_priority_columns
         else:
@@ -1,7 +1,8 @@
 import copy
+from collections.abc import Generator, Iterator
 from typing import Optional, List, Union, TextIO
-from itertools import zip_longest
-from ..abc import AbstractTestCasesReader
+from itertools import chain, zip_longest
+from ..abc import IndexedCsvTestCasesReader
 from ..common import split_row, complete_row
 from ..exceptions import FileParsingException
 from tabbyset.file_formats.common.multiheader_csv import MultiheaderConfig
@@ -13,7 +14,7 @@ from tabbyset.file_formats.constants import TEST_CASE_END_LABEL, TEST_CASE_START
 from tabbyset.entities.test_case import TestCase
 
 
-class Csv2Reader(AbstractTestCasesReader):
+class Csv2Reader(IndexedCsvTestCasesReader):
     """
     A reader for the CSV2 format.
 
@@ -45,10 +46,22 @@ class Csv2Reader(AbstractTestCasesReader):
         self._multiheader_core = MultiheaderCsvCore(multiheader_config)
 
     @property
-    def global_columns(self) -> Union[list[str], dict[str, list[str]]]:
+    def global_columns(self) -> Optional[Union[list[str], dict[str, list[str]]]]:
+        """
+        Only the rows before the first test case are parsed. If the iteration is not started yet,
+        it continues from the first test case without reading the file again.
+
+        :return: The list of the global columns, or the dictionary of them by category for multiheader,
+                 or None if the file doesn't define the columns (e.g. it is empty).
+        """
+        if self._global_columns is None:
+            csvreader = self._prepare_csv_reader()
+            line_number, start_row = self._parse_header(csvreader)
+            # The existing iterator is kept, it reads the file from the beginning on its own
+            if self._iterator is None:
+                self._iterator = self._parse_test_cases(csvreader, line_number, start_row)
         if self._global_columns is None:
-            next(self)
-            self.restart_reading()
+            return None
         if self._multiheader:
             result = copy.deepcopy(self._global_columns)
             for key in result:
@@ -56,7 +69,6 @@ class Csv2Reader(AbstractTestCasesReader):
             return result
         return self._global_columns
 
-
     @classmethod
     def get_default_multiheader_config(cls) -> MultiheaderConfig:
         return MultiheaderCsvCore.config
@@ -66,14 +78,93 @@ class Csv2Reader(AbstractTestCasesReader):
         MultiheaderCsvCore.config = multiheader_config
 
     def _parse_as_text(self):
-        # TODO: Add id parsing
+        csvreader = self._prepare_csv_reader()
+        line_number, start_row = self._parse_header(csvreader)
+        yield from self._parse_test_cases(csvreader, line_number, start_row)
+
+    def _parse_header(self, csvreader: Iterator[list[str]]) -> tuple[int, Optional[list[str]]]:
+        """
+        Reads the global columns up to the first start label.
+
+        :return: The number of the read rows and the row with the first start label,
+                 or None if there are no test cases.
+        """
         self._multiheader_core.reset_headers()
         first_column_index = 0
+        united_columns: Optional[List[str]] = None
+
+        line_number = 0
+
+        def create_exception(message: str) -> FileParsingException:
+            return self._create_reader_exception(message, line_number)
+
+        for row in csvreader:
+            line_number += 1
 
+            row = self._strip_row_right(row)
+            row_length = len(row)
+            first_row_item = row[first_column_index] if row_length > first_column_index else ''
+
+            if row_length == 0 or all('' == s for s in row):
+                continue
+
+            if first_row_item == TEST_CASE_START_LABEL:
+                # Check if columns are defined
+                if self._multiheader:
+                    if not self._multiheader_core.headers:
+                        raise create_exception('Multiheader columns are not defined')
+                else:
+                    if united_columns is None:
+                        raise create_exception('Columns are not defined')
+                self._set_global_columns(united_columns)
+                return line_number, row
+
+            read_line_multiheader_result = self._multiheader_core.read_line(row)
+            is_multiheader_columns = read_line_multiheader_result.is_header
+            if self._multiheader is None:
+                self._multiheader = is_multiheader_columns
+            if self._multiheader != is_multiheader_columns:
+                if self._multiheader:
+                    raise create_exception('Multiheader columns are not defined')
+                else:
+                    raise create_exception('Multiheader columns are defined, but multiheader is not enabled')
+
+            if is_multiheader_columns:
+                if read_line_multiheader_result.error_msg:
+                    raise create_exception(read_line_multiheader_result.error_msg)
+            else:
+                if united_columns is None:
+                    united_columns = row
+        # The file without test cases still may define the columns
+        columns_defined = self._multiheader_core.headers if self._multiheader else united_columns is not None
+        if columns_defined:
+            self._set_global_columns(united_columns)
+        return line_number, None
+
+    def _set_global_columns(self, united_columns: Optional[List[str]]):
+        if self._multiheader:
+            self._global_columns = self._multiheader_core.headers
+        else:
+            self._global_columns = united_columns
+
+    def _validate_as_text(self) -> None:
         csvreader = self._prepare_csv_reader()
+        line_number, start_row = self._parse_header(csvreader)
+        for _ in self._parse_test_cases(csvreader, line_number, start_row, build_test_cases=False):
+            pass
 
-        united_columns: Optional[List[str]] = None
-        columns_definitions_read = False
+    def _parse_test_cases(self, csvreader: Iterator[list[str]], line_number: int,
+                          start_row: Optional[list[str]],
+                          build_test_cases: bool = True) -> Generator[TestCase, None, None]:
+        """
+        Reads the test cases after the global columns, starting from the row with the first start label.
+
+        :param build_test_cases: If False, only the structure is checked and nothing is yielded.
+        """
+        if start_row is None:
+            return
+        first_column_index = 0
+        united_columns: Optional[List[str]] = None if self._multiheader else self._global_columns
 
         current_tc_started = False
         current_tc_ended = False
@@ -81,12 +172,13 @@ class Csv2Reader(AbstractTestCasesReader):
         current_tc_name: Optional[str] = None
         current_tc_content: List[dict] = []
 
-        line_number = 0
+        # The start row is counted again in the loop
+        line_number -= 1
 
         def create_exception(message: str) -> FileParsingException:
             return self._create_reader_exception(message, line_number)
 
-        for row in csvreader:
+        for row in chain([start_row], csvreader):
             line_number += 1
 
             row = self._strip_row_right(row)
@@ -96,41 +188,8 @@ class Csv2Reader(AbstractTestCasesReader):
             if row_length == 0 or all('' == s for s in row):
                 continue
 
-            if not columns_definitions_read and first_row_item != TEST_CASE_START_LABEL:
-                read_line_multiheader_result = self._multiheader_core.read_line(row)
-                is_multiheader_columns = read_line_multiheader_result.is_header
-                if self._multiheader is None:
-                    self._multiheader = is_multiheader_columns
-                if self._multiheader != is_multiheader_columns:
-                    if self._multiheader:
-                        raise create_exception('Multiheader columns are not defined')
-                    else:
-                        raise create_exception('Multiheader columns are defined, but multiheader is not enabled')
-
-                if is_multiheader_columns:
-                    if read_line_multiheader_result.error_msg:
-                        raise create_exception(read_line_multiheader_result.error_msg)
-                else:
-                    if united_columns is None:
-                        united_columns = row
-                continue
-
             # Lookup for name
             if first_row_item == TEST_CASE_START_LABEL:
-                # Check if columns are defined
-                if not columns_definitions_read:
-                    if self._multiheader:
-                        if not self._multiheader_core.headers:
-                            raise create_exception('Multiheader columns are not defined')
-                    else:
-                        if united_columns is None:
-                            raise create_exception('Columns are not defined')
-                    columns_definitions_read = True
-                    if self._multiheader:
-                        self._global_columns = self._multiheader_core.headers
-                    else:
-                        self._global_columns = united_columns
-
                 if current_tc_started:
                     raise create_exception('Started test case is started again')
                 if row_length <= 1:
@@ -173,6 +232,9 @@ class Csv2Reader(AbstractTestCasesReader):
                         raise create_exception('Columns are not defined for test case')
                     current_row_columns = current_tc_columns
 
+                # Rows are needed as dictionaries only for the test cases and the categories check
+                if not (build_test_cases or self._multiheader):
+                    continue
                 # Checking table row
                 if row_length > len(current_row_columns):
                     # Trim row if it has more items than columns
@@ -185,7 +247,8 @@ class Csv2Reader(AbstractTestCasesReader):
                                                                                       read_line_multiheader_result.category)
                     if not category_check_result[0]:
                         raise create_exception(category_check_result[1])
-                current_tc_content.append(current_row_as_dict)
+                if build_test_cases:
+                    current_tc_content.append(current_row_as_dict)
                 continue
 
             # Add new testcase and reset data
@@ -193,8 +256,10 @@ class Csv2Reader(AbstractTestCasesReader):
                 if not current_tc_started:
                     raise create_exception('Not started case tries to end')
 
-                new_test_case = self._postprocess_test_case(TestCase(name=current_tc_name, steps=current_tc_content))
-                yield new_test_case
+                if build_test_cases:
+                    new_test_case = self._postprocess_test_case(TestCase(name=current_tc_name,
+                                                                         steps=current_tc_content))
+                    yield new_test_case
 
                 current_tc_columns = None
                 current_tc_started = False
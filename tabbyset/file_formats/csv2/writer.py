@@ -9,6 +9,7 @@ from tabbyset.file_formats.common.multiheader_csv import MultiheaderConfig
 from tabbyset.file_formats.common.multiheader_csv.core import MultiheaderCsvCore
 from tabbyset.utils.warnings import libwarn
 from tabbyset.utils.folder import PathParam
+from tabbyset.utils.flex_table.constants import EMPTY_VALUE
 
 
 class Csv2Writer(AbstractTestCasesWriter):
@@ -22,19 +23,25 @@ class Csv2Writer(AbstractTestCasesWriter):
     :param global_columns: Superset of columns for all test cases in the file. In case of multiheader, it is a dictionary with category names as keys and lists of columns as values.
     :param multiheader: The flag to specify explicitly if you want use multiheader or not. Default is None, what means that the writer will decide automatically.
     :param multiheader_config: The configuration for multiheader. Default is the message type based config.
+    :param buffer_size: The size of the buffer in characters to write the test cases by large blocks.
+                        By default, only `write_many` is buffered.
     """
     _global_columns = []
     _global_columns_written = False
     _multiheader = False
     _multiheader_core: MultiheaderCsvCore
+    # Positions of the global columns in the rows, None if the columns are not unique
+    _column_positions: Optional[dict[str, int]] = None
+    _row_length: int = 0
 
     def __init__(self,
                  file: Union[PathParam, TextIO],
                  global_columns: Union[list[str], dict[str, list[str]]],
                  *_,
                  multiheader: Optional[bool] = None,
-                 multiheader_config: Optional[MultiheaderConfig] = None):
-        AbstractTestCasesWriter.__init__(self, file)
+                 multiheader_config: Optional[MultiheaderConfig] = None,
+                 buffer_size: Optional[int] = None):
+        AbstractTestCasesWriter.__init__(self, file, buffer_size=buffer_size)
         self._global_columns = copy.deepcopy(global_columns)
         auto_multiheader = isinstance(global_columns, dict)
         if multiheader is None:
@@ -48,6 +55,9 @@ class Csv2Writer(AbstractTestCasesWriter):
         self._multiheader_core = MultiheaderCsvCore(multiheader_config)
         if self._multiheader:
             self._multiheader_core.set_headers(self._global_columns, writable=True)
+        self._row_length = self._max_cells_in_row
+        if not self._multiheader and len(set(self._global_columns)) == len(self._global_columns):
+            self._column_positions = {column: position for position, column in enumerate(self._global_columns)}
         if multiheader_config:
             if not multiheader:
                 libwarn('The multiheader_config parameter is ignored because the multiheader is not used.',
@@ -68,10 +78,10 @@ class Csv2Writer(AbstractTestCasesWriter):
         return len(self._global_columns)
 
     def _get_tc_start_row(self, test_case_name: str):
-        return complete_row([TEST_CASE_START_LABEL, test_case_name], self._max_cells_in_row)
+        return complete_row([TEST_CASE_START_LABEL, test_case_name], self._row_length)
 
     def _get_tc_end_row(self):
-        return complete_row([TEST_CASE_END_LABEL], self._max_cells_in_row)
+        return complete_row([TEST_CASE_END_LABEL], self._row_length)
 
     def _write_test_case(self, test_case: TestCase):
         # TODO: Write test case id
@@ -87,12 +97,25 @@ class Csv2Writer(AbstractTestCasesWriter):
             writer.writerow(self._global_columns)
             self._global_columns_written = True
 
-        writer.writerow(self._get_tc_start_row(test_case.name))
-        writer.writerow([(common_column if (common_column in test_case.steps.columns) else '')
-                         for common_column in self._global_columns])
-        for step in test_case.steps:
-            writer.writerow(self._table_item_as_list(step, self._global_columns))
-        writer.writerow(self._get_tc_end_row())
+        rows = [self._get_tc_start_row(test_case.name)]
+        test_case_columns = set(test_case.steps.columns)
+        rows.append([(common_column if (common_column in test_case_columns) else '')
+                     for common_column in self._global_columns])
+        column_positions = self._column_positions
+        if column_positions is None:
+            rows.extend(self._table_item_as_list(step, self._global_columns) for step in test_case.steps)
+        else:
+            # Steps usually have much fewer cells than the global columns, so only their cells are placed
+            empty_row = [EMPTY_VALUE] * self._row_length
+            for step in test_case.steps:
+                row = empty_row.copy()
+                for column, value in step.items():
+                    position = column_positions.get(column)
+                    if position is not None:
+                        row[position] = value
+                rows.append(row)
+        rows.append(self._get_tc_end_row())
+        writer.writerows(rows)
 
     def _write_test_case_multiheader(self, test_case: TestCase):
         writer = self._prepare_csv_writer()
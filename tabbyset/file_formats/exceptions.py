@@ -17,6 +17,10 @@ class FileParsingException(Exception):
     def __str__(self):
         return f"{super().__str__()}: {self.file_path}:{self.line_number}"
 
+    def __reduce__(self):
+        # Keeps the details, when the exception is passed between processes
+        return type(self), (self.file_path, self.line_number, self.args[0])
+
 
 class VirtualFileParsingException(FileParsingException):
     def __init__(self, file: str, line_number: int, message: str):
@@ -26,3 +30,6 @@ class VirtualFileParsingException(FileParsingException):
 
     def __str__(self):
         return f"{Exception.__str__(self)} on line {self.line_number} \n{self.file}"
+
+    def __reduce__(self):
+        return type(self), (self.file, self.line_number, self.args[0])
@@ -19,4 +19,11 @@ class GlobPatterns:
         pattern = '*.matrix.csv'
         if deep:
             pattern = cls._deepify(pattern)
-        return pattern
\ No newline at end of file
+        return pattern
+
+    @classmethod
+    def tbs_pattern(cls, deep=False) -> str:
+        pattern = '*.tbs'
+        if deep:
+            pattern = cls._deepify(pattern)
+        return pattern
@@ -27,7 +27,7 @@ class RawTestCasesReader(AbstractTestCasesReader):
 
     def _parse_as_text(self):
 
-        jsonl_reader = self._prepare_textio_readable()
+        jsonl_reader = self._prepare_lines_readable()
 
         line_number = 0
 
@@ -5,7 +5,7 @@ def tc_to_dict(tc: TestCase) -> dict:
         "name": tc.name,
         "description": tc.description,
         "id": tc.id,
-        "steps": list(tc.steps),
+        "steps": [dict(row) for row in tc.steps],
     }
 
 def dict_to_tc(tc_dict: dict) -> TestCase:
@@ -1,6 +1,6 @@
 import json
 
-from typing import Union, TextIO
+from typing import Union, TextIO, Optional
 from .tc_to_dict import tc_to_dict
 from ..abc import AbstractTestCasesWriter
 from tabbyset.entities.test_case import TestCase
@@ -13,12 +13,14 @@ class RawTestCasesWriter(AbstractTestCasesWriter):
 
     It is not limited to specifics of CSV1 or CSV2, but takes much more space.
     :param file: The path of the file or an open file object.
+    :param buffer_size: The size of the buffer in characters to write the test cases by large blocks.
+                        By default, only `write_many` is buffered.
     """
 
     # Default values are stored in the tuple to prevent modification of the default values.
 
-    def __init__(self, file: Union[PathParam, TextIO]):
-        AbstractTestCasesWriter.__init__(self, file)
+    def __init__(self, file: Union[PathParam, TextIO], *, buffer_size: Optional[int] = None):
+        AbstractTestCasesWriter.__init__(self, file, buffer_size=buffer_size)
 
     def _write_test_case(self, test_case: TestCase):
         writer = self._prepare_textio_writable()
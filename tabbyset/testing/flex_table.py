@@ -28,6 +28,9 @@ class FlexTableAssertions(unittest.TestCase):
         :param table2: The second FlexTable.
         :param msg: The message to display on failure.
         """
+        # The tables may be changed directly in the tests, so their columns are rescanned
+        table1.invalidate_caches()
+        table2.invalidate_caches()
         if table1 == table2:
             return
         try:
@@ -6,6 +6,8 @@ from tabbyset.entities import TestCase
 
 
 def drop_empty_columns(table):
+    # The steps may be changed directly in the tests, so their columns are rescanned
+    table.invalidate_caches()
     for column in table.columns:
         if all(value == EMPTY_VALUE for value in table[column]):
             table.remove_column(column)
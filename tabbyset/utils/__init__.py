@@ -1,12 +1,17 @@
 from .date_range import DateRange
 from .folder import Folder, PathParam
-from .flex_table import FlexTable, ParsableQueryStatement, DictQuery, sort_with_priority
-from .tick_utils import floor_to_tick, ceil_to_tick, round_to_tick, is_multiple_of_tick
+from .flex_table import FlexTable, ColumnarFlexTable, ParsableQueryStatement, DictQuery, sort_with_priority
+from .tick_utils import (floor_to_tick, ceil_to_tick, round_to_tick, is_multiple_of_tick,
+                         floor_to_tick_many, ceil_to_tick_many, round_to_tick_many, is_multiple_of_tick_many,
+                         round_column_to_tick)
 from .multi_test_case_writer import MultiTestCaseWriter
 from .global_columns import global_columns
 from .test_cases_plain_reader import TestCasesPlainReader
 from .dhash import dhash
-from .fs_utils import walk_tests_folder
-from .chunks import chunkify_csv1_file
+from .fs_utils import walk_tests_folder, read_tests_files
+from .tests_cache import TestsFilesCache
+from .duplicates import find_duplicates, write_duplicates_report, DuplicatesGroup, TestCaseLocation
+from .chunks import chunkify_csv1_file, split_csv1_file, merge_csv1_files
 from .group_by import group_by
-from .shuffle import shuffle_csv1, shuffle_csv2
\ No newline at end of file
+from .shuffle import shuffle_csv1, shuffle_csv2
+from .convert import convert_to_csv2
@@ -1,9 +1,25 @@
+import csv
+import os
+import shutil
 import sys
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Optional, BinaryIO
 from tqdm import tqdm
+from tabbyset.file_formats.constants import TEST_CASE_START_LABEL
 from tabbyset.file_formats.csv1.reader import Csv1Reader
 from tabbyset.file_formats.csv1.writer import Csv1Writer
 from .folder import PathParam, Folder
 
+_START_LABEL = TEST_CASE_START_LABEL.encode('utf-8')
+_START_PATTERN = b'\n' + _START_LABEL
+# Bytes which may follow the start label in its row
+_START_LABEL_ENDINGS = (b',', b'\r', b'\n', b'')
+_SCAN_BLOCK_SIZE = 16 * 1024 * 1024
+_COPY_BLOCK_SIZE = 1024 * 1024
+
+
 def chunkify_csv1_file(input_file: PathParam, chunks_folder: PathParam, chunk_size: int = 3000) -> None:
     chunks_folder = Folder(chunks_folder)
     progress_bar = tqdm(unit='chunks', file=sys.stdout)
@@ -21,4 +37,217 @@ def chunkify_csv1_file(input_file: PathParam, chunks_folder: PathParam, chunk_si
             if written_in_chunk >= chunk_size:
                 progress_bar.update(1)
                 written_in_chunk = 0
-                current_writer.close()
\ No newline at end of file
+                current_writer.close()
+
+
+def split_csv1_file(input_file: PathParam, chunks_folder: PathParam, chunk_size: int = 3000,
+                    *,
+                    workers: Optional[int] = None) -> list[Path]:
+    """
+    Splits a CSV1 file into the chunk files (`chunk_1.csv`, `chunk_2.csv`, ...) of the given number of test cases.
+
+    Unlike `chunkify_csv1_file`, the test cases are not parsed: their boundaries are found by the start labels
+    in the raw bytes and the byte ranges are copied as is. So the chunks are not validated,
+    the test cases without ids keep them missing, and the start labels in quoted cells are not recognized.
+    Concatenation of the chunks (see `merge_csv1_files`) is equal to the input file.
+
+    :param input_file: The path of the CSV1 file.
+    :param chunks_folder: The folder to write the chunks to.
+    :param chunk_size: The number of test cases in a chunk.
+    :param workers: The number of processes to scan the file and to write the chunks in parallel.
+                    By default, everything is done in the current process.
+    :return: The paths of the chunk files.
+    """
+    if chunk_size <= 0:
+        raise ValueError(f"Chunk size should be positive, got {chunk_size}")
+    chunks_folder = Folder(chunks_folder)
+    offsets = find_test_case_offsets(input_file, workers=workers)
+    if not offsets:
+        return []
+    file_size = os.path.getsize(input_file)
+    # The part of the file before the first test case goes to the first chunk
+    chunk_starts = [0] + offsets[chunk_size::chunk_size]
+    chunk_ends = chunk_starts[1:] + [file_size]
+    chunk_paths = [chunks_folder.get_file_path(f'chunk_{chunk_number}.csv')
+                   for chunk_number in range(1, len(chunk_starts) + 1)]
+    input_files = [input_file] * len(chunk_paths)
+    if workers is None or workers <= 1 or len(chunk_paths) <= 1:
+        for arguments in zip(input_files, chunk_starts, chunk_ends, chunk_paths):
+            _copy_byte_range(*arguments)
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            list(executor.map(_copy_byte_range, input_files, chunk_starts, chunk_ends, chunk_paths))
+    return chunk_paths
+
+
+def merge_csv1_files(input_files: Iterable[PathParam], output_file: PathParam) -> None:
+    """
+    Concatenates the CSV1 files into one file without parsing them.
+
+    A line break is added between the files, if the previous file doesn't end with it.
+
+    :param input_files: The paths of the CSV1 files in the order of merging.
+    :param output_file: The path of the merged file.
+    """
+    with open(output_file, 'wb') as output:
+        ends_with_line_break = True
+        for input_file in input_files:
+            with open(input_file, 'rb') as file:
+                if os.fstat(file.fileno()).st_size == 0:
+                    continue
+                if not ends_with_line_break:
+                    output.write(b'\r\n')
+                shutil.copyfileobj(file, output, _COPY_BLOCK_SIZE)
+                file.seek(-1, os.SEEK_END)
+                ends_with_line_break = file.read(1) == b'\n'
+
+
+def find_test_case_offsets(input_file: PathParam, *, workers: Optional[int] = None) -> list[int]:
+    """
+    Finds the byte offsets of the rows starting the test cases in a CSV1 or CSV2 file without parsing it.
+
+    The rows are recognized by the start label in the first cell. The lines without quotes are only searched
+    for the label, while the rows having quotes are parsed with `csv.reader` like the readers do,
+    so the quoted cells with line breaks and the quotes inside the unquoted cells are handled correctly.
+
+    :param input_file: The path of the file.
+    :param workers: The number of processes to scan the parts of the file in parallel.
+    :return: The sorted offsets of the start labels.
+    """
+    file_size = os.path.getsize(input_file)
+    if workers is None or workers <= 1:
+        return _scan_segment(input_file, 0, file_size)[0]
+    bounds = [file_size * segment_index // workers for segment_index in range(workers + 1)]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        segments = list(executor.map(_scan_segment, [input_file] * workers, bounds[:-1], bounds[1:]))
+    offsets = []
+    scanned_until = 0
+    for segment_end, (candidates, segment_start, segment_scanned_until) in zip(bounds[1:], segments):
+        if scanned_until >= segment_end:
+            # The whole segment is inside the last row of the previous one
+            continue
+        if segment_start != scanned_until:
+            # The row of the previous segment continues in this one, so the segment is scanned wrongly
+            candidates, _, segment_scanned_until = _scan_segment(input_file, scanned_until, segment_end)
+        offsets.extend(candidates)
+        scanned_until = segment_scanned_until
+    return offsets
+
+
+def _scan_segment(input_file: PathParam, start: int, end: int) -> tuple[list[int], int, int]:
+    """
+    Scans the rows of the file starting in the segment for the start labels.
+
+    The segment is scanned from the first line starting in it, which is supposed to start a row.
+
+    :return: The offsets of the found labels, the offset the scan started from,
+             and the offset of the first row starting after the segment.
+    """
+    candidates = []
+    with open(input_file, 'rb') as file:
+        position = _find_line_start(file, start)
+        scan_start = position
+        while position < end:
+            file.seek(position)
+            block_size = min(_SCAN_BLOCK_SIZE, end - position)
+            # The block is cut at the last line break, the labels are checked with the byte after them
+            block = file.read(block_size + len(_START_LABEL) + 1)
+            block_end = block.rfind(b'\n', 0, block_size) + 1
+            if block_end == 0:
+                # The line is longer than the block
+                is_start_row, row_end = _scan_row(file, position)
+                if is_start_row:
+                    candidates.append(position)
+                position = row_end
+                continue
+            offset = 0
+            while offset < block_end:
+                quote_index = block.find(b'"', offset, block_end)
+                if quote_index == -1:
+                    _find_labels(block, offset, block_end, position, candidates)
+                    offset = block_end
+                    break
+                # Lines before the line with the quote can't be inside a quoted cell
+                row_start = block.rfind(b'\n', offset, quote_index) + 1 or offset
+                _find_labels(block, offset, row_start, position, candidates)
+                is_start_row, row_end = _scan_row(file, position + row_start, block, row_start, block_end)
+                if is_start_row:
+                    candidates.append(position + row_start)
+                offset = row_end - position
+            position += offset
+    return candidates, scan_start, position
+
+
+def _find_labels(block: bytes, start: int, end: int, block_position: int, candidates: list[int]) -> None:
+    """
+    Finds the start labels at the beginnings of the lines of the block part, which starts a line.
+    """
+    if start < end and block.startswith(_START_LABEL, start) and _is_label_end(block, start + len(_START_LABEL)):
+        candidates.append(block_position + start)
+    index = block.find(_START_PATTERN, start, end)
+    while index != -1:
+        if _is_label_end(block, index + len(_START_PATTERN)):
+            candidates.append(block_position + index + 1)
+        index = block.find(_START_PATTERN, index + 1, end)
+
+
+def _find_line_start(file: BinaryIO, position: int) -> int:
+    """
+    :return: The offset of the first line starting at the position or after it.
+    """
+    if position == 0:
+        return 0
+    file.seek(position - 1)
+    while True:
+        block = file.read(_COPY_BLOCK_SIZE)
+        index = block.find(b'\n')
+        if index != -1:
+            return position + index
+        if not block:
+            return position - 1
+        position += len(block)
+
+
+def _scan_row(file: BinaryIO, position: int,
+              block: bytes = b'', block_start: int = 0, block_end: int = 0) -> tuple[bool, int]:
+    """
+    Parses the row at the position with `csv.reader`.
+
+    The lines are taken from the block part, which is already read, and then from the file after it.
+
+    :return: Whether the row starts a test case and the offset of the next row.
+    """
+    row_size = 0
+
+    def read_lines() -> Iterator[str]:
+        nonlocal row_size
+        line_start = block_start
+        while line_start < block_end:
+            line_end = block.index(b'\n', line_start, block_end) + 1
+            row_size += line_end - line_start
+            # Latin-1 keeps the bytes as is, while the delimiters and quotes are ASCII in UTF-8
+            yield block[line_start:line_end].decode('latin-1')
+            line_start = line_end
+        file.seek(position + row_size)
+        for line in iter(file.readline, b''):
+            row_size += len(line)
+            yield line.decode('latin-1')
+
+    row = next(csv.reader(read_lines()), None)
+    return bool(row) and row[0] == TEST_CASE_START_LABEL, position + row_size
+
+
+def _is_label_end(block: bytes, index: int) -> bool:
+    return block[index:index + 1] in _START_LABEL_ENDINGS
+
+
+def _copy_byte_range(input_file: PathParam, start: int, end: int, output_file: PathParam) -> None:
+    with open(input_file, 'rb') as file, open(output_file, 'wb') as output:
+        file.seek(start)
+        remaining = end - start
+        while remaining > 0:
+            data = file.read(min(_COPY_BLOCK_SIZE, remaining))
+            if not data:
+                break
+            output.write(data)
+            remaining -= len(data)
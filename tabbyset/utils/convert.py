@@ -0,0 +1,40 @@
+"""
+Conversion of the test cases files between the formats
+"""
+from dataclasses import replace
+from typing import Union, TextIO, Optional
+from tabbyset.file_formats.csv2.writer import Csv2Writer
+from tabbyset.file_formats.common.multiheader_csv.config import Categorizer
+from .folder import PathParam
+from .fs_utils import FileFormat, _get_reader_type
+from .global_columns import global_columns
+
+FileParam = Union[PathParam, TextIO]
+
+
+def convert_to_csv2(input_file: FileParam, output_file: FileParam, input_format: FileFormat = 'csv1',
+                    *,
+                    multiheader: bool = False,
+                    categorizer: Optional[Categorizer] = None) -> None:
+    """
+    Converts the test cases file to the CSV2 format.
+
+    The input file is read twice: the first pass discovers the global columns and the second one writes
+    the test cases. Only one test case at a time is kept in the memory, so the files of any size can be converted.
+
+    :param input_file: The path of the input file or an open seekable file object.
+    :param output_file: The path of the output CSV2 file or an open file object.
+    :param input_format: The format of the input file.
+    :param multiheader: The flag to write the CSV2 file with multiheader. Default is False.
+    :param categorizer: The function to categorize columns for multiheader. Default is based on the message type.
+                        The output file must be read with a multiheader config having the same categorizer.
+    """
+    with _get_reader_type(input_format)(input_file) as reader:
+        columns = global_columns(reader, multiheader=multiheader, categorizer=categorizer)
+        reader.restart_reading()
+        multiheader_config = None
+        if multiheader and categorizer is not None:
+            # The writer must put the rows into the same categories as the global columns
+            multiheader_config = replace(Csv2Writer.get_default_multiheader_config(), categorizer=categorizer)
+        with Csv2Writer(output_file, global_columns=columns, multiheader_config=multiheader_config) as writer:
+            writer.write_many(reader)
@@ -1,5 +1,8 @@
 import hashlib
 import pickle
+from collections.abc import Iterable, Sequence
+from typing import Any
+
 
 def dhash(input_data) -> int:
     """
@@ -14,6 +17,36 @@ def dhash(input_data) -> int:
     # Update the hash object with the serialized data
     hash_object.update(serialized_data)
 
+    return _digest_to_int(hash_object)
+
+
+def dhash_table(columns: Sequence[str], rows: Iterable[Sequence[Any]]) -> int:
+    """
+    Calculates deterministic hash of the tabular data.
+
+    Equal to `dhash` of the tuple of the columns tuple and the rows tuples,
+    but the serialized data is fed to the hash object frame by frame instead of being built as a whole.
+    """
+    tabular_data = [tuple(columns)]
+    tabular_data.extend(map(tuple, rows))
+
+    hash_object = hashlib.sha256()
+    pickle.Pickler(_HashWriter(hash_object)).dump(tuple(tabular_data))
+
+    return _digest_to_int(hash_object)
+
+
+class _HashWriter:
+    """
+    File-like object feeding the written data to the hash object.
+    """
+    __slots__ = ('write',)
+
+    def __init__(self, hash_object):
+        self.write = hash_object.update
+
+
+def _digest_to_int(hash_object) -> int:
     # Get the hexadecimal representation of the hash
     hash_hex = hash_object.hexdigest()
 
@@ -23,4 +56,4 @@ def dhash(input_data) -> int:
     # Convert the truncated hexadecimal hash to an integer
     hash_int = int(truncated_hash_hex, 16)
 
-    return hash_int
\ No newline at end of file
+    return hash_int
@@ -0,0 +1,161 @@
+"""
+Detection of the duplicate test cases across the files
+"""
+import csv
+import os
+import pickle
+import tempfile
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from typing import NamedTuple, Optional, Union, TextIO
+
+from .folder import PathParam
+from .fs_utils import FileFormat, _get_reader_type, _map_files
+
+FileParam = Union[PathParam, TextIO]
+
+# Number of the files the fingerprints are distributed by, when they don't fit into the memory
+_SPILL_PARTITIONS = 64
+
+# Fingerprint, line number, name and id of a test case
+_FileEntry = tuple[int, int, str, Optional[str]]
+
+
+class TestCaseLocation(NamedTuple):
+    """
+    Position of a test case in the files.
+    """
+    file_path: Path
+    line_number: int
+    """Number of the line with the start label, starting from 1."""
+    name: str
+    id: Optional[str]
+
+
+class DuplicatesGroup(NamedTuple):
+    """
+    Test cases having the same steps.
+    """
+    fingerprint: int
+    """Hash of the steps of the test cases."""
+    locations: list[TestCaseLocation]
+    """Locations of the test cases in the order of the files."""
+
+
+def find_duplicates(files: Iterable[PathParam], file_format: FileFormat = 'csv1',
+                    *,
+                    workers: Optional[int] = None,
+                    max_entries: int = 1_000_000,
+                    temp_folder: Optional[PathParam] = None) -> Iterator[DuplicatesGroup]:
+    """
+    Finds the test cases with the same steps across the files.
+
+    The test cases are compared by the hash of their steps, the same one the ids are generated from.
+    So the test cases differing only in names, ids, columns order or empty columns are duplicates too.
+
+    Only the fingerprints of the test cases are kept in the memory. When their number exceeds `max_entries`,
+    they are spilled to the temporary files and grouped part by part.
+
+        >>> files = Folder('path/to/tests').glob(GlobPatterns.csv1_pattern(deep=True))
+        ... for group in find_duplicates(files, workers=4):
+        ...     print([f'{location.file_path}:{location.line_number}' for location in group.locations])
+
+    :param files: The paths of the files.
+    :param file_format: The format of the test cases files.
+    :param workers: The number of processes to parse the files in parallel.
+                    By default, the files are parsed one by one in the current process.
+    :param max_entries: The maximum number of the test cases fingerprints kept in the memory.
+    :param temp_folder: The folder for the spilled fingerprints. By default, the system temporary folder.
+    :return: An iterator of the groups of two or more test cases.
+             Groups order is not specified, as it depends on the spilling.
+    """
+    # Fails on an unknown format before any file is read
+    _get_reader_type(file_format)
+    files = [Path(file) for file in files]
+    with tempfile.TemporaryDirectory(dir=temp_folder, prefix='tabbyset_duplicates_') as spill_folder:
+        groups: dict[int, list] = {}
+        entries_count = 0
+        spill_paths = None
+        file_indexes = {file: file_index for file_index, file in enumerate(files)}
+        file_entries = _map_files(_fingerprint_file, files, file_format, workers=workers)
+        for file, entries in file_entries:
+            file_index = file_indexes[file]
+            for fingerprint, line_number, name, test_case_id in entries:
+                groups.setdefault(fingerprint, []).append((file_index, line_number, name, test_case_id))
+            entries_count += len(entries)
+            if entries_count > max_entries:
+                if spill_paths is None:
+                    spill_paths = [os.path.join(spill_folder, f'{partition}.pickle')
+                                   for partition in range(_SPILL_PARTITIONS)]
+                _spill(groups, spill_paths)
+                groups = {}
+                entries_count = 0
+        if spill_paths is None:
+            yield from _duplicate_groups(groups, files)
+            return
+        _spill(groups, spill_paths)
+        del groups
+        for spill_path in spill_paths:
+            yield from _duplicate_groups(_load_spilled(spill_path), files)
+
+
+def write_duplicates_report(groups: Iterable[DuplicatesGroup], output_file: FileParam) -> int:
+    """
+    Writes the duplicate groups to a CSV file, one row per test case.
+
+    :param groups: The groups found by `find_duplicates`.
+    :param output_file: The path of the output CSV file or an open file object.
+    :return: The number of the written groups.
+    """
+    if isinstance(output_file, (str, os.PathLike)):
+        with open(output_file, 'w', newline='', encoding='utf-8') as file:
+            return write_duplicates_report(groups, file)
+    writer = csv.writer(output_file)
+    writer.writerow(['Group', 'Fingerprint', 'File', 'Line', 'Name', 'Id'])
+    groups_count = 0
+    for groups_count, group in enumerate(groups, start=1):
+        for location in group.locations:
+            writer.writerow([groups_count, group.fingerprint, location.file_path, location.line_number,
+                             location.name, location.id or ''])
+    return groups_count
+
+
+def _fingerprint_file(file: Path, file_format: FileFormat) -> list[_FileEntry]:
+    with _get_reader_type(file_format)(file) as reader:
+        return [(hash(test_case.steps), entry.line_number, entry.name, entry.id)
+                for entry, test_case in reader.iter_with_positions()]
+
+
+def _spill(groups: dict[int, list], spill_paths: list[str]) -> None:
+    partitions = [{} for _ in spill_paths]
+    for fingerprint, group_entries in groups.items():
+        partitions[fingerprint % len(spill_paths)][fingerprint] = group_entries
+    for partition, spill_path in zip(partitions, spill_paths):
+        if partition:
+            with open(spill_path, 'ab') as spill_file:
+                pickle.dump(partition, spill_file, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def _load_spilled(spill_path: str) -> dict[int, list]:
+    groups = {}
+    if not os.path.exists(spill_path):
+        return groups
+    with open(spill_path, 'rb') as spill_file:
+        while True:
+            try:
+                partition = pickle.load(spill_file)
+            except EOFError:
+                break
+            for fingerprint, group_entries in partition.items():
+                groups.setdefault(fingerprint, []).extend(group_entries)
+    return groups
+
+
+def _duplicate_groups(groups: dict[int, list], files: list[Path]) -> Iterator[DuplicatesGroup]:
+    for fingerprint, group_entries in groups.items():
+        if len(group_entries) < 2:
+            continue
+        # Spilled parts of the group are loaded in the order of the files, so the entries stay ordered
+        locations = [TestCaseLocation(files[file_index], line_number, name, test_case_id)
+                     for file_index, line_number, name, test_case_id in group_entries]
+        yield DuplicatesGroup(fingerprint, locations)
@@ -1,4 +1,6 @@
-from .table_queries import parse_dict_query, QueryStatement, apply_query_to_dict, ParsableQueryStatement, DictQuery
+from .table_queries import parse_dict_query, QueryStatement, CompiledQuery, apply_query_to_dict, ParsableQueryStatement, DictQuery
 from .flex_table import FlexTable
+from .columnar import ColumnarFlexTable, ColumnarRow
+from .numeric import NumericColumn
 from .utils import dict_row_to_list, ascii_table, sort_with_priority
 from .typing import FlexTableValue, FlexTableRow, TabularData
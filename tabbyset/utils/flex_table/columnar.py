@@ -0,0 +1,461 @@
+import copy
+import sys
+from collections.abc import Iterable, Iterator, Mapping, MutableMapping, MutableSequence, Callable
+from typing import Union, Any, Optional
+
+from .constants import EMPTY_VALUE
+from .flex_table import FlexTable
+from .table_queries import CompiledQuery
+from .typing import FlexTableValue, FlexTableRow
+
+
+class _Missing:
+    """
+    Marker of a cell which is absent in the row (unlike an empty cell, which is present and equals `EMPTY_VALUE`).
+    """
+    __slots__ = ()
+
+    def __repr__(self):
+        return '<MISSING>'
+
+    def __reduce__(self):
+        return '_MISSING'
+
+
+_MISSING = _Missing()
+
+
+class ColumnarRow(MutableMapping):
+    """
+    Lightweight view of a single row of the `ColumnarRows` storage.
+
+    The keys are iterated in the order they were added to the row, as for a dict.
+    The view is bound to the position of the row, so it must not be kept after the rows
+    of the table are inserted, removed or reordered.
+    """
+    __slots__ = ('_storage', '_index')
+
+    def __init__(self, storage: 'ColumnarRows', index: int):
+        self._storage = storage
+        self._index = index
+
+    def __getitem__(self, key: str) -> FlexTableValue:
+        column = self._storage._columns.get(key)
+        if column is None:
+            raise KeyError(key)
+        value = column[self._index]
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def get(self, key: str, default: FlexTableValue = None) -> FlexTableValue:
+        column = self._storage._columns.get(key)
+        if column is None:
+            return default
+        value = column[self._index]
+        if value is _MISSING:
+            return default
+        return value
+
+    def __setitem__(self, key: str, value: FlexTableValue):
+        self._storage._set_cell(self._index, key, value)
+
+    def __delitem__(self, key: str):
+        if self.get(key, _MISSING) is _MISSING:
+            raise KeyError(key)
+        self._storage._set_cell(self._index, key, _MISSING)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._storage._keys[self._index])
+
+    def __len__(self) -> int:
+        return len(self._storage._keys[self._index])
+
+    def __or__(self, other: Mapping) -> FlexTableRow:
+        return dict(self) | dict(other)
+
+    def __ror__(self, other: Mapping) -> FlexTableRow:
+        return dict(other) | dict(self)
+
+    def copy(self) -> FlexTableRow:
+        return dict(self)
+
+    def __repr__(self):
+        return repr(dict(self))
+
+
+class ColumnarRows(MutableSequence):
+    """
+    Column-oriented storage of the table rows with the list-like interface.
+
+    Each column is kept as a separate list of cells and column names are interned. The values are stored
+    as given, so the table hash is the same as for a `FlexTable` with the same rows.
+    The keys order of each row is kept as a tuple, shared by all the rows with the same keys.
+    Rows are materialized as `ColumnarRow` views on access.
+
+    :param rows: The rows to store.
+    """
+    _columns: dict[str, list]
+    _missing: dict[str, int]
+    # Keys of each row in the insertion order, the equal tuples are shared through `_keys_tuples`
+    _keys: list[tuple[str, ...]]
+    _keys_tuples: dict[tuple[str, ...], tuple[str, ...]]
+    _length: int
+    _version: int
+    # Columns in the order of their first appearance in the rows, valid while `_columns_order_version` matches
+    _columns_order: Optional[list[str]] = None
+    _columns_order_version: int = -1
+
+    def __init__(self, rows: Iterable[Mapping[str, FlexTableValue]] = ()):
+        self._columns = {}
+        self._missing = {}
+        self._keys = []
+        self._keys_tuples = {}
+        self._length = 0
+        self._version = 0
+        self.extend(rows)
+
+    @property
+    def version(self) -> int:
+        """
+        :return: The counter, which changes on any change of the rows.
+        """
+        return self._version
+
+    @property
+    def columns(self) -> list[str]:
+        """
+        :return: The list of columns in the order of their first appearance in the rows, as in `FlexTable`.
+        """
+        if self._columns_order_version != self._version:
+            columns = {}
+            seen_keys = set()
+            # Keys tuples are shared between the rows, so each distinct tuple is scanned once
+            for keys in self._keys:
+                if id(keys) not in seen_keys:
+                    seen_keys.add(id(keys))
+                    columns.update(dict.fromkeys(keys))
+            self._columns_order = list(columns)
+            self._columns_order_version = self._version
+        return list(self._columns_order)
+
+    def column_values(self, column: str) -> list[FlexTableValue]:
+        """
+        :return: The list of values in the given column, absent cells are replaced with `EMPTY_VALUE`.
+        """
+        cells = self._columns.get(column)
+        if cells is None:
+            return [EMPTY_VALUE] * self._length
+        if not self._missing[column]:
+            return list(cells)
+        return [EMPTY_VALUE if value is _MISSING else value for value in cells]
+
+    def iter_matching_positions(self, query: CompiledQuery, positions: Optional[Iterable[int]] = None) -> Iterator[int]:
+        """
+        Evaluates the query directly on the columns cells, without materializing the rows.
+
+        :param query: The query to evaluate.
+        :param positions: The positions of the rows to check, all the rows by default.
+        :return: The iterator over positions of the rows matching the query.
+        """
+        columns = [(self._columns.get(column, ()), matcher) for column, matcher in query.matchers]
+        if positions is None:
+            positions = range(self._length)
+        for index in positions:
+            for cells, matcher in columns:
+                value = cells[index] if cells else EMPTY_VALUE
+                if not matcher(EMPTY_VALUE if value is _MISSING else value):
+                    break
+            else:
+                yield index
+
+    def set_column(self, column: str, value: FlexTableValue):
+        """
+        Sets the given value to the column in all the rows.
+        """
+        if not self._length:
+            return
+        cells = self._get_or_create_column(column)
+        if self._missing[column]:
+            self._map_keys(lambda keys: keys if column in keys else keys + (column,))
+        cells[:] = [value] * self._length
+        self._missing[column] = 0
+        self._version += 1
+
+    def remove_column(self, column: str):
+        """
+        Removes the given column from all the rows.
+        """
+        if self._columns.pop(column, None) is None:
+            return
+        self._missing.pop(column)
+        self._map_keys(lambda keys: tuple(key for key in keys if key != column))
+        self._version += 1
+
+    def _shared_keys(self, keys: tuple[str, ...]) -> tuple[str, ...]:
+        return self._keys_tuples.setdefault(keys, keys)
+
+    def _map_keys(self, function: Callable[[tuple[str, ...]], tuple[str, ...]]):
+        """
+        Applies the function once to each distinct keys tuple and replaces the keys of the rows with the results.
+        """
+        previous_keys_tuples, self._keys_tuples = self._keys_tuples, {}
+        mapping = {keys: self._shared_keys(function(keys)) for keys in previous_keys_tuples}
+        self._keys = [mapping[keys] for keys in self._keys]
+
+    def _get_or_create_column(self, column: str) -> list:
+        cells = self._columns.get(column)
+        if cells is None:
+            column = sys.intern(column)
+            cells = [_MISSING] * self._length
+            self._columns[column] = cells
+            self._missing[column] = self._length
+        return cells
+
+    def _set_cell(self, index: int, column: str, value: Any):
+        cells = self._get_or_create_column(column)
+        self._version += 1
+        was_missing = cells[index] is _MISSING
+        cells[index] = value
+        if was_missing and value is not _MISSING:
+            self._missing[column] -= 1
+            self._keys[index] = self._shared_keys(self._keys[index] + (column,))
+        elif not was_missing and value is _MISSING:
+            self._missing[column] += 1
+            self._keys[index] = self._shared_keys(tuple(key for key in self._keys[index] if key != column))
+
+    def _row_as_dict(self, index: int) -> FlexTableRow:
+        columns = self._columns
+        return {column: columns[column][index] for column in self._keys[index]}
+
+    def _normalize_index(self, index: int) -> int:
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError('list index out of range')
+        return index
+
+    def _take(self, indexes: list[int]) -> 'ColumnarRows':
+        new_storage = ColumnarRows()
+        new_storage._length = len(indexes)
+        new_storage._keys = [self._keys[i] for i in indexes]
+        new_storage._keys_tuples = {keys: keys for keys in new_storage._keys}
+        for column, cells in self._columns.items():
+            new_cells = [cells[i] for i in indexes]
+            missing = new_cells.count(_MISSING)
+            if missing < len(new_cells):
+                new_storage._columns[column] = new_cells
+                new_storage._missing[column] = missing
+        return new_storage
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[ColumnarRow, 'ColumnarRows']:
+        if isinstance(index, slice):
+            return self._take(list(range(self._length))[index])
+        return ColumnarRow(self, self._normalize_index(index))
+
+    def __setitem__(self, index: Union[int, slice], row: Union[Mapping, Iterable[Mapping]]):
+        if isinstance(index, slice):
+            rows = [dict(r) for r in row]
+            start = index.indices(self._length)[0]
+            del self[index]
+            for offset, new_row in enumerate(rows):
+                self.insert(start + offset, new_row)
+            return
+        index = self._normalize_index(index)
+        row = dict(row)
+        self._version += 1
+        for column, cells in self._columns.items():
+            if column not in row and cells[index] is not _MISSING:
+                cells[index] = _MISSING
+                self._missing[column] += 1
+        for column, value in row.items():
+            self._set_cell(index, column, value)
+        self._keys[index] = self._shared_keys(tuple(row))
+
+    def __delitem__(self, index: Union[int, slice]):
+        if isinstance(index, slice):
+            for i in sorted(range(self._length)[index], reverse=True):
+                del self[i]
+            return
+        index = self._normalize_index(index)
+        for column, cells in self._columns.items():
+            if cells.pop(index) is _MISSING:
+                self._missing[column] -= 1
+        del self._keys[index]
+        self._length -= 1
+        self._version += 1
+
+    def __iter__(self) -> Iterator[ColumnarRow]:
+        for index in range(self._length):
+            yield ColumnarRow(self, index)
+
+    def insert(self, index: int, row: Mapping[str, FlexTableValue]):
+        if index < 0:
+            index = max(index + self._length, 0)
+        index = min(index, self._length)
+        for column, cells in self._columns.items():
+            cells.insert(index, _MISSING)
+            self._missing[column] += 1
+        self._keys.insert(index, self._shared_keys(()))
+        self._length += 1
+        self._version += 1
+        for column, value in row.items():
+            self._set_cell(index, column, value)
+
+    def append(self, row: Mapping[str, FlexTableValue]):
+        length = self._length
+        columns = self._columns
+        for column, value in row.items():
+            cells = columns.get(column)
+            if cells is None:
+                cells = self._get_or_create_column(column)
+            cells.append(value)
+        keys = tuple(row)
+        self._keys.append(self._keys_tuples.setdefault(keys, keys))
+        self._length = length + 1
+        self._version += 1
+        if len(row) != len(columns):
+            for column, cells in columns.items():
+                if len(cells) == length:
+                    cells.append(_MISSING)
+                    self._missing[column] += 1
+
+    def pop(self, index: int = -1) -> FlexTableRow:
+        index = self._normalize_index(index)
+        row = self._row_as_dict(index)
+        del self[index]
+        return row
+
+    def clear(self):
+        self._columns.clear()
+        self._missing.clear()
+        self._keys.clear()
+        self._keys_tuples.clear()
+        self._length = 0
+        self._version += 1
+
+    def reverse(self):
+        for cells in self._columns.values():
+            cells.reverse()
+        self._keys.reverse()
+        self._version += 1
+
+    def sort(self, *, key: Optional[Callable[[FlexTableRow], Any]] = None, reverse: bool = False):
+        if key is None:
+            order = sorted(range(self._length), key=lambda i: ColumnarRow(self, i), reverse=reverse)
+        else:
+            order = sorted(range(self._length), key=lambda i: key(ColumnarRow(self, i)), reverse=reverse)
+        for column, cells in self._columns.items():
+            cells[:] = [cells[i] for i in order]
+        keys = self._keys
+        self._keys = [keys[i] for i in order]
+        self._version += 1
+
+    def copy(self) -> 'ColumnarRows':
+        return copy.copy(self)
+
+    def __copy__(self) -> 'ColumnarRows':
+        new_storage = ColumnarRows()
+        new_storage._columns = {column: list(cells) for column, cells in self._columns.items()}
+        new_storage._missing = dict(self._missing)
+        new_storage._keys = list(self._keys)
+        new_storage._keys_tuples = dict(self._keys_tuples)
+        new_storage._length = self._length
+        return new_storage
+
+    def __deepcopy__(self, memodict=None) -> 'ColumnarRows':
+        new_storage = self.__copy__()
+        for column, cells in new_storage._columns.items():
+            cells[:] = [value if value is _MISSING else copy.deepcopy(value, memodict) for value in cells]
+        return new_storage
+
+    def __eq__(self, other):
+        if not isinstance(other, (ColumnarRows, list, tuple)):
+            return NotImplemented
+        return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+
+    def __repr__(self):
+        return repr([self._row_as_dict(i) for i in range(self._length)])
+
+
+class ColumnarFlexTable(FlexTable):
+    """
+    FlexTable keeping its data column by column.
+
+    It has the same interface as `FlexTable`, but takes about half the memory for long tables
+    and reads the whole columns (`table["Price"]`) at the list copying speed.
+
+    Rows are returned as lightweight `ColumnarRow` views, which support the mapping interface and
+    write changes through to the table. The views are bound to the row position, so they must not be kept
+    after the rows of the table are inserted, removed or reordered.
+    Slices and query results are independent copies of the data.
+
+    :param rows: The rows of the table.
+    """
+    _data: ColumnarRows
+
+    @property
+    def columns(self):
+        """
+        :return: The list of table columns names.
+        """
+        return self._data.columns
+
+    def _column_values(self, column: str) -> list[FlexTableValue]:
+        if not isinstance(column, str):
+            raise TypeError(f"Invalid column name type: {type(column)}")
+        return self._data.column_values(column)
+
+    def _meaningful_columns(self) -> list[str]:
+        return sorted(column for column in self._data.columns if any(self._data.column_values(column)))
+
+    def _rows_values(self, columns: list[str]) -> Iterator[tuple[FlexTableValue, ...]]:
+        return zip(*(self._data.column_values(column) for column in columns))
+
+    def remove_columns(self, columns: Iterable[str]) -> None:
+        """
+        Removes the given columns from all the rows of the table.
+        """
+        for column in columns:
+            self._data.remove_column(column)
+
+    def _matching_rows(self, query: CompiledQuery) -> Iterator[ColumnarRow]:
+        positions, is_exact = self._indexed_positions(query)
+        if not is_exact:
+            positions = self._data.iter_matching_positions(query, positions)
+        return (ColumnarRow(self._data, i) for i in positions)
+
+    def _rows_version(self) -> int:
+        return self._data.version
+
+    def to_flex_table(self) -> FlexTable:
+        """
+        :return: A regular row-oriented FlexTable with the same data.
+        """
+        return FlexTable(dict(row) for row in self._data)
+
+    def __setitem__(self, idx: Union[int, str], value):
+        if isinstance(idx, str):
+            self._data.set_column(idx, value)
+            return
+        super().__setitem__(idx, value)
+
+    def __copy__(self):
+        new_instance = ColumnarFlexTable()
+        new_instance._data = self._data.copy()
+        return new_instance
+
+    def __deepcopy__(self, memodict=None):
+        new_instance = ColumnarFlexTable()
+        new_instance._data = copy.deepcopy(self._data, memodict)
+        return new_instance
+
+    @staticmethod
+    def _new_storage(rows: Iterable[FlexTableRow] = ()) -> ColumnarRows:
+        return ColumnarRows(rows)
+
+    def _format_entry(self, entry: Mapping) -> Mapping:
+        return entry
@@ -1,12 +1,15 @@
 import copy
-from collections.abc import Iterable, Mapping, Sequence, Callable
-from typing import Union, overload, Any
+from collections.abc import Iterable, Iterator, Mapping, Sequence, MutableSequence, Callable
+from itertools import chain, filterfalse, repeat
+from typing import Union, overload, Any, Optional
 
-from tabbyset.utils.flex_table.table_queries import parse_dict_query, QueryStatement, apply_query_to_dict, DictQuery
-from tabbyset.utils.dhash import dhash
+from tabbyset.utils.flex_table.table_queries import parse_dict_query, QueryStatement, CompiledQuery, DictQuery
+from tabbyset.utils.dhash import dhash_table
 from .typing import FlexTableValue, FlexTableRow
 from .utils import flex_table_to_tabular_data, ascii_table
 from .constants import EMPTY_VALUE
+from .indexes import HashIndex, SortedIndex, intersect_positions
+from .numeric import NumericColumn, NumericDtype, to_numeric_column
 
 Query = dict[str, Union[QueryStatement, FlexTableValue]]
 Entry = Mapping[str, FlexTableValue]
@@ -18,21 +21,36 @@ class FlexTable(Sequence[FlexTableRow]):
 
     Flexible columns mean that each row can have different columns.
 
+    The table keeps the data derived from its rows: the columns, the hash, the indexes and the numeric columns.
+    It is updated by the methods of the table, so the rows should be changed through them
+    (e.g. `table["Price"] = 1`, `table[0] = {...}`, `table.remove_column("Price")`).
+    The rows are stored as they are given, so they are shared with the caller, the copies of the table
+    and the query results. Changing a row directly (e.g. `table[0]["Price"] = 1`) is not seen by the table,
+    so `invalidate_caches` must be called after such changes. Then the table rescans all its rows on the next
+    access to the derived data, which costs as much as the first access.
+
     :param rows: The rows of the table.
     """
-    _data: list[FlexTableRow]
+    _data: MutableSequence[FlexTableRow]
+    # Counter of the changes of the rows values made by the table methods
+    _version: int = 0
+    # Ordered set of columns, None if it has to be rebuilt
+    _columns_index: Optional[dict[str, None]] = None
+    # Indexes created with `create_index`, rebuilt lazily when the rows version changes
+    _indexes: Optional[dict[str, HashIndex]] = None
+    # Deterministic hash of the table, valid while `_hash_version` matches the rows version
+    _hash: Optional[int] = None
+    _hash_version: int = -1
+    # Columns converted by `numeric_column`, keyed by the column and the dtype, valid on the same terms as the hash
+    _numeric_columns: Optional[dict[tuple[str, str], NumericColumn]] = None
+    _numeric_columns_version: int = -1
 
     @property
     def columns(self):
         """
         :return: The list of table columns names.
         """
-        columns: dict[str, None] = {}
-        for row in self._data:
-            for key in row:
-                if key not in columns:
-                    columns[key] = None
-        return list(columns.keys())
+        return list(self._get_columns_index())
 
     @property
     def EMPTY_VALUE(self):
@@ -51,7 +69,7 @@ class FlexTable(Sequence[FlexTableRow]):
     def __init__(self, rows: Iterable[FlexTableRow] = None) -> None:
         if rows is None:
             rows = []
-        self._data = []
+        self._data = self._new_storage()
         self.extend(rows)
 
     def query(self, query: Query) -> 'FlexTable':
@@ -106,13 +124,18 @@ class FlexTable(Sequence[FlexTableRow]):
 
         For example, the following will return all rows with "Action" equal to "Quote" and "Price" greater than 100.:
             >>> table.query({"Action": "Quote", "Price": "> 100"})
+
+        **Indexes**
+
+        Tables queried many times can be indexed to avoid scanning all the rows for each query:
+            >>> table.create_index("Action")
+            >>> table.create_index("Price", ordered=True)
         """
         return self._query(query)
 
     def _query(self, query: DictQuery) -> 'FlexTable':
         if isinstance(query, dict):
-            query = parse_dict_query(query)
-            return FlexTable([row for row in self._data if apply_query_to_dict(query, row)])
+            return type(self)(list(self._matching_rows(parse_dict_query(query))))
         raise TypeError(f"Invalid query type: {type(query)}")
 
     def column_values(self, column: str) -> list[FlexTableValue]:
@@ -126,6 +149,34 @@ class FlexTable(Sequence[FlexTableRow]):
             raise TypeError(f"Invalid column name type: {type(column)}")
         return [row.get(column, EMPTY_VALUE) for row in self._data]
 
+    def numeric_column(self, column: str, dtype: NumericDtype = 'float64') -> NumericColumn:
+        """
+        Converts the values of the column to a typed array of numbers for the fast aggregations.
+
+        The arrays are NumPy arrays if NumPy is installed, otherwise `array.array`:
+            >>> prices = table.numeric_column("Price")
+            >>> total = prices.values.sum()  # With NumPy
+            >>> total = sum(prices.values)   # Without NumPy
+
+        Empty cells are filled with zeros and flagged in the mask.
+        The result is cached until the table is changed, so the arrays must not be modified.
+
+        :param column: The column to convert.
+        :param dtype: The type of the numbers, `"float64"` or `"int64"`.
+        :return: The values and the mask of the empty cells.
+        :raises ValueError: If the column contains a non-empty value, which is not a number of the type.
+        """
+        rows_version = self._rows_version()
+        if self._numeric_columns is None or self._numeric_columns_version != rows_version:
+            self._numeric_columns = {}
+            self._numeric_columns_version = rows_version
+        key = (column, dtype)
+        numeric_column = self._numeric_columns.get(key)
+        if numeric_column is None:
+            numeric_column = to_numeric_column(column, self._column_values(column), dtype)
+            self._numeric_columns[key] = numeric_column
+        return numeric_column
+
     def contains(self, query: DictQuery) -> bool:
         """
         Checks if the table contains rows matching with the given query.
@@ -137,29 +188,47 @@ class FlexTable(Sequence[FlexTableRow]):
         Inserts a row to the table at the given index.
         returns: The table itself.
         """
+        if idx >= len(self._data):
+            return self.append(row)
         self._data.insert(idx, self._format_entry(row))
+        # Inserted row may change the order of columns appearance and shifts the rows positions
+        self._invalidate_caches()
         return self
 
     def append(self, row: Entry) -> 'FlexTable':
         """
         Appends a row to the table.
         """
-        self._data.append(self._format_entry(row))
+        row = self._format_entry(row)
+        rows_version = self._rows_version()
+        self._data.append(row)
+        self._invalidate_values_caches()
+        self._update_columns_index((row,))
+        self._update_indexes((row,), rows_version)
         return self
 
     def extend(self, rows: Iterable[Entry]) -> 'FlexTable':
         """
         Extends the table with the given rows.
         """
-        for row in rows:
-            self.append(row)
+        format_entry = self._format_entry
+        new_rows = [format_entry(row) for row in rows]
+        rows_version = self._rows_version()
+        self._data.extend(new_rows)
+        self._invalidate_values_caches()
+        self._update_columns_index(new_rows)
+        self._update_indexes(new_rows, rows_version)
         return self
 
     def count(self, query: Query) -> int:
         """
         :return: The number of rows matching the given query.
         """
-        return len(self.query(query))
+        compiled_query = parse_dict_query(query)
+        positions, is_exact = self._indexed_positions(compiled_query)
+        if is_exact:
+            return len(positions)
+        return sum(1 for _ in self._matching_rows(compiled_query))
 
     def index(self, query: Query, start = 0, stop: int = None) -> int:
         """
@@ -167,8 +236,13 @@ class FlexTable(Sequence[FlexTableRow]):
 
         If the value is not found, a ValueError is raised.
         """
-        for i in range(start, stop or len(self)):
-            if apply_query_to_dict(parse_dict_query(query), self[i]):
+        compiled_query = parse_dict_query(query)
+        stop = stop or len(self)
+        positions, is_exact = self._indexed_positions(compiled_query)
+        if positions is None:
+            positions = range(start, stop)
+        for i in positions:
+            if start <= i < stop and (is_exact or compiled_query(self._data[i])):
                 return i
         raise ValueError(f"Value not found: {query}")
 
@@ -176,13 +250,16 @@ class FlexTable(Sequence[FlexTableRow]):
         """
         Removes the row at the given index (default last) and returns it.
         """
-        return self._data.pop(idx)
+        row = self._data.pop(idx)
+        self._invalidate_caches()
+        return row
 
     def remove(self, query: Query) -> 'FlexTable':
         """
         Removes the rows matching the given query.
         """
-        self._data = [row for row in self._data if not apply_query_to_dict(parse_dict_query(query), row)]
+        self._data = self._new_storage(filterfalse(parse_dict_query(query), self._data))
+        self._invalidate_caches()
         return self
 
     def clear(self) -> None:
@@ -190,12 +267,14 @@ class FlexTable(Sequence[FlexTableRow]):
         Clears the table.
         """
         self._data.clear()
+        self._invalidate_caches()
 
     def reverse(self) -> 'FlexTable':
         """
         Reverses the table.
         """
         self._data.reverse()
+        self._invalidate_caches()
         return self
 
     def sort(self, *, key: Callable[[FlexTableRow], Any]=None, reverse=False) -> 'FlexTable':
@@ -203,6 +282,7 @@ class FlexTable(Sequence[FlexTableRow]):
         Sorts the table.
         """
         self._data.sort(key=key, reverse=reverse)
+        self._invalidate_caches()
         return self
 
     def remove_column(self, column: str) -> None:
@@ -215,9 +295,66 @@ class FlexTable(Sequence[FlexTableRow]):
         """
         Removes the given columns from all the rows of the table.
         """
+        columns = list(columns)
         for row in self._data:
             for column in columns:
                 row.pop(column, None)
+        self._invalidate_values_caches()
+        if self._columns_index is not None:
+            for column in columns:
+                self._columns_index.pop(column, None)
+
+    def create_index(self, column: str, ordered: bool = False) -> 'FlexTable':
+        """
+        Creates an index on the given column.
+
+        Queries with equality statements (`"<value>"`, `"= <value>"`) on the indexed columns
+        look up the matching rows in the index instead of scanning the whole table.
+        The ordered index additionally answers numeric comparisons (`"> 100"`, `"<= 99.5"`, etc.) by bisection.
+        It is useful when the same table is queried many times.
+
+        The index is built on the first query using it. Appended rows are added to the index,
+        any other change of the table makes it to be rebuilt on the next query.
+        Copies of the table and query results are not indexed.
+
+        :param column: The column to index.
+        :param ordered: Whether the index should answer the numeric comparisons.
+                        It replaces the existing index of the other kind.
+        :return: The table itself.
+        """
+        if not isinstance(column, str):
+            raise TypeError(f"Invalid column name type: {type(column)}")
+        if self._indexes is None:
+            self._indexes = {}
+        index_type = SortedIndex if ordered else HashIndex
+        if type(self._indexes.get(column)) is not index_type:
+            self._indexes[column] = index_type(column)
+        return self
+
+    def drop_index(self, column: str) -> 'FlexTable':
+        """
+        Removes the index from the given column, if it exists.
+
+        :return: The table itself.
+        """
+        if self._indexes:
+            self._indexes.pop(column, None)
+        return self
+
+    @property
+    def indexed_columns(self) -> list[str]:
+        """
+        :return: The list of columns having an index.
+        """
+        return list(self._indexes or ())
+
+    def invalidate_caches(self) -> None:
+        """
+        Drops the data derived from the rows (the columns, the hash, the indexes and the numeric columns).
+
+        Must be called after the rows are changed directly, not through the methods of the table.
+        """
+        self._invalidate_caches()
 
     def copy(self, deep: bool = False) -> 'FlexTable':
         """
@@ -239,18 +376,27 @@ class FlexTable(Sequence[FlexTableRow]):
         return sorted(self.columns) == sorted(other.columns) and tuple(self) == tuple(other)
 
     def __repr__(self):
-        return f'FlexTable({self._data})'
+        return f'{type(self).__name__}({self._data})'
 
     def __len__(self):
         return len(self._data)
 
     def __setitem__(self, idx: Union[int, str], value):
         if isinstance(idx, int):
-            self._data[idx] = dict(value)
+            self._data[idx] = self._format_entry(value)
+            self._invalidate_caches()
             return
         if isinstance(idx, str):
+            first_row_length = len(self._data[0]) if self._data else 0
+            is_in_first_row = bool(self._data) and idx in self._data[0]
             for row in self._data:
                 row[idx] = value
+            self._invalidate_values_caches()
+            if self._columns_index is not None and self._data and not is_in_first_row:
+                # The first row defines the beginning of the columns order
+                columns = list(self._columns_index)
+                columns.insert(first_row_length, idx)
+                self._columns_index = dict.fromkeys(columns)
             return
         raise TypeError("Invalid index type")
 
@@ -276,7 +422,7 @@ class FlexTable(Sequence[FlexTableRow]):
         if isinstance(idx, int):
             return self._data[idx]
         if isinstance(idx, slice):
-            return FlexTable(self._data[idx])
+            return type(self)(self._data[idx])
         if isinstance(idx, str):
             return self._column_values(idx)
         if isinstance(idx, dict):
@@ -286,6 +432,7 @@ class FlexTable(Sequence[FlexTableRow]):
     def __delitem__(self, idx: Union[int, str]):
         if isinstance(idx, int):
             del self._data[idx]
+            self._invalidate_caches()
             return
         if isinstance(idx, str):
             self.remove_column(idx)
@@ -295,13 +442,18 @@ class FlexTable(Sequence[FlexTableRow]):
         return iter(self._data)
 
     def __contains__(self, item: DictQuery) -> bool:
-        query = parse_dict_query(item)
-        for it in self._data:
-            if apply_query_to_dict(query, it):
-                return True
+        compiled_query = parse_dict_query(item)
+        positions, is_exact = self._indexed_positions(compiled_query)
+        if is_exact:
+            return bool(positions)
+        for _ in self._matching_rows(compiled_query):
+            return True
+        return False
 
     def __copy__(self):
         new_instance = FlexTable(self._data.copy())
+        if self._columns_index is not None:
+            new_instance._columns_index = self._columns_index.copy()
         return new_instance
 
     def __deepcopy__(self, memodict=None):
@@ -327,15 +479,117 @@ class FlexTable(Sequence[FlexTableRow]):
         return self
 
     def __hash__(self) -> int:
-        columns = self.columns
-        meaningful_columns = set(columns)
-        for column in set(columns):
-            if not any(self.column_values(column)):
-                meaningful_columns.remove(column)
-        meaningful_columns = sorted(meaningful_columns)
-        tabular_data = flex_table_to_tabular_data(meaningful_columns, self)
-        tabular_data = tuple(tuple(row) for row in tabular_data)
-        return dhash(tabular_data)
+        rows_version = self._rows_version()
+        if self._hash is None or self._hash_version != rows_version:
+            columns = self._meaningful_columns()
+            self._hash = dhash_table(columns, self._rows_values(columns))
+            self._hash_version = rows_version
+        return self._hash
+
+    def _meaningful_columns(self) -> list[str]:
+        """
+        :return: The sorted columns having at least one non-empty value.
+        """
+        filled_columns = set()
+        for row in self._data:
+            for column, value in row.items():
+                if value:
+                    filled_columns.add(column)
+        return sorted(filled_columns)
+
+    def _rows_values(self, columns: list[str]) -> Iterator[tuple[FlexTableValue, ...]]:
+        """
+        :return: The values of the given columns for each row, absent cells are replaced with `EMPTY_VALUE`.
+        """
+        empty_values = repeat(EMPTY_VALUE)
+        return (tuple(map(row.get, columns, empty_values)) for row in self._data)
+
+    def _matching_rows(self, query: CompiledQuery) -> Iterator[FlexTableRow]:
+        positions, is_exact = self._indexed_positions(query)
+        if positions is None:
+            return filter(query, self._data)
+        rows = map(self._data.__getitem__, positions)
+        if is_exact:
+            return rows
+        return filter(query, rows)
+
+    def _indexed_positions(self, query: CompiledQuery) -> tuple[Optional[list[int]], bool]:
+        """
+        :return: The sorted positions of the candidate rows found by the indexes (None if no index is applicable)
+                 and whether all the candidates are known to match the query.
+        """
+        if not self._indexes:
+            return None, False
+        rows_version = self._rows_version()
+        found = []
+        is_exact = True
+        for column, statement in query.items():
+            index = self._indexes.get(column)
+            if index is None or not index.can_answer(statement):
+                is_exact = False
+                continue
+            if not index.is_valid(rows_version):
+                index.build(self._column_values(column), rows_version)
+            positions, is_statement_exact = index.lookup(statement)
+            if positions is None:
+                return None, False
+            found.append(positions)
+            is_exact = is_exact and is_statement_exact
+        if not found:
+            return None, False
+        return intersect_positions(found), is_exact
+
+    def _rows_version(self) -> int:
+        """
+        :return: The counter, which changes on any change of the rows values made by the table.
+        """
+        return self._version
+
+    def _update_indexes(self, new_rows: Sequence[FlexTableRow], previous_rows_version: int) -> None:
+        if not self._indexes:
+            return
+        rows_version = self._rows_version()
+        for column, index in self._indexes.items():
+            if index.is_valid(previous_rows_version):
+                index.add((row.get(column, EMPTY_VALUE) for row in new_rows), rows_version)
+            else:
+                index.invalidate()
+
+    def _get_columns_index(self) -> dict[str, None]:
+        if self._columns_index is None:
+            self._columns_index = dict.fromkeys(chain.from_iterable(self._data))
+        return self._columns_index
+
+    def _update_columns_index(self, new_rows: Iterable[FlexTableRow]) -> None:
+        # Dropped index is rebuilt on the next access, so only the existing one is worth updating
+        if self._columns_index is not None:
+            self._columns_index.update(dict.fromkeys(chain.from_iterable(new_rows)))
+
+    def _invalidate_columns_index(self) -> None:
+        self._columns_index = None
+
+    def _invalidate_values_caches(self) -> None:
+        """
+        Drops the data derived from the values of the rows, should be called when the values are changed.
+        The indexes are kept valid only if they are updated right after the call.
+        """
+        self._version += 1
+        self._hash = None
+        self._numeric_columns = None
+
+    def _invalidate_caches(self) -> None:
+        """
+        Drops the data derived from the rows, should be called when rows are inserted, removed or reordered.
+        """
+        self._invalidate_columns_index()
+        self._invalidate_values_caches()
+        if self._indexes:
+            for index in self._indexes.values():
+                index.invalidate()
+
+    @staticmethod
+    def _new_storage(rows: Iterable[FlexTableRow] = ()) -> MutableSequence[FlexTableRow]:
+        return list(rows)
 
     @staticmethod
     def _add_generic(table: 'FlexTable', other: Union[
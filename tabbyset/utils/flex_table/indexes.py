@@ -0,0 +1,184 @@
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterable
+from decimal import Decimal
+from itertools import chain
+from typing import Optional
+
+from .table_queries import QueryStatement, Equal, GreaterThan, GreaterThanOrEqual, LessThan, LessThanOrEqual
+from .typing import FlexTableValue
+
+_NO_KEY = object()
+
+
+class _NaN:
+    """
+    Key of the NaN values in the index, as NaN is not equal even to itself.
+    """
+    __slots__ = ()
+
+
+_NAN = _NaN()
+
+
+def index_key(value: FlexTableValue) -> FlexTableValue:
+    """
+    :return: The value as it is compared by the query statements (numbers are cast to `Decimal`).
+    """
+    try:
+        return QueryStatement._try_number_cast(value)
+    except TypeError:
+        # Values which can't be cast are compared as is
+        return value
+
+
+class HashIndex:
+    """
+    Mapping of the column values to the positions of the rows having them.
+
+    The index answers `Equal` statements on the column without scanning the rows.
+    It is valid only for the version of the rows it was built for, see `FlexTable.create_index`.
+
+    :param column: The indexed column.
+    """
+    column: str
+    _positions: Optional[dict[FlexTableValue, list[int]]]
+    _version: Optional[int]
+    _length: int
+
+    def __init__(self, column: str):
+        self.column = column
+        self._positions = None
+        self._version = None
+        self._length = 0
+
+    def is_valid(self, version: int) -> bool:
+        return self._positions is not None and self._version == version
+
+    def build(self, values: Iterable[FlexTableValue], version: int) -> None:
+        """
+        Builds the index from the column values of all the rows.
+        """
+        self._positions = {}
+        self._length = 0
+        self.add(values, version)
+
+    def add(self, values: Iterable[FlexTableValue], version: int) -> None:
+        """
+        Adds the column values of the rows appended to the end of the table.
+        """
+        positions = self._positions
+        # Most of the cells repeat, so each distinct value is cast only once
+        keys: dict[FlexTableValue, FlexTableValue] = {}
+        length = self._length
+        for position, value in enumerate(values, length):
+            length = position + 1
+            key = keys.get(value, _NO_KEY)
+            if key is _NO_KEY:
+                key = keys[value] = index_key(value)
+                if type(key) is Decimal and key.is_nan():
+                    key = keys[value] = _NAN
+            rows = positions.get(key)
+            if rows is None:
+                positions[key] = [position]
+            else:
+                rows.append(position)
+        self._length = length
+        self._version = version
+
+    def invalidate(self) -> None:
+        self._positions = None
+
+    @staticmethod
+    def can_answer(statement: QueryStatement) -> bool:
+        """
+        :return: Whether the matching rows for the statement can be looked up in the index.
+        """
+        # Subclasses of the statements may redefine the comparison, so only the exact type is trusted
+        return type(statement) is Equal
+
+    def lookup(self, statement: QueryStatement) -> tuple[Optional[list[int]], bool]:
+        """
+        :return: The sorted positions of the candidate rows for the statement (None if the statement
+                 must be checked on all the rows) and whether all of them are known to match it.
+        """
+        base_value = statement._base_value
+        if type(base_value) is Decimal and base_value.is_nan():
+            # NaN is never equal to anything
+            return [], True
+        return self._positions.get(base_value, []), True
+
+
+class SortedIndex(HashIndex):
+    """
+    Index of the column values, which additionally keeps the numeric values sorted.
+
+    Besides `Equal` statements, the index answers numeric comparisons (`"> 100"`, `"<= 99.5"`, etc.)
+    by bisection, so their cost depends on the number of the matching rows rather than the table size.
+
+    Non-numeric cells (including the empty ones) can't be compared with numbers, so the comparisons on the column
+    having them fall back to the full scan of the table, which raises the same error as without the index.
+
+    :param column: The indexed column.
+    """
+    _RANGE_STATEMENTS = (GreaterThan, GreaterThanOrEqual, LessThan, LessThanOrEqual)
+    # Distinct numeric values in ascending order and whether there are non-numeric values
+    _sorted_keys: Optional[list[Decimal]]
+    _has_incomparable: bool
+
+    def __init__(self, column: str):
+        super().__init__(column)
+        self._sorted_keys = None
+        self._has_incomparable = False
+
+    def add(self, values: Iterable[FlexTableValue], version: int) -> None:
+        super().add(values, version)
+        self._sorted_keys = None
+
+    @classmethod
+    def can_answer(cls, statement: QueryStatement) -> bool:
+        if type(statement) in cls._RANGE_STATEMENTS:
+            return type(statement._base_value) is Decimal and not statement._base_value.is_nan()
+        return super().can_answer(statement)
+
+    def lookup(self, statement: QueryStatement) -> tuple[Optional[list[int]], bool]:
+        statement_type = type(statement)
+        if statement_type not in self._RANGE_STATEMENTS:
+            return super().lookup(statement)
+        if self._sorted_keys is None:
+            self._sort_keys()
+        if self._has_incomparable:
+            # Full scan raises on the first non-numeric cell it compares, which depends on the other statements
+            return None, False
+        keys = self._sorted_keys
+        base_value = statement._base_value
+        if statement_type is GreaterThan:
+            matching_keys = keys[bisect_right(keys, base_value):]
+        elif statement_type is GreaterThanOrEqual:
+            matching_keys = keys[bisect_left(keys, base_value):]
+        elif statement_type is LessThan:
+            matching_keys = keys[:bisect_left(keys, base_value)]
+        else:
+            matching_keys = keys[:bisect_right(keys, base_value)]
+        positions = self._positions
+        # Positions of each key are sorted, which makes the merging sort almost linear
+        return sorted(chain.from_iterable(positions[key] for key in matching_keys)), True
+
+    def _sort_keys(self) -> None:
+        numeric_keys = [key for key in self._positions if type(key) is Decimal]
+        numeric_keys.sort()
+        self._sorted_keys = numeric_keys
+        self._has_incomparable = len(numeric_keys) != len(self._positions)
+
+
+def intersect_positions(positions_lists: list[list[int]]) -> list[int]:
+    """
+    :return: The sorted positions present in all the given sorted lists.
+    """
+    positions_lists = sorted(positions_lists, key=len)
+    result = positions_lists[0]
+    for positions in positions_lists[1:]:
+        if not result:
+            break
+        positions_set = set(positions)
+        result = [position for position in result if position in positions_set]
+    return result
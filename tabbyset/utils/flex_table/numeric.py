@@ -0,0 +1,122 @@
+from array import array
+from collections.abc import Callable, Sequence
+from decimal import Decimal
+from itertools import count
+from typing import Literal, NamedTuple, Any
+
+from .constants import EMPTY_VALUE
+from .typing import FlexTableValue
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+NumericDtype = Literal['float64', 'int64']
+
+_ARRAY_TYPECODES = {'float64': 'd', 'int64': 'q'}
+_INT64_MIN = -2 ** 63
+_INT64_MAX = 2 ** 63 - 1
+
+
+class NumericColumn(NamedTuple):
+    """
+    Values of a table column as a typed array.
+
+    The arrays are NumPy arrays if NumPy is installed, otherwise `array.array`.
+    """
+    values: Any
+    """The numbers of the column, empty cells are filled with zeros."""
+    mask: Any
+    """The flags of the empty cells (True for empty)."""
+
+
+def to_numeric_column(column: str, values: Sequence[FlexTableValue], dtype: NumericDtype) -> NumericColumn:
+    """
+    Converts the column values to the numbers of the given type.
+
+    Cells of a column usually repeat, so each distinct value is converted once,
+    and the arrays are filled by the lookups of the converted values.
+
+    :raises ValueError: If the column contains a non-empty value, which is not a number of the type
+                        (e.g. `"1.5"` for `"int64"`).
+    """
+    cast = _CASTS.get(dtype)
+    if cast is None:
+        raise ValueError(f"Unsupported numeric dtype: {dtype}")
+    try:
+        distinct_values = dict.fromkeys(values)
+    except TypeError:
+        # Unhashable values are converted one by one
+        return _to_numeric_column_by_cells(column, values, dtype, cast)
+    numbers = []
+    mask = []
+    for value in distinct_values:
+        is_empty = value is None or value == EMPTY_VALUE
+        mask.append(is_empty)
+        numbers.append(0 if is_empty else _cast_value(column, values, value, dtype, cast))
+    if numpy is not None:
+        codes = dict(zip(distinct_values, count()))
+        cells_codes = numpy.fromiter(map(codes.__getitem__, values), dtype=numpy.intp, count=len(values))
+        numeric_column = NumericColumn(numpy.array(numbers, dtype=dtype)[cells_codes],
+                                       numpy.array(mask, dtype=bool)[cells_codes])
+        numeric_column.values.flags.writeable = False
+        numeric_column.mask.flags.writeable = False
+        return numeric_column
+    numbers_by_value = dict(zip(distinct_values, numbers))
+    mask_by_value = dict(zip(distinct_values, mask))
+    # Arrays are built from lists faster than from iterators
+    return NumericColumn(array(_ARRAY_TYPECODES[dtype], list(map(numbers_by_value.__getitem__, values))),
+                         array('b', list(map(mask_by_value.__getitem__, values))))
+
+
+def _to_numeric_column_by_cells(column: str, values: Sequence[FlexTableValue], dtype: NumericDtype,
+                                cast: Callable[[FlexTableValue], Any]) -> NumericColumn:
+    mask = [value is None or value == EMPTY_VALUE for value in values]
+    numbers = [0 if is_empty else _cast_value(column, values, value, dtype, cast)
+               for value, is_empty in zip(values, mask)]
+    if numpy is not None:
+        numeric_column = NumericColumn(numpy.array(numbers, dtype=dtype), numpy.array(mask, dtype=bool))
+        numeric_column.values.flags.writeable = False
+        numeric_column.mask.flags.writeable = False
+        return numeric_column
+    return NumericColumn(array(_ARRAY_TYPECODES[dtype], numbers), array('b', mask))
+
+
+def _cast_value(column: str, values: Sequence[FlexTableValue], value: FlexTableValue, dtype: NumericDtype,
+                cast: Callable[[FlexTableValue], Any]) -> Any:
+    try:
+        return cast(value)
+    except (ValueError, TypeError, ArithmeticError):
+        position = values.index(value)
+        raise ValueError(f"Value {value!r} of the column {column!r} in the row {position} "
+                         f"is not a number of type {dtype}") from None
+
+
+def _to_int64(value: FlexTableValue) -> int:
+    """
+    Converts the value to an integer, unlike `int` the fractional numbers are not truncated.
+    """
+    if type(value) is int:
+        number = value
+    elif isinstance(value, str):
+        try:
+            number = int(value)
+        except ValueError:
+            number = _integral_to_int(Decimal(value.strip()))
+    elif isinstance(value, (float, Decimal)):
+        number = _integral_to_int(Decimal(value))
+    else:
+        number = int(value)
+    if not _INT64_MIN <= number <= _INT64_MAX:
+        raise OverflowError(f"{number} is out of the int64 range")
+    return number
+
+
+def _integral_to_int(number: Decimal) -> int:
+    if not number.is_finite() or number != number.to_integral_value():
+        raise ValueError(f"{number} is not an integer")
+    return int(number)
+
+
+_CASTS: dict[str, Callable[[FlexTableValue], Any]] = {'float64': float, 'int64': _to_int64}
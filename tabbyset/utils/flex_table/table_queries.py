@@ -1,11 +1,20 @@
+import operator
 from abc import ABC, abstractmethod
+from collections.abc import Callable, Mapping
 from decimal import Decimal, InvalidOperation
+from functools import partial
 from typing import Union, Any
 from .constants import EMPTY_VALUE
 
 from .typing import FlexTableValue
 
 
+ValueMatcher = Callable[[FlexTableValue], bool]
+
+# Limit of the values remembered by a compiled statement, so long-living queries don't grow infinitely
+_MATCHER_CACHE_SIZE = 2 ** 16
+
+
 class QueryStatement(ABC):
     _base_value: FlexTableValue
 
@@ -15,6 +24,28 @@ class QueryStatement(ABC):
     def apply(self, v: FlexTableValue) -> bool:
         return self._apply_to_casted(self._try_number_cast(v), self._base_value)
 
+    def compile(self) -> ValueMatcher:
+        """
+        :return: A function equivalent to `apply`, which remembers the results for the already checked values.
+        """
+        if type(self).apply is not QueryStatement.apply:
+            return self.apply
+        base_value = self._base_value
+        apply_to_casted = self._apply_to_casted
+        try_number_cast = self._try_number_cast
+        cache: dict[FlexTableValue, bool] = {}
+
+        def matcher(v: FlexTableValue) -> bool:
+            result = cache.get(v)
+            if result is None:
+                result = apply_to_casted(try_number_cast(v), base_value)
+                if len(cache) >= _MATCHER_CACHE_SIZE:
+                    cache.clear()
+                cache[v] = result
+            return result
+
+        return matcher
+
     @classmethod
     @abstractmethod
     def _apply_to_casted(cls, v1: FlexTableValue, v2: FlexTableValue) -> bool:
@@ -33,12 +64,23 @@ class Equal(QueryStatement):
     def _apply_to_casted(cls, v1: FlexTableValue, v2: FlexTableValue) -> bool:
         return v1 == v2
 
+    def compile(self) -> ValueMatcher:
+        # Non-numeric string can be equal only to the same string, so the values may be compared without casting
+        if type(self._base_value) is str and type(self).apply is QueryStatement.apply:
+            return partial(operator.eq, self._base_value)
+        return super().compile()
+
 
 class NotEqual(QueryStatement):
     @classmethod
     def _apply_to_casted(cls, v1: FlexTableValue, v2: FlexTableValue) -> bool:
         return v1 != v2
 
+    def compile(self) -> ValueMatcher:
+        if type(self._base_value) is str and type(self).apply is QueryStatement.apply:
+            return partial(operator.ne, self._base_value)
+        return super().compile()
+
 
 class GreaterThan(QueryStatement):
     @classmethod
@@ -88,9 +130,47 @@ def parse_query_statement(query: ParsableQueryStatement) -> QueryStatement:
     return Equal(query)
 
 
-def parse_dict_query(query_dict: DictQuery) -> dict[str, QueryStatement]:
-    return {k: parse_query_statement(v) for k, v in query_dict.items()}
+class CompiledQuery(dict[str, QueryStatement]):
+    """
+    Parsed dictionary query, which can be called as a predicate for the rows.
+
+    Statements are compiled once on creation, so the same instance can be reused for many rows and tables.
+    The query is immutable.
+
+    :param statements: The mapping of column names to the query statements.
+    """
+
+    def __init__(self, statements: Mapping[str, QueryStatement]):
+        super().__init__(statements)
+        self._matchers = tuple((column, statement.compile()) for column, statement in self.items())
+
+    @property
+    def matchers(self) -> tuple[tuple[str, ValueMatcher], ...]:
+        """
+        :return: The pairs of column names and compiled statements for the cell values.
+        """
+        return self._matchers
+
+    def __call__(self, row: Mapping[str, FlexTableValue]) -> bool:
+        for column, matcher in self._matchers:
+            if not matcher(row.get(column, EMPTY_VALUE)):
+                return False
+        return True
+
+    def _immutable(self, *args, **kwargs):
+        raise TypeError(f"{type(self).__name__} is immutable")
+
+    __setitem__ = __delitem__ = __ior__ = _immutable
+    update = pop = popitem = setdefault = clear = _immutable
+
+
+def parse_dict_query(query_dict: DictQuery) -> CompiledQuery:
+    if isinstance(query_dict, CompiledQuery):
+        return query_dict
+    return CompiledQuery({k: parse_query_statement(v) for k, v in query_dict.items()})
 
 
 def apply_query_to_dict(query_dict: dict[str, QueryStatement], value_dict: dict[str, FlexTableValue]) -> bool:
+    if isinstance(query_dict, CompiledQuery):
+        return query_dict(value_dict)
     return all(q.apply(value_dict.get(k, EMPTY_VALUE)) for k, q in query_dict.items())
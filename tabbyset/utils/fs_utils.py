@@ -2,21 +2,35 @@
 File system utilities
 """
 import os.path
-from typing import Literal
+from collections.abc import Iterable, Iterator, Callable
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import Literal, Optional, TypeVar
+from tabbyset.entities.test_case import TestCase
 from tabbyset.file_formats import Csv1Reader, Csv2Reader
 from .folder import Folder, PathParam
+from .tests_cache import TestsFilesCache
 
 
 FileFormat = Literal['csv1', 'csv2']
+T = TypeVar('T')
 
 def walk_tests_folder(folder_path: PathParam, file_format: FileFormat = 'csv1',
                       *,
-                      deep: bool = False):
+                      deep: bool = False,
+                      workers: Optional[int] = None,
+                      ordered: bool = True,
+                      cache: Optional[TestsFilesCache] = None):
     """
     Walk through the test cases in a folder.
     :param folder_path: The path of the folder.
     :param file_format: The format of the test cases files.
     :param deep: If True, walk through all subfolders.
+    :param workers: The number of processes to parse the files in parallel.
+                    By default, the files are parsed one by one in the current process.
+    :param ordered: If False, the test cases of the files parsed in parallel are yielded as soon as
+                    the file is parsed, otherwise in the order of the files.
+    :param cache: The cache of the parsed files. Unchanged files are loaded from it instead of parsing.
     :return: An iterator of tuples with a filepath relative to base folder and its testcases.
     """
     if not os.path.exists(folder_path):
@@ -30,6 +44,7 @@ def walk_tests_folder(folder_path: PathParam, file_format: FileFormat = 'csv1',
         raise ValueError(f"Unknown file format {file_format}")
     if deep:
         file_pattern = f'**/{file_pattern}'
+    files = []
     for file in folder.glob(file_pattern):
         rel_path = os.path.relpath(file, folder.path)
         if file_format == 'csv1':
@@ -38,10 +53,85 @@ def walk_tests_folder(folder_path: PathParam, file_format: FileFormat = 'csv1',
             if any(rel_path.endswith(ext) for ext in [".matrix.csv", ".matrix.d.csv", ".matrix.expected.csv",
                                                       ".Input.csv", ".Trace.csv"]):
                 continue
-            with Csv1Reader(file) as reader:
+        if workers is None and cache is None:
+            with _get_reader_type(file_format)(file) as reader:
                 for tc in reader:
                     yield rel_path, tc
-        elif file_format == 'csv2':
-            with Csv2Reader(file) as reader:
-                for tc in reader:
-                    yield rel_path, tc
\ No newline at end of file
+        else:
+            files.append(file)
+    if files:
+        for file, test_cases in read_tests_files(files, file_format, workers=workers, ordered=ordered, cache=cache):
+            rel_path = os.path.relpath(file, folder.path)
+            for tc in test_cases:
+                yield rel_path, tc
+
+
+def read_tests_files(files: Iterable[PathParam], file_format: FileFormat = 'csv1',
+                     *,
+                     workers: Optional[int] = None,
+                     ordered: bool = True,
+                     cache: Optional[TestsFilesCache] = None) -> Iterator[tuple[Path, list[TestCase]]]:
+    """
+    Read the test cases from the files.
+
+    If `workers` is given, the files are parsed in parallel by a pool of processes.
+    Parsing errors are raised in the calling process as `FileParsingException` with the path of the failed file.
+
+    :param files: The paths of the files.
+    :param file_format: The format of the test cases files.
+    :param workers: The number of processes to parse the files in parallel.
+                    By default, the files are parsed one by one in the current process.
+    :param ordered: If False, the files parsed in parallel are yielded as soon as they are parsed,
+                    otherwise in the given order.
+    :param cache: The cache of the parsed files. Unchanged files are loaded from it instead of parsing.
+    :return: An iterator of tuples with a filepath and its test cases.
+    """
+    # Fails on an unknown format before any file is read
+    _get_reader_type(file_format)
+    yield from _map_files(_read_tests_file, files, file_format, cache, workers=workers, ordered=ordered)
+
+
+def _map_files(function: Callable[..., T], files: Iterable[PathParam], *args,
+               workers: Optional[int] = None,
+               ordered: bool = True) -> Iterator[tuple[Path, T]]:
+    """
+    Calls the function for each file, in parallel by a pool of processes if `workers` is given.
+
+    :return: An iterator of tuples with a filepath and the result of the function for it.
+    """
+    files = [Path(file) for file in files]
+    if workers is None or workers <= 1 or len(files) <= 1:
+        for file in files:
+            yield file, function(file, *args)
+        return
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = {executor.submit(function, file, *args): file for file in files}
+        completed_futures = as_completed(futures) if not ordered else futures
+        try:
+            for future in completed_futures:
+                yield futures[future], future.result()
+        finally:
+            # Generator may be closed before all files are read, so the pending files should not be parsed
+            for future in futures:
+                future.cancel()
+
+
+def _get_reader_type(file_format: FileFormat) -> type:
+    if file_format == 'csv1':
+        return Csv1Reader
+    if file_format == 'csv2':
+        return Csv2Reader
+    raise ValueError(f"Unknown file format {file_format}")
+
+
+def _read_tests_file(file: Path, file_format: FileFormat, cache: Optional[TestsFilesCache] = None) -> list[TestCase]:
+    if cache is None:
+        with _get_reader_type(file_format)(file) as reader:
+            return list(reader)
+    test_cases = cache.get(file, file_format)
+    if test_cases is None:
+        file_stat = os.stat(file)
+        with _get_reader_type(file_format)(file) as reader:
+            test_cases = list(reader)
+        cache.put(file, test_cases, file_format, file_stat=file_stat)
+    return test_cases
@@ -10,8 +10,7 @@ def _get_global_columns_multiheader(tables: Iterable[Iterable[dict]],
                                     categorizer: Categorizer) -> dict[str, list[str]]:
     categorized_columns: dict[str, dict[str, None]] = {}
     for table in tables:
-        if not isinstance(table, FlexTable):
-            table = FlexTable(table)
+        # The rows are only scanned once, so there is no need to wrap them into a FlexTable
         for row in table:
             category_name = categorizer(row)
             if category_name not in categorized_columns:
@@ -24,9 +23,13 @@ def _get_global_columns_multiheader(tables: Iterable[Iterable[dict]],
 
 
 def _get_global_columns_plain(tables: Iterable[Iterable[dict]]) -> list[str]:
-    CATEGORY_LABEL = 'UNDEFINED'
-    categorized_columns = _get_global_columns_multiheader(tables=tables, categorizer=lambda _: CATEGORY_LABEL)
-    return categorized_columns.get(CATEGORY_LABEL, [])
+    columns: dict[str, None] = {}
+    for table in tables:
+        if not isinstance(table, FlexTable):
+            table = FlexTable(table)
+        # FlexTable keeps its columns index, so there is no need to scan the rows
+        columns.update(dict.fromkeys(table.columns))
+    return list(columns)
 
 
 def global_columns(data: Iterable[Union[Iterable[dict], TestCase]],
@@ -1,4 +1,6 @@
+import os
 from typing import Union, TextIO, Callable
+from .chunks import find_test_case_offsets
 from .folder import PathParam
 
 from tabbyset.file_formats.csv1.reader import Csv1Reader
@@ -9,16 +11,24 @@ from random import Random
 
 FileParam = Union[PathParam, TextIO]
 
-def shuffle_csv1(input_file: FileParam, output_file: FileParam, *, random_seed: int = None) -> None:
+def shuffle_csv1(input_file: FileParam, output_file: FileParam, *, random_seed: int = None,
+                 external: bool = False) -> None:
     """
     Shuffle the rows of a CSV1 file and write the result to another file.
 
     By default, the order depends on the random module's random function and by its seed.
 
+    In the external mode only the offsets of the test cases are kept in the memory and the test cases are copied
+    to the output as is, without parsing. The order is the same as in the default mode for the same seed.
+
     :param input_file: The path of the input CSV1 file or an open file object.
     :param output_file: The path of the output CSV1 file or an open file object.
     :param random_seed: Optional seed for the random number generator to ensure reproducibility.
+    :param external: Whether to shuffle the file larger than the memory. Requires the input file path.
     """
+    if external:
+        _shuffle_external(input_file, output_file, random_seed)
+        return
 
     with Csv1Reader(input_file) as reader:
         test_cases = list(reader)
@@ -28,16 +38,25 @@ def shuffle_csv1(input_file: FileParam, output_file: FileParam, *, random_seed:
         for test_case in test_cases:
             writer.write(test_case)
 
-def shuffle_csv2(input_file: FileParam, output_file: FileParam, *, random_seed: int = None) -> None:
+def shuffle_csv2(input_file: FileParam, output_file: FileParam, *, random_seed: int = None,
+                 external: bool = False) -> None:
     """
     Shuffle the rows of a CSV2 file and write the result to another file.
 
     By default, the order depends on the random module's random function and by its seed.
 
+    In the external mode only the offsets of the test cases are kept in the memory and the test cases are copied
+    to the output after the global columns as is, without parsing.
+    The order is the same as in the default mode for the same seed.
+
     :param input_file: The path of the input CSV2 file or an open file object.
     :param output_file: The path of the output CSV2 file or an open file object.
     :param random_seed: Optional seed for the random number generator to ensure reproducibility.
+    :param external: Whether to shuffle the file larger than the memory. Requires the input file path.
     """
+    if external:
+        _shuffle_external(input_file, output_file, random_seed)
+        return
 
     with Csv2Reader(input_file) as reader:
         headers = reader.global_columns
@@ -46,4 +65,37 @@ def shuffle_csv2(input_file: FileParam, output_file: FileParam, *, random_seed:
 
     with Csv2Writer(output_file, global_columns=headers) as writer:
         for test_case in test_cases:
-            writer.write(test_case)
\ No newline at end of file
+            writer.write(test_case)
+
+
+def _shuffle_external(input_file: FileParam, output_file: FileParam, random_seed: int = None) -> None:
+    if not isinstance(input_file, (str, os.PathLike)):
+        raise ValueError('External shuffle requires the path of the input file')
+    offsets = find_test_case_offsets(input_file)
+    file_size = os.path.getsize(input_file)
+    ends = offsets[1:] + [file_size]
+    # The same permutation as of the list of test cases in the default mode
+    order = list(range(len(offsets)))
+    Random(random_seed).shuffle(order)
+
+    if isinstance(output_file, (str, os.PathLike)):
+        with open(output_file, 'wb') as output:
+            _copy_in_order(input_file, offsets, ends, order, output.write)
+    else:
+        def write(data: bytes):
+            output_file.write(data.decode('utf-8'))
+        _copy_in_order(input_file, offsets, ends, order, write)
+
+
+def _copy_in_order(input_file: PathParam, offsets: list[int], ends: list[int], order: list[int],
+                   write: Callable[[bytes], object]) -> None:
+    with open(input_file, 'rb') as file:
+        # The part before the first test case (e.g. CSV2 global columns) stays at the beginning
+        write(file.read(offsets[0]) if offsets else file.read())
+        for index in order:
+            file.seek(offsets[index])
+            test_case_data = file.read(ends[index] - offsets[index])
+            write(test_case_data)
+            # The last test case of the file may end without a line break
+            if not test_case_data.endswith(b'\n'):
+                write(b'\r\n')
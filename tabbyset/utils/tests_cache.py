@@ -0,0 +1,136 @@
+import hashlib
+import os
+import pickle
+import tempfile
+from collections.abc import Sequence
+from pathlib import Path
+from typing import Optional
+
+from tabbyset.entities.test_case import TestCase
+from .folder import Folder, PathParam
+
+# Changing of the entry layout must change the version, so the old entries are not loaded
+_CACHE_FORMAT_VERSION = 1
+_ENTRY_SUFFIX = '.tcache'
+
+
+class TestsFilesCache:
+    """
+    On-disk cache of the test cases parsed from the files.
+
+    The entries are keyed by the absolute path of the file and the reading options (e.g. the file format),
+    and are used only while the size and the modification time of the file are the same as on its parsing.
+    When the total size of the entries exceeds `max_size`, the least recently used entries are removed.
+
+    The cache may be shared by several processes.
+
+    >>> cache = TestsFilesCache('path/to/cache')
+    ... test_cases = TestsTracker.read_folder('path/to/tests', cache=cache)
+
+    :param folder: The folder to store the cache entries in.
+    :param max_size: The maximum total size of the cache entries in bytes.
+    """
+    folder: Folder
+    max_size: int
+    # Estimated total size of the entries, to avoid listing the folder on each `put`
+    _total_size: Optional[int] = None
+
+    def __init__(self, folder: PathParam, max_size: int = 2 ** 30):
+        self.folder = Folder(folder)
+        self.max_size = max_size
+
+    def get(self, file_path: PathParam, options: str = '') -> Optional[list[TestCase]]:
+        """
+        :param file_path: The path of the tests file.
+        :param options: The reading options, which the test cases depend on.
+        :return: The cached test cases of the file, or None if there is no up-to-date entry.
+        """
+        entry_path = self._get_entry_path(file_path, options)
+        try:
+            stat = os.stat(file_path)
+            with open(entry_path, 'rb') as entry_file:
+                version, file_size, file_mtime_ns, content = pickle.load(entry_file)
+        except (OSError, pickle.UnpicklingError, EOFError, ValueError, TypeError):
+            return None
+        if (version, file_size, file_mtime_ns) != (_CACHE_FORMAT_VERSION, stat.st_size, stat.st_mtime_ns):
+            return None
+        try:
+            # Modification time of the entries is their last usage time for the eviction
+            os.utime(entry_path)
+        except OSError:
+            pass
+        return [TestCase(name=name, steps=steps, description=description, id=test_case_id)
+                for name, description, test_case_id, steps in content]
+
+    def put(self, file_path: PathParam, test_cases: Sequence[TestCase], options: str = '',
+            *,
+            file_stat: Optional[os.stat_result] = None) -> None:
+        """
+        Stores the test cases of the file to the cache.
+
+        :param file_path: The path of the tests file.
+        :param test_cases: The test cases parsed from the file.
+        :param options: The reading options, which the test cases depend on.
+        :param file_stat: The state of the file before the parsing. Prevents caching the content of the file,
+                          which was changed during the parsing.
+        """
+        if file_stat is None:
+            file_stat = os.stat(file_path)
+        content = [(test_case.name, test_case.description, test_case.id, [dict(row) for row in test_case.steps])
+                   for test_case in test_cases]
+        entry = (_CACHE_FORMAT_VERSION, file_stat.st_size, file_stat.st_mtime_ns, content)
+        entry_path = self._get_entry_path(file_path, options)
+        # Writing to a temporary file makes the entry appear atomically for the concurrent readers
+        file_descriptor, temp_path = tempfile.mkstemp(dir=self.folder.path, suffix='.tmp')
+        try:
+            with os.fdopen(file_descriptor, 'wb') as temp_file:
+                pickle.dump(entry, temp_file, protocol=pickle.HIGHEST_PROTOCOL)
+            entry_size = os.path.getsize(temp_path)
+            os.replace(temp_path, entry_path)
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+        if self._total_size is None:
+            self._evict()
+        else:
+            self._total_size += entry_size
+            if self._total_size > self.max_size:
+                self._evict()
+
+    def clear(self) -> None:
+        """
+        Removes all the entries from the cache.
+        """
+        for entry_path in self.folder.glob(f'*{_ENTRY_SUFFIX}'):
+            try:
+                os.unlink(entry_path)
+            except OSError:
+                pass
+        self._total_size = 0
+
+    def _get_entry_path(self, file_path: PathParam, options: str) -> Path:
+        key = f'{os.path.abspath(file_path)}\0{options}'
+        return self.folder.get_file_path(hashlib.sha256(key.encode('utf-8')).hexdigest() + _ENTRY_SUFFIX)
+
+    def _evict(self) -> None:
+        entries = []
+        total_size = 0
+        for entry_path in self.folder.glob(f'*{_ENTRY_SUFFIX}'):
+            try:
+                stat = os.stat(entry_path)
+            except OSError:
+                # Removed by another process
+                continue
+            entries.append((stat.st_mtime_ns, stat.st_size, entry_path))
+            total_size += stat.st_size
+        if total_size > self.max_size:
+            entries.sort()
+            for _, size, entry_path in entries:
+                try:
+                    os.unlink(entry_path)
+                except OSError:
+                    pass
+                total_size -= size
+                if total_size <= self.max_size:
+                    break
+        self._total_size = total_size
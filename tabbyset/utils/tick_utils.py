@@ -1,8 +1,13 @@
+from collections.abc import Callable, Iterable, Iterator
 from decimal import Decimal
-from typing import Union
+from itertools import repeat
+from typing import Union, Literal
+from .flex_table import FlexTable
 from .warnings import get_warn_once_func
 
 Numberish = Union[int, float, Decimal, str]
+TickSizes = Union[Numberish, Iterable[Numberish]]
+RoundingMode = Literal['round', 'floor', 'ceil']
 
 warn_once = get_warn_once_func()
 
@@ -28,12 +33,7 @@ def is_multiple_of_tick(price: Numberish, tick_size: Numberish) -> bool:
     :param tick_size: The tick size to check against.
     :return: True if the price is a multiple of the tick size, False otherwise.
     """
-    price = _to_decimal(price)
-    tick_size = _to_decimal(tick_size)
-    # tick_size == 0 means infinite precision, where all numbers are multiples of each other
-    if tick_size == 0:
-        return True
-    return price % tick_size == 0
+    return _is_multiple_of_tick(_to_decimal(price), _to_decimal(tick_size))
 
 
 def floor_to_tick(price: Numberish, tick_size: Numberish) -> Decimal:
@@ -46,11 +46,7 @@ def floor_to_tick(price: Numberish, tick_size: Numberish) -> Decimal:
     :param tick_size: The tick size to round to.
     :return: The rounded down price.
     """
-    price = _to_decimal(price)
-    tick_size = _to_decimal(tick_size)
-    if is_multiple_of_tick(price, tick_size):
-        return price
-    return price // tick_size * tick_size
+    return _floor_to_tick(_to_decimal(price), _to_decimal(tick_size))
 
 
 def ceil_to_tick(price: Numberish, tick_size: Numberish) -> Decimal:
@@ -63,11 +59,7 @@ def ceil_to_tick(price: Numberish, tick_size: Numberish) -> Decimal:
     :param tick_size: The tick size to round to.
     :return: The rounded up price.
     """
-    price = _to_decimal(price)
-    tick_size = _to_decimal(tick_size)
-    if is_multiple_of_tick(price, tick_size):
-        return price
-    return price // tick_size * tick_size + tick_size
+    return _ceil_to_tick(_to_decimal(price), _to_decimal(tick_size))
 
 
 def round_to_tick(price: Numberish, tick_size: Numberish) -> Decimal:
@@ -80,8 +72,168 @@ def round_to_tick(price: Numberish, tick_size: Numberish) -> Decimal:
     :param tick_size: The tick size to round to.
     :return: The rounded price.
     """
-    price = _to_decimal(price)
-    tick_size = _to_decimal(tick_size)
-    if is_multiple_of_tick(price, tick_size):
+    return _round_to_tick(_to_decimal(price), _to_decimal(tick_size))
+
+
+def is_multiple_of_tick_many(prices: Iterable[Numberish], tick_size: TickSizes) -> list[bool]:
+    """
+    Checks if the prices are multiples of the tick size, see `is_multiple_of_tick`.
+
+    :param prices: The prices to check.
+    :param tick_size: The tick size for all the prices, or an iterable of the tick sizes for each price.
+    :return: The list of the results for each price.
+    :raises ValueError: If the number of the tick sizes differs from the number of the prices.
+    """
+    return _apply_to_many(_is_multiple_of_tick, prices, tick_size)
+
+
+def floor_to_tick_many(prices: Iterable[Numberish], tick_size: TickSizes) -> list[Decimal]:
+    """
+    Rounds the prices down to the multiples of the tick size, see `floor_to_tick`.
+
+    :param prices: The prices to round down.
+    :param tick_size: The tick size for all the prices, or an iterable of the tick sizes for each price.
+    :return: The list of the rounded down prices.
+    :raises ValueError: If the number of the tick sizes differs from the number of the prices.
+    """
+    return _apply_to_many(_floor_to_tick, prices, tick_size)
+
+
+def ceil_to_tick_many(prices: Iterable[Numberish], tick_size: TickSizes) -> list[Decimal]:
+    """
+    Rounds the prices up to the multiples of the tick size, see `ceil_to_tick`.
+
+    :param prices: The prices to round up.
+    :param tick_size: The tick size for all the prices, or an iterable of the tick sizes for each price.
+    :return: The list of the rounded up prices.
+    :raises ValueError: If the number of the tick sizes differs from the number of the prices.
+    """
+    return _apply_to_many(_ceil_to_tick, prices, tick_size)
+
+
+def round_to_tick_many(prices: Iterable[Numberish], tick_size: TickSizes) -> list[Decimal]:
+    """
+    Rounds the prices to the nearest multiples of the tick size, see `round_to_tick`.
+
+    :param prices: The prices to round.
+    :param tick_size: The tick size for all the prices, or an iterable of the tick sizes for each price.
+    :return: The list of the rounded prices.
+    :raises ValueError: If the number of the tick sizes differs from the number of the prices.
+    """
+    return _apply_to_many(_round_to_tick, prices, tick_size)
+
+
+def round_column_to_tick(table: FlexTable, column: str, tick_size: TickSizes, mode: RoundingMode = 'round') -> int:
+    """
+    Rounds the prices in the column of the table in place.
+
+    Empty cells and the prices, which are already multiples of the tick size, are left as is.
+    String prices are replaced with strings in the fixed-point notation, other ones with Decimal.
+
+        >>> round_column_to_tick(test_case.steps, 'Price', '0.01')
+        >>> round_column_to_tick(test_case.steps, 'Price', test_case.steps['TickSize'], mode='floor')
+
+    :param table: The table to change.
+    :param column: The column with the prices.
+    :param tick_size: The tick size for all the rows, or an iterable of the tick sizes for each row.
+    :param mode: `"round"` to the nearest multiple, `"floor"` to round down or `"ceil"` to round up.
+    :return: The number of the changed cells.
+    :raises ValueError: If the mode is unknown or the number of the tick sizes differs from the number of the rows.
+    """
+    rounding_function = _ROUNDING_FUNCTIONS.get(mode)
+    if rounding_function is None:
+        raise ValueError(f"Unknown rounding mode: {mode}")
+    # Tick sizes of the empty prices may be empty too, so a tick size is converted only when it is used
+    to_decimal_tick = _get_cached_to_decimal()
+    changed_count = 0
+    for row, tick in zip(table, _get_tick_sizes(tick_size, len(table))):
+        price = row.get(column, table.EMPTY_VALUE)
+        if price == table.EMPTY_VALUE or price is None:
+            continue
+        decimal_price = _to_decimal(price)
+        rounded_price = rounding_function(decimal_price, to_decimal_tick(tick))
+        # Numerically equal prices are kept, so their formatting (e.g. "1.50") is not changed
+        if rounded_price == decimal_price:
+            continue
+        # str() would give the scientific notation for the small numbers, e.g. "1E-7"
+        row[column] = format(rounded_price, 'f') if isinstance(price, str) else rounded_price
+        changed_count += 1
+    if changed_count:
+        # The rows are changed directly
+        table.invalidate_caches()
+    return changed_count
+
+
+def _is_multiple_of_tick(price: Decimal, tick_size: Decimal) -> bool:
+    # tick_size == 0 means infinite precision, where all numbers are multiples of each other
+    if tick_size == 0:
+        return True
+    return price % tick_size == 0
+
+
+def _floor_to_tick(price: Decimal, tick_size: Decimal) -> Decimal:
+    if tick_size == 0:
+        return price
+    quotient, remainder = divmod(price, tick_size)
+    if remainder == 0:
+        return price
+    return quotient * tick_size
+
+
+def _ceil_to_tick(price: Decimal, tick_size: Decimal) -> Decimal:
+    if tick_size == 0:
+        return price
+    quotient, remainder = divmod(price, tick_size)
+    if remainder == 0:
+        return price
+    return quotient * tick_size + tick_size
+
+
+def _round_to_tick(price: Decimal, tick_size: Decimal) -> Decimal:
+    if _is_multiple_of_tick(price, tick_size):
         return price
     return round(price / tick_size) * tick_size
+
+
+_ROUNDING_FUNCTIONS: dict[str, Callable[[Decimal, Decimal], Decimal]] = {
+    'round': _round_to_tick,
+    'floor': _floor_to_tick,
+    'ceil': _ceil_to_tick,
+}
+
+
+def _apply_to_many(function: Callable[[Decimal, Decimal], Union[Decimal, bool]],
+                   prices: Iterable[Numberish],
+                   tick_size: TickSizes) -> list:
+    prices = list(prices)
+    tick_sizes = map(_get_cached_to_decimal(), _get_tick_sizes(tick_size, len(prices)))
+    return list(map(function, map(_to_decimal, prices), tick_sizes))
+
+
+def _get_tick_sizes(tick_size: TickSizes, prices_count: int) -> Iterator[Numberish]:
+    """
+    :return: The iterator of the same tick size or of the tick sizes for each price.
+    :raises ValueError: If the number of the tick sizes differs from the number of the prices.
+    """
+    if isinstance(tick_size, (int, float, Decimal, str)):
+        return repeat(tick_size, prices_count)
+    tick_size = list(tick_size)
+    if len(tick_size) != prices_count:
+        raise ValueError(f"Expected {prices_count} tick sizes, one for each price, got {len(tick_size)}")
+    return iter(tick_size)
+
+
+def _get_cached_to_decimal() -> Callable[[Numberish], Decimal]:
+    """
+    :return: The function converting the numbers to Decimal, which converts each distinct number once.
+    """
+    # Tick sizes of the rows usually repeat
+    converted: dict[Numberish, Decimal] = {}
+
+    def to_decimal(number: Numberish) -> Decimal:
+        decimal_number = converted.get(number)
+        if decimal_number is None:
+            decimal_number = converted[number] = _to_decimal(number)
+        return decimal_number
+
+    return to_decimal
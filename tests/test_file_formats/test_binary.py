@@ -0,0 +1,134 @@
+import io
+import unittest
+
+from tabbyset.db.id_utils import is_valid_id, new_id, get_id_from_steps
+from tabbyset.entities import TestCase
+from tabbyset.file_formats import BinaryTestCasesReader, BinaryTestCasesWriter, Csv1Reader, Csv1Writer
+from tabbyset.file_formats.binary import codec
+from tabbyset.file_formats.exceptions import FileParsingException
+from tabbyset.testing.test_case import TestCaseAssertions
+from tabbyset.utils import FlexTable, Folder
+
+temp_folder = Folder.mount_from_current_module('./__temp__')
+binary_folder = temp_folder.mount_subfolder('binary')
+
+
+def get_test_cases() -> list[TestCase]:
+    return [
+        TestCase(name='first',
+                 id=new_id(),
+                 description='description',
+                 steps=FlexTable([{'A': '1', 'B': '2'}, {'A': '3', 'C': 'ÿ€𝄞'}, {}])),
+        TestCase(name='second',
+                 id=new_id(),
+                 steps=FlexTable([{'B': 'same'}, {'B': 'same', 'A': ''}])),
+        TestCase(name='first',
+                 steps=FlexTable([{f'Column{i}': str(i) for i in range(300)}]))
+    ]
+
+
+class TestBinaryFormat(TestCaseAssertions, unittest.TestCase):
+
+    def setUp(self):
+        binary_folder.clear()
+        self.file_path = binary_folder.get_file_path('test.tbs')
+        self.test_cases = get_test_cases()
+        with BinaryTestCasesWriter(self.file_path) as writer:
+            writer.write_many(self.test_cases)
+
+    def test_round_trip(self):
+        with BinaryTestCasesReader(self.file_path) as reader:
+            test_cases = reader.read_all()
+        self.assertEqual(len(self.test_cases), len(test_cases))
+        for expected, actual in zip(self.test_cases, test_cases):
+            self.assertTestCasesEqual(expected, actual)
+            self.assertEqual(expected.description, actual.description)
+            self.assertEqual([dict(row) for row in expected.steps], [dict(row) for row in actual.steps])
+        self.assertEqual([test_case.id for test_case in self.test_cases[:2]],
+                         [test_case.id for test_case in test_cases[:2]])
+        # The writer generates the missing ids like the other writers
+        self.assertIsNone(self.test_cases[2].id)
+        self.assertTrue(is_valid_id(test_cases[2].id))
+
+    def test_csv_round_trip_keeps_hashes(self):
+        csv_path = binary_folder.get_file_path('test.csv')
+        with Csv1Writer(csv_path) as writer:
+            writer.write_many(self.test_cases)
+        with Csv1Reader(csv_path) as reader:
+            csv_test_cases = reader.read_all()
+        with BinaryTestCasesWriter(self.file_path) as writer:
+            writer.write_many(csv_test_cases)
+        with BinaryTestCasesReader(self.file_path) as reader:
+            binary_test_cases = reader.read_all()
+        for expected, actual in zip(csv_test_cases, binary_test_cases):
+            self.assertEqual(expected, actual)
+            self.assertEqual(hash(expected.steps), hash(actual.steps))
+            self.assertEqual(hash(expected), hash(actual))
+            self.assertEqual(get_id_from_steps(expected), get_id_from_steps(actual))
+
+    def test_file_objects(self):
+        output = io.BytesIO()
+        writer = BinaryTestCasesWriter(output)
+        writer.write_many(self.test_cases)
+        writer.flush()
+        # The index is written only on close
+        self.assertNotIn(codec.FOOTER_MAGIC, output.getvalue())
+        writer.close()
+        self.assertTrue(output.closed)
+        with BinaryTestCasesReader(io.BytesIO(self._read_file())) as reader:
+            self.assertEqual(['first', 'second', 'first'], [test_case.name for test_case in reader])
+        with self.assertRaises(ValueError):
+            BinaryTestCasesReader(io.StringIO())
+
+    def test_random_access(self):
+        with BinaryTestCasesReader(self.file_path) as reader:
+            iterator = iter(reader)
+            self.assertTestCasesEqual(self.test_cases[0], next(iterator))
+            self.assertTestCasesEqual(self.test_cases[2], reader[2])
+            self.assertTestCasesEqual(self.test_cases[1], reader.get_by_name('second'))
+            self.assertEqual(self.test_cases[0].id, reader.get_by_name('first').id)
+            self.assertTestCasesEqual(self.test_cases[1], reader.get_by_id(self.test_cases[1].id))
+            self.assertIsNone(reader.get_by_name('missing'))
+            # Random access doesn't move the iteration
+            self.assertTestCasesEqual(self.test_cases[1], next(iterator))
+            entries = reader.get_index().entries
+            self.assertEqual([entry.line_number for entry in entries], [1, 2, 3])
+            self.assertEqual([entry for entry, _ in reader.iter_with_positions()], entries)
+
+    def test_random_access_of_file_object(self):
+        file = io.BytesIO(b'prefix' + self._read_file())
+        file.seek(len(b'prefix'))
+        reader = BinaryTestCasesReader(file)
+        self.assertTestCasesEqual(self.test_cases[1], reader[1])
+        self.assertEqual(len(self.test_cases), len(reader.read_all()))
+
+    def test_empty_file(self):
+        BinaryTestCasesWriter(self.file_path).close()
+        with BinaryTestCasesReader(self.file_path) as reader:
+            self.assertEqual([], reader.read_all())
+            self.assertEqual([], reader.get_index().entries)
+            self.assertTrue(reader.check_validity())
+
+    def test_check_validity(self):
+        with BinaryTestCasesReader(self.file_path) as reader:
+            self.assertTrue(reader.check_validity())
+        data = self._read_file()
+        for name, corrupted in (('truncated', data[:len(data) // 2]),
+                                ('not binary', b'TEST_CASE_START\r\n'),
+                                ('corrupted block', data[:20] + b'\xff' * 8 + data[28:])):
+            with self.subTest(name):
+                with BinaryTestCasesReader(io.BytesIO(corrupted)) as reader:
+                    self.assertFalse(reader.check_validity())
+                with BinaryTestCasesReader(io.BytesIO(corrupted)) as reader:
+                    with self.assertRaises(FileParsingException):
+                        reader.read_all()
+
+    def test_missing_index(self):
+        data = self._read_file()
+        with BinaryTestCasesReader(io.BytesIO(data[:-4])) as reader:
+            with self.assertRaises(FileParsingException):
+                reader.get_index()
+
+    def _read_file(self) -> bytes:
+        with open(self.file_path, 'rb') as file:
+            return file.read()
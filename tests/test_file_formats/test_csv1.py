@@ -1,4 +1,6 @@
+import csv
 import unittest
+from unittest import mock
 from pathlib import Path
 from string import Template
 
@@ -132,6 +134,114 @@ class TestCsv1Reader(TestCaseAssertions, unittest.TestCase):
                 self.assertTestCasesEqual(Csv1Reader(content).read_one(), self.valid_testcase)
 
 
+    def test_strict_parsing_matches_logged_parsing(self):
+        logger = tbs.FileParsingLogger('csv1_parser/tests/strict', str(reader_folder.get_file_path('strict.log.csv')))
+        for example in Csv1Examples:
+            with self.subTest(example=example.name):
+                strict_reader = Csv1Reader(StringIO(example.value))
+                logged_reader = Csv1Reader(StringIO(example.value), parsing_logger=logger)
+                try:
+                    expected = logged_reader.read_all()
+                except FileParsingException as e:
+                    with self.assertRaises(FileParsingException) as context:
+                        strict_reader.read_all()
+                    self.assertEqual(str(e), str(context.exception))
+                    continue
+                actual = strict_reader.read_all()
+                self.assertEqual(len(expected), len(actual))
+                for expected_test_case, actual_test_case in zip(expected, actual):
+                    self.assertTestCasesEqual(expected_test_case, actual_test_case)
+                    self.assertEqual(expected_test_case.id, actual_test_case.id)
+
+    def test_check_validity_matches_parsing(self):
+        for example in Csv1Examples:
+            with self.subTest(example=example.name):
+                try:
+                    Csv1Reader(StringIO(example.value)).read_all()
+                    is_valid = True
+                except FileParsingException:
+                    is_valid = False
+                with mock.patch.object(Csv1Reader, '_postprocess_test_case') as postprocess:
+                    self.assertEqual(is_valid, Csv1Reader(StringIO(example.value)).check_validity())
+                # Test cases are not built for the validation
+                postprocess.assert_not_called()
+
+    def test_virtual_file_exception_context(self):
+        valid_test_case = 'TEST_CASE_START\r\nname\r\n\r\n\r\nA,B\r\n1,2\r\nTEST_CASE_END\r\n'
+        content = valid_test_case * 100 + 'TEST_CASE_END\r\n' + valid_test_case * 100
+        with self.assertRaises(tbs.VirtualFileParsingException) as context:
+            Csv1Reader(StringIO(content, newline='')).read_all()
+        exception = context.exception
+        self.assertEqual(exception.line_number, 701)
+        self.assertEqual(exception.file, '\r\nA,B\r\n1,2\r\nTEST_CASE_END\r\nTEST_CASE_END\r\n'
+                                         'TEST_CASE_START\r\nname\r\n')
+
+    def test_logged_original_line(self):
+        log_path = reader_folder.get_file_path('original_line.log.csv')
+        logger = tbs.FileParsingLogger('csv1_parser/tests/original_line', str(log_path))
+        content = 'TEST_CASE_START\r\nname\r\n\r\n\r\nA,B\r\n1,"multi\r\nline",3\r\nTEST_CASE_END\r\n'
+        Csv1Reader(StringIO(content, newline=''), parsing_logger=logger).read_all()
+        for handler in logger.native_logger.handlers:
+            handler.flush()
+        with open(log_path, newline='', encoding='utf-8') as log_file:
+            records = list(csv.DictReader(log_file))
+        self.assertIn({'summary': 'Step row length has more items than columns',
+                       'original_line': '1,"multi\r\nline",3\r\n'},
+                      [{'summary': record['summary'], 'original_line': record['original_line']}
+                       for record in records])
+
+    def test_random_access(self):
+        file_path = reader_folder.get_file_path('random_access.csv')
+        test_cases = [tbs.TestsTracker.new_test(f'name{i}', [{'A': str(i), 'B': 'multi\nline'}]) for i in range(5)]
+        with Csv1Writer(file_path) as writer:
+            writer.write_many(test_cases)
+        with Csv1Reader(file_path) as reader:
+            index = reader.build_index()
+            self.assertEqual([entry.name for entry in index.entries], [f'name{i}' for i in range(5)])
+            self.assertEqual(index[0].line_number, 1)
+            self.assertTestCasesEqual(test_cases[3], reader[3])
+            self.assertTestCasesEqual(test_cases[4], reader[-1])
+            self.assertTestCasesEqual(test_cases[2], reader.get_by_name('name2'))
+            self.assertTestCasesEqual(test_cases[1], reader.get_by_id(test_cases[1].id))
+            with self.assertRaises(IndexError):
+                _ = reader[5]
+        with Csv1Reader(file_path) as reader:
+            self.assertTestCasesEqual(test_cases[4], reader.get_by_name('name4'))
+            self.assertEqual(len(reader.get_index()), 5)
+        with Csv1Writer(file_path) as writer:
+            writer.write_many(test_cases[:2])
+        with Csv1Reader(file_path) as reader:
+            self.assertEqual(len(reader.get_index()), 2, 'Index must be rebuilt after the file change')
+
+    def test_random_access_with_general_parser(self):
+        file_path = reader_folder.get_file_path('random_access_general.csv')
+        with open(file_path, 'w', newline='', encoding='utf-8') as file:
+            file.write('TEST_CASE_START\r\nname0\r\n\r\n\r\nA,B\r\n1,2,3\r\nTEST_CASE_END\r\n'
+                       'TEST_CASE_START\r\nname1\r\n\r\n\r\nA,B\r\n1,"multi\r\nline",3\r\nTEST_CASE_END\r\n')
+        expected = Csv1Reader(file_path, tolerant_mode=True).read_all()
+        for options in ({'tolerant_mode': True}, {'parsing_logger': tbs.ParsingDiagnostics()}):
+            with self.subTest(options=list(options)):
+                with Csv1Reader(file_path, **options) as reader:
+                    positions = list(reader.iter_with_positions())
+                    self.assertEqual([(entry.line_number, entry.name) for entry, _ in positions],
+                                     [(1, 'name0'), (8, 'name1')])
+                    for (_, test_case), expected_test_case in zip(positions, expected):
+                        self.assertTestCasesEqual(expected_test_case, test_case)
+                    self.assertTestCasesEqual(expected[1], reader[1])
+                    self.assertTestCasesEqual(expected[0], reader.get_by_name('name0'))
+        diagnostics = tbs.ParsingDiagnostics()
+        with Csv1Reader(file_path, parsing_logger=diagnostics) as reader:
+            reader.build_index()
+            sequential_records = diagnostics.records[:]
+            diagnostics.records.clear()
+            _ = reader[1]
+        # Line numbers of the test case read by position are the lines of the file
+        self.assertEqual([record.lineno for record in diagnostics.records],
+                         [record.lineno for record in sequential_records if record.test_case_index == 1])
+        self.assertIn(('Step row length has more items than columns', '1,"multi\r\nline",3\r\n'),
+                      [(record.summary, record.original_line) for record in diagnostics.records])
+
+
 class TestCsv1Writer(TestCaseAssertions, unittest.TestCase):
     def setUp(self):
         test_case_id = tbs.TestsTracker.new_id()
@@ -188,6 +298,30 @@ TEST_CASE_END\r
 """
         self.assertEqual(valid_csv.strip(), content.getvalue().strip())
 
+    def test_buffered_writing(self):
+        expected_content = StringIO()
+        expected_writer = Csv1Writer(expected_content)
+        expected_writer.write(self.valid_testcase)
+        content = StringIO()
+        writer = Csv1Writer(content, buffer_size=len(expected_content.getvalue()) * 2)
+        writer.write(self.valid_testcase)
+        self.assertEqual(content.getvalue(), '')
+        writer.write(self.valid_testcase)
+        self.assertEqual(content.getvalue(), expected_content.getvalue() * 2)
+        writer.write(self.valid_testcase)
+        writer.flush()
+        self.assertEqual(content.getvalue(), expected_content.getvalue() * 3)
+
+    def test_write_many(self):
+        expected_content = StringIO()
+        writer = Csv1Writer(expected_content)
+        for _ in range(3):
+            writer.write(self.valid_testcase)
+        content = StringIO()
+        buffered_writer = Csv1Writer(content)
+        buffered_writer.write_many([self.valid_testcase] * 3)
+        self.assertEqual(content.getvalue(), expected_content.getvalue())
+
     def test_write_invalid_id(self):
         self.valid_testcase.id = 'invalid'
         generated_id = tbs.TestsTracker.get_id_from_steps(self.valid_testcase)
@@ -199,6 +333,7 @@ TEST_CASE_END\r
         test_case = reader.read_one()
         self.assertNotEqual(test_case.id, generated_id, 'Writer must generate UUIDv4, not UUIDv5')
         self.assertTrue(tbs.TestsTracker.is_valid_id(test_case.id), 'Writer must keep valid UUID')
+        self.assertEqual(self.valid_testcase.id, 'invalid', 'Writer must not change the written test case')
 
     def test_write_valid_id(self):
         content = StringIO()
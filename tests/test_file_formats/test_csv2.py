@@ -1,4 +1,5 @@
 import unittest
+from unittest import mock
 from pathlib import Path
 
 from tabbyset.file_formats.exceptions import FileParsingException
@@ -95,6 +96,56 @@ class TestCsv2Reader(TestCaseAssertions, unittest.TestCase):
                 for expected, actual in zip(self.valid_testcases, testcases):
                     self.assertTestCasesEqual(expected, actual)
 
+    def test_global_columns_without_rewinding(self):
+        class SeekCountingIO(StringIO):
+            seeks_count = 0
+
+            def seek(self, *args):
+                self.seeks_count += 1
+                return super().seek(*args)
+
+        content = SeekCountingIO(self.valid_csv)
+        reader = Csv2Reader(content)
+        self.assertEqual(['A', 'B', 'C', 'D', 'E'], reader.global_columns)
+        seeks_count = content.seeks_count
+        testcases = reader.read_all()
+        # The iteration continues from the first test case without rewinding
+        self.assertEqual(seeks_count, content.seeks_count)
+        self.assertEqual(2, len(testcases))
+        for expected, actual in zip(self.valid_testcases, testcases):
+            self.assertTestCasesEqual(expected, actual)
+
+    def test_global_columns_not_defined(self):
+        for content in ('', '\r\n,,\r\n'):
+            for multiheader in (None, True, False):
+                with self.subTest(content=content, multiheader=multiheader):
+                    reader = Csv2Reader(StringIO(content), multiheader=multiheader)
+                    self.assertIsNone(reader.global_columns)
+                    self.assertEqual([], reader.read_all())
+
+    def test_global_columns_keep_started_reading(self):
+        reader = Csv2Reader(StringIO(self.valid_csv))
+        reader.restart_reading()
+        iterator = iter(reader)
+        self.assertEqual(['A', 'B', 'C', 'D', 'E'], reader.global_columns)
+        self.assertIs(iterator, iter(reader))
+        testcases = reader.read_all()
+        self.assertEqual(2, len(testcases))
+        for expected, actual in zip(self.valid_testcases, testcases):
+            self.assertTestCasesEqual(expected, actual)
+
+    def test_check_validity_matches_parsing(self):
+        for example in Csv2Examples:
+            with self.subTest(example=example.name):
+                try:
+                    Csv2Reader(StringIO(example.value)).read_all()
+                    is_valid = True
+                except FileParsingException:
+                    is_valid = False
+                with mock.patch.object(Csv2Reader, '_postprocess_test_case') as postprocess:
+                    self.assertEqual(is_valid, Csv2Reader(StringIO(example.value)).check_validity())
+                postprocess.assert_not_called()
+
     def test_global_columns_multiheader(self):
         for t, content in get_all_supported_file_formats(Csv2Examples.valid_multiheader):
             with self.subTest(file_type=t):
@@ -244,6 +295,41 @@ class TestCsv2Reader(TestCaseAssertions, unittest.TestCase):
                         print(list(csv2_reader))
 
 
+    def test_random_access(self):
+        for example, multiheader, expected_test_cases in (
+                (Csv2Examples.valid, False, self.valid_testcases),
+                (Csv2Examples.valid_multiheader, True, self.valid_testcases_multiheader)):
+            with self.subTest(example=example.name):
+                _, file_path = get_all_supported_file_formats(example)[1]
+                # The earlier versions saved the index next to the file
+                Path(f'{file_path}.tbsidx').unlink(missing_ok=True)
+                with Csv2Reader(file_path, multiheader=multiheader) as reader:
+                    expected_ids = [test_case.id for test_case in reader]
+                    self.assertTestCasesEqual(expected_test_cases[1], reader[1])
+                    self.assertTestCasesEqual(expected_test_cases[0], reader.get_by_name('name1'))
+                    self.assertEqual(reader.get_by_id(expected_ids[1]).name, 'name2')
+                    self.assertIsNone(reader.get_by_name('unknown'))
+                self.assertFalse(Path(f'{file_path}.tbsidx').exists(), 'Index is saved only to the index folder')
+
+    def test_index_folder(self):
+        index_folder = temp_folder.mount_subfolder('csv2/indexes')
+        index_folder.clear()
+        _, file_path = get_all_supported_file_formats(Csv2Examples.valid)[1]
+        Csv2Reader.set_index_folder(index_folder)
+        try:
+            with Csv2Reader(file_path) as reader:
+                self.assertEqual(reader.index_file_path.parent, index_folder.path)
+                self.assertTestCasesEqual(self.valid_testcases[1], reader[1])
+            self.assertTrue(reader.index_file_path.exists())
+            with Csv2Reader(file_path) as reader:
+                with mock.patch.object(Csv2Reader, 'build_index') as build_index:
+                    self.assertTestCasesEqual(self.valid_testcases[0], reader.get_by_name('name1'))
+                build_index.assert_not_called()
+        finally:
+            Csv2Reader.set_index_folder(None)
+        self.assertIsNone(Csv2Reader(file_path).index_file_path)
+
+
 class TestCsv2Writer(TestCaseAssertions, unittest.TestCase):
     def setUp(self):
         Csv2Writer.set_default_multiheader_config(test_multiheader_config)
@@ -0,0 +1,74 @@
+import csv
+import json
+import logging
+import unittest
+from io import StringIO
+
+from tabbyset.file_formats import Csv1Reader, ParsingDiagnostics
+from tabbyset.utils import Folder
+
+temp_folder = Folder.mount_from_current_module('./__temp__')
+diagnostics_folder = temp_folder.mount_subfolder('parsing_diagnostics')
+
+CONTENT = ('TEST_CASE_START\r\nname\r\nnot-uuid\r\n\r\nA,B\r\n1,"multi\r\nline",3\r\nTEST_CASE_END\r\n'
+           'TEST_CASE_START\r\nname\r\n\r\n\r\nA,B\r\n1,2\r\n')
+
+
+def read_with(diagnostics: ParsingDiagnostics):
+    Csv1Reader(StringIO(CONTENT, newline=''), tolerant_mode=True, parsing_logger=diagnostics).read_all()
+
+
+class TestParsingDiagnostics(unittest.TestCase):
+
+    def setUp(self):
+        diagnostics_folder.clear()
+
+    def test_in_memory(self):
+        diagnostics = ParsingDiagnostics()
+        read_with(diagnostics)
+        summaries = [record.summary for record in diagnostics.records]
+        self.assertIn('UUID is not valid', summaries)
+        self.assertIn('Last test case is not closed', summaries)
+        record = next(record for record in diagnostics.records
+                      if record.summary == 'Step row length has more items than columns')
+        self.assertEqual(record.original_line, '1,"multi\r\nline",3\r\n')
+        self.assertEqual(record.level_name, 'INFO')
+        self.assertEqual(diagnostics.counts['virtual file', 'Last test case is not closed'], 1)
+        self.assertEqual(diagnostics.counts_by_summary()['UUID will be generated from steps'], 2)
+
+    def test_level(self):
+        diagnostics = ParsingDiagnostics(level=logging.ERROR)
+        lines_rendered = []
+        diagnostics.info('Info', 'file', 1, 0, lambda: lines_rendered.append(1) or 'line')
+        diagnostics.error('Error', 'file', 2, 0, lambda: lines_rendered.append(2) or 'line')
+        self.assertEqual([record.summary for record in diagnostics.records], ['Error'])
+        # Lines are rendered only for the collected records
+        self.assertEqual(lines_rendered, [2])
+
+    def test_csv_output(self):
+        output_path = diagnostics_folder.get_file_path('report.csv')
+        with ParsingDiagnostics(output_path, buffer_size=2) as diagnostics:
+            read_with(diagnostics)
+            read_with(diagnostics)
+        with open(output_path, newline='', encoding='utf-8') as file:
+            rows = list(csv.DictReader(file))
+        self.assertEqual(len(rows), sum(diagnostics.counts.values()))
+        self.assertEqual(rows[0]['filepath'], 'virtual file')
+        self.assertEqual(diagnostics.records, [])
+
+    def test_jsonl_output(self):
+        output_path = diagnostics_folder.get_file_path('report.jsonl')
+        with ParsingDiagnostics(output_path, output_format='jsonl', level=logging.ERROR) as diagnostics:
+            read_with(diagnostics)
+        with open(output_path, encoding='utf-8') as file:
+            records = [json.loads(line) for line in file]
+        self.assertEqual([(record['level'], record['summary']) for record in records],
+                         [('ERROR', 'Last test case is not closed')])
+
+    def test_unknown_format(self):
+        with self.assertRaises(ValueError):
+            ParsingDiagnostics(output_format='xml')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,65 @@
+import unittest
+from unittest import mock
+from tabbyset import TestsTracker
+from tabbyset.testing import TestCaseAssertions
+from tabbyset.utils import Folder, split_csv1_file, merge_csv1_files
+from tabbyset.utils import chunks
+
+temp_folder = Folder.mount_from_current_module('./__temp__')
+chunks_folder = temp_folder.mount_subfolder('chunks')
+
+
+class TestSplitCsv1File(TestCaseAssertions):
+
+    def setUp(self):
+        chunks_folder.clear()
+        self.input_path = chunks_folder.get_file_path('input.csv')
+        self.test_cases = [TestsTracker.new_test(f'test_{i}', [{'Action': 'Quote', 'Price': str(i)}])
+                           for i in range(7)]
+        # Start label in a quoted multiline cell must not split the test case
+        self.test_cases[3].steps.append({'Action': 'Comment', 'Text': 'first line\nTEST_CASE_START,"quoted"'})
+        TestsTracker.write_to_file(self.input_path, self.test_cases)
+        self.output_folder = chunks_folder.mount_subfolder('output')
+
+    def assert_chunks(self, chunk_paths):
+        self.assertEqual([path.name for path in chunk_paths], ['chunk_1.csv', 'chunk_2.csv', 'chunk_3.csv'])
+        self.assertEqual([len(TestsTracker.read_file(path)) for path in chunk_paths], [3, 3, 1])
+        merged_path = chunks_folder.get_file_path('merged.csv')
+        merge_csv1_files(chunk_paths, merged_path)
+        with open(self.input_path, 'rb') as input_file, open(merged_path, 'rb') as merged_file:
+            self.assertEqual(input_file.read(), merged_file.read())
+        self.assertEqual([tc.id for tc in self.test_cases], [tc.id for tc in TestsTracker.read_file(merged_path)])
+
+    def test_split(self):
+        self.assert_chunks(split_csv1_file(self.input_path, self.output_folder, chunk_size=3))
+
+    def test_split_parallel(self):
+        with mock.patch.object(chunks, '_SCAN_BLOCK_SIZE', 64):
+            self.assert_chunks(split_csv1_file(self.input_path, self.output_folder, chunk_size=3, workers=3))
+
+    def test_split_with_unescaped_quotes(self):
+        self.test_cases[1].steps.append({'Action': 'Comment', 'Text': '5" pipe'})
+        self.test_cases[5].name = 'name "with" quotes'
+        TestsTracker.write_to_file(self.input_path, self.test_cases)
+        with open(self.input_path, 'rb') as file:
+            content = file.read()
+        # The quote inside an unquoted cell is kept by csv.reader as is, but it used to open a quoted cell for the scan
+        with open(self.input_path, 'wb') as file:
+            file.write(content.replace(b'"5"" pipe"', b'5" pipe'))
+        self.assertEqual(TestsTracker.read_file(self.input_path)[1].steps[-1]['Text'], '5" pipe')
+        self.assertEqual(len(chunks.find_test_case_offsets(self.input_path)), len(self.test_cases))
+        self.assert_chunks(split_csv1_file(self.input_path, self.output_folder, chunk_size=3))
+        with mock.patch.object(chunks, '_SCAN_BLOCK_SIZE', 64):
+            self.assert_chunks(split_csv1_file(self.input_path, self.output_folder, chunk_size=3, workers=3))
+
+    def test_merge_without_trailing_line_break(self):
+        first_path = chunks_folder.get_file_path('first.csv')
+        with open(first_path, 'wb') as file:
+            file.write(b'TEST_CASE_START\r\nfirst\r\n\r\n\r\nA\r\n1\r\nTEST_CASE_END')
+        merged_path = chunks_folder.get_file_path('merged.csv')
+        merge_csv1_files([first_path, self.input_path], merged_path)
+        self.assertEqual(len(TestsTracker.read_file(merged_path)), len(self.test_cases) + 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
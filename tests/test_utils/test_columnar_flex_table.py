@@ -0,0 +1,171 @@
+import copy
+import unittest
+from functools import partial
+from io import StringIO
+from tabbyset.db.id_utils import get_id_from_steps
+from tabbyset.entities import TestCase
+from tabbyset.file_formats import Csv1Writer, Csv2Writer, RawTestCasesWriter
+from tabbyset.testing import FlexTableAssertions
+from tabbyset.utils.flex_table import FlexTable, ColumnarFlexTable
+
+
+class TestColumnarFlexTable(FlexTableAssertions):
+
+    def setUp(self):
+        self.rows = [
+            {'Action': 'Quote', 'Price': '100'},
+            {'Action': 'Trade', 'Price': '101', 'Qty': '5'},
+            {'Action': 'Quote', 'Qty': '7'},
+        ]
+        self.table = ColumnarFlexTable(self.rows)
+
+    def test_initialization(self):
+        table = ColumnarFlexTable()
+        self.assertEqual(len(table), 0)
+        self.assertEqual(table.columns, [])
+        self.assertIsInstance(table, FlexTable)
+
+    def test_same_content_as_flex_table(self):
+        flex_table = FlexTable(copy.deepcopy(self.rows))
+        self.assertEqual(len(self.table), 3)
+        self.assertEqual(self.table.columns, flex_table.columns)
+        self.assertEqual(list(self.table), list(flex_table))
+        self.assertFlexTablesEqual(flex_table, self.table)
+        self.assertEqual(hash(flex_table), hash(self.table))
+        self.assertEqual(repr(self.table), f'ColumnarFlexTable({self.rows})')
+
+    def test_column_values(self):
+        self.assertEqual(self.table['Action'], ['Quote', 'Trade', 'Quote'])
+        self.assertEqual(self.table['Price'], ['100', '101', ''])
+        self.assertEqual(self.table['Nonexistent'], ['', '', ''])
+
+    def test_row_view(self):
+        row = self.table[2]
+        self.assertEqual(row, {'Action': 'Quote', 'Qty': '7'})
+        self.assertNotIn('Price', row)
+        self.assertIsNone(row.get('Price'))
+        with self.assertRaises(KeyError):
+            _ = row['Price']
+        self.assertEqual(row | {'Price': '1'}, {'Action': 'Quote', 'Qty': '7', 'Price': '1'})
+
+    def test_rows_keep_keys_order(self):
+        table = ColumnarFlexTable([{'Price': '100', 'Action': 'Quote'}, {'Action': 'Trade', 'Price': '101'}])
+        self.assertEqual([list(row) for row in table], [['Price', 'Action'], ['Action', 'Price']])
+        del table[0]['Price']
+        table[0]['Price'] = '102'
+        table.insert(0, {'Qty': '5', 'Action': 'Cancel'})
+        table['Side'] = 'Buy'
+        self.assertEqual([list(row) for row in table], [
+            ['Qty', 'Action', 'Side'],
+            ['Action', 'Price', 'Side'],
+            ['Action', 'Price', 'Side'],
+        ])
+        table.remove_column('Action')
+        self.assertEqual([list(row) for row in table], [['Qty', 'Side'], ['Price', 'Side'], ['Price', 'Side']])
+        self.assertEqual(repr(table[0]), "{'Qty': '5', 'Side': 'Buy'}")
+
+    def test_same_output_as_flex_table(self):
+        rows = [
+            {'Action': 'Quote', 'Price': '100', 'Empty': ''},
+            {'Qty': '5', 'Action': 'Trade', 'Price': '100'},
+            {'Action': 'Quote', 'Qty': '7'},
+        ]
+        flex_test_case = TestCase('Test', FlexTable(copy.deepcopy(rows)), id='00000000-0000-0000-0000-000000000000')
+        columnar_test_case = TestCase('Test', ColumnarFlexTable(copy.deepcopy(rows)), id=flex_test_case.id)
+        self.assertEqual(hash(flex_test_case.steps), hash(columnar_test_case.steps))
+        self.assertEqual(hash(flex_test_case), hash(columnar_test_case))
+        self.assertEqual(get_id_from_steps(flex_test_case), get_id_from_steps(columnar_test_case))
+        writer_classes = (Csv1Writer, partial(Csv2Writer, global_columns=['Action']), RawTestCasesWriter)
+        for writer_class in writer_classes:
+            with self.subTest(writer=writer_class):
+                outputs = []
+                for test_case in (flex_test_case, columnar_test_case):
+                    output = StringIO()
+                    writer = writer_class(output)
+                    writer.write(test_case)
+                    writer.flush()
+                    outputs.append(output.getvalue())
+                self.assertEqual(outputs[0], outputs[1])
+
+    def test_row_view_writes_through(self):
+        self.table[0]['Side'] = 'Buy'
+        del self.table[1]['Qty']
+        self.assertEqual(self.table[0], {'Action': 'Quote', 'Price': '100', 'Side': 'Buy'})
+        self.assertEqual(self.table[1], {'Action': 'Trade', 'Price': '101'})
+        self.assertEqual(self.table.columns, ['Action', 'Price', 'Side', 'Qty'])
+
+    def test_mutations(self):
+        self.table.insert(0, {'Action': 'Cancel'})
+        self.table.append({'Action': 'Trade'})
+        self.assertEqual(self.table['Action'], ['Cancel', 'Quote', 'Trade', 'Quote', 'Trade'])
+        self.assertEqual(self.table.pop(0), {'Action': 'Cancel'})
+        self.table[0] = {'Action': 'Amend'}
+        self.assertEqual(self.table[0], {'Action': 'Amend'})
+        self.table.remove({'Action': 'Trade'})
+        self.assertEqual(list(self.table), [{'Action': 'Amend'}, {'Action': 'Quote', 'Qty': '7'}])
+        self.table.remove_column('Qty')
+        self.assertEqual(self.table.columns, ['Action'])
+        self.table['Symbol'] = 'AAPL'
+        self.assertEqual(self.table['Symbol'], ['AAPL', 'AAPL'])
+
+    def test_columns_order_as_in_flex_table(self):
+        flex_table = FlexTable(copy.deepcopy(self.rows))
+        operations = [
+            lambda table: table.insert(0, {'Side': 'Buy', 'Action': 'Cancel'}),
+            lambda table: table.__delitem__(0),
+            lambda table: table.__delitem__(0),
+            lambda table: table.__setitem__('Symbol', 'AAPL'),
+            lambda table: table.insert(1, {'Venue': 'XNAS'}),
+            lambda table: table.__setitem__(0, {'Qty': '1', 'Action': 'Amend'}),
+            lambda table: table.remove_column('Action'),
+            lambda table: table.append({'Action': 'Quote'}),
+        ]
+        for number, operation in enumerate(operations):
+            operation(flex_table)
+            operation(self.table)
+            with self.subTest(operation=number):
+                self.assertEqual(self.table.columns, flex_table.columns)
+                flex_table.invalidate_caches()
+                self.assertEqual(self.table.columns, flex_table.columns)
+
+    def test_hash_as_in_flex_table(self):
+        # Cells read from a file are distinct objects even when their values are equal
+        rows = [{'Action': ''.join(['Qu', 'ote']), 'Price': ''.join(['10', '0'])} for _ in range(3)]
+        self.assertEqual(hash(ColumnarFlexTable(rows)), hash(FlexTable(rows)))
+
+    def test_sort_and_reverse(self):
+        self.table.sort(key=lambda row: row.get('Qty', ''))
+        self.assertEqual(self.table['Qty'], ['', '5', '7'])
+        self.table.reverse()
+        self.assertEqual(self.table['Qty'], ['7', '5', ''])
+
+    def test_query(self):
+        result = self.table.query({'Action': 'Quote'})
+        self.assertIsInstance(result, ColumnarFlexTable)
+        self.assertEqual(list(result), [self.rows[0], self.rows[2]])
+        self.assertIn({'Price': '> 100'}, self.table)
+        self.assertEqual(self.table.count({'Action': 'Quote'}), 2)
+        self.assertEqual(self.table.index({'Action': 'Trade'}), 1)
+
+    def test_indexed_query(self):
+        self.table.create_index('Action')
+        self.assertEqual(self.table.count({'Action': 'Quote'}), 2)
+        self.assertEqual(list(self.table.query({'Action': 'Quote', 'Qty': '7'})), [self.rows[2]])
+        self.table[1]['Action'] = 'Quote'
+        self.table.append({'Action': 'Quote'})
+        self.assertEqual(self.table.count({'Action': 'Quote'}), 4)
+
+    def test_copies_are_independent(self):
+        for table_copy in (self.table.copy(), self.table.copy(deep=True), self.table[:]):
+            with self.subTest(copy_type=type(table_copy._data).__name__):
+                table_copy[0]['Action'] = 'Cancel'
+                self.assertEqual(self.table[0]['Action'], 'Quote')
+
+    def test_to_flex_table(self):
+        flex_table = self.table.to_flex_table()
+        self.assertIs(type(flex_table), FlexTable)
+        self.assertEqual(flex_table.rows, self.rows)
+
+
+if __name__ == '__main__':
+    unittest.main()
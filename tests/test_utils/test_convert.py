@@ -0,0 +1,59 @@
+import io
+from dataclasses import replace
+import unittest
+from tabbyset import TestsTracker
+from tabbyset.file_formats.csv2 import Csv2Reader
+from tabbyset.testing import TestCaseAssertions
+from tabbyset.utils import Folder, convert_to_csv2, global_columns
+
+temp_folder = Folder.mount_from_current_module('./__temp__')
+convert_folder = temp_folder.mount_subfolder('convert')
+
+
+class TestConvertToCsv2(TestCaseAssertions):
+
+    def setUp(self):
+        convert_folder.clear()
+        self.test_cases = [
+            TestsTracker.new_test('first', [{'Action': 'Quote', 'Price': '1'}, {'Action': 'Trade', 'Qty': '5'}]),
+            TestsTracker.new_test('second', [{'Action': 'Comment', 'Text': 'text'}]),
+        ]
+        self.input_path = convert_folder.get_file_path('input.csv')
+        TestsTracker.write_to_file(self.input_path, self.test_cases)
+
+    def assert_converted(self, output_path, expected_columns, multiheader_config=None):
+        with Csv2Reader(output_path, multiheader_config=multiheader_config) as reader:
+            self.assertEqual(reader.global_columns, expected_columns)
+            self.assertEqual([(test_case.name, hash(test_case.steps)) for test_case in reader],
+                             [(test_case.name, hash(test_case.steps)) for test_case in self.test_cases])
+
+    def test_convert_file(self):
+        output_path = convert_folder.get_file_path('output.csv2')
+        convert_to_csv2(self.input_path, output_path)
+        self.assert_converted(output_path, global_columns(self.test_cases))
+
+    def test_convert_textio(self):
+        output_path = convert_folder.get_file_path('output.csv2')
+        with open(self.input_path, newline='', encoding='utf-8') as input_file:
+            text = input_file.read()
+        convert_to_csv2(io.StringIO(text, newline=''), output_path)
+        self.assert_converted(output_path, global_columns(self.test_cases))
+
+    def test_convert_multiheader(self):
+        output_path = convert_folder.get_file_path('output.csv2')
+        convert_to_csv2(self.input_path, output_path, multiheader=True)
+        self.assert_converted(output_path, global_columns(self.test_cases, multiheader=True))
+
+    def test_convert_multiheader_custom_categorizer(self):
+        output_path = convert_folder.get_file_path('output.csv2')
+
+        def categorizer(row):
+            return 'Trading' if row['Action'] in ('Quote', 'Trade') else 'Other'
+
+        convert_to_csv2(self.input_path, output_path, multiheader=True, categorizer=categorizer)
+        self.assert_converted(output_path, {'Trading': ['Action', 'Price', 'Qty'], 'Other': ['Action', 'Text']},
+                              replace(Csv2Reader.get_default_multiheader_config(), categorizer=categorizer))
+
+
+if __name__ == '__main__':
+    unittest.main()
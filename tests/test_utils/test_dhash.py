@@ -1,6 +1,21 @@
 import tabbyset as tbs
 import copy
 import unittest
+from decimal import Decimal
+
+from tabbyset.utils.dhash import dhash_table
+
+
+def distinct(value):
+    """
+    :return: The equal value, which is not the same object, as it is for the values read from the files.
+    """
+    if isinstance(value, str):
+        return (value + '#')[:-1]
+    if isinstance(value, Decimal):
+        return Decimal(str(value))
+    return value
+
 
 class TestDeterministicHash(unittest.TestCase):
     def test_dhash(self):
@@ -8,4 +23,16 @@ class TestDeterministicHash(unittest.TestCase):
             with self.subTest(data_type=type(hashable)):
                 hash1 = tbs.dhash(hashable)
                 hash2 = tbs.dhash(copy.deepcopy(hashable))
-                self.assertEqual(hash1, hash2)
\ No newline at end of file
+                self.assertEqual(hash1, hash2)
+
+    def test_dhash_table_equals_dhash(self):
+        values = ['', 'a', 'é', 'Ā', 'Quote', 'Цена', 'x' * 300, 'y' * 70000, '\ud800',
+                  None, True, 0, 255, 65536, -1, 2 ** 40, 1.5, Decimal('1.25'), Decimal('-3')]
+        for rows_count in (0, 1, 2, 3, 70, 2000):
+            with self.subTest(rows_count=rows_count):
+                columns = [distinct(f'Column{i}') for i in range(5)]
+                rows = [tuple(distinct(values[(i * 7 + j) % len(values)]) for j in range(5))
+                        for i in range(rows_count)]
+                self.assertEqual(dhash_table(columns, rows), tbs.dhash(tuple([tuple(columns)] + rows)))
+        with self.subTest('Empty rows'):
+            self.assertEqual(dhash_table([], [(), ()]), tbs.dhash(((), (), ())))
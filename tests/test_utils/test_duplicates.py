@@ -0,0 +1,57 @@
+import csv
+import unittest
+from tabbyset import TestsTracker
+from tabbyset.utils import Folder, find_duplicates, write_duplicates_report
+
+temp_folder = Folder.mount_from_current_module('./__temp__')
+duplicates_folder = temp_folder.mount_subfolder('duplicates')
+
+
+class TestFindDuplicates(unittest.TestCase):
+
+    def setUp(self):
+        duplicates_folder.clear()
+        self.files = []
+        for file_index in range(3):
+            file_path = duplicates_folder.get_file_path(f'tests_{file_index}.csv')
+            test_cases = [
+                TestsTracker.new_test(f'unique_{file_index}', [{'Action': 'Quote', 'Price': str(file_index)}]),
+                TestsTracker.new_test(f'common_{file_index}', [{'Action': 'Trade', 'Price': '100'}]),
+            ]
+            if file_index == 2:
+                # Differs from the common test case only by columns order and an empty column
+                test_cases.append(TestsTracker.new_test('reordered', [{'Empty': '', 'Price': '100', 'Action': 'Trade'}]))
+            TestsTracker.write_to_file(file_path, test_cases)
+            self.files.append(file_path)
+
+    def assert_common_group(self, groups):
+        self.assertEqual(len(groups), 1)
+        locations = groups[0].locations
+        self.assertEqual([location.name for location in locations], ['common_0', 'common_1', 'common_2', 'reordered'])
+        self.assertEqual([location.file_path for location in locations], self.files + [self.files[2]])
+        with open(self.files[0]) as file:
+            lines = file.read().splitlines()
+        self.assertTrue(lines[locations[0].line_number - 1].startswith('TEST_CASE_START'))
+        self.assertEqual(lines[locations[0].line_number], 'common_0')
+
+    def test_find_duplicates(self):
+        self.assert_common_group(list(find_duplicates(self.files)))
+
+    def test_parallel(self):
+        self.assert_common_group(list(find_duplicates(self.files, workers=2)))
+
+    def test_spilling(self):
+        self.assert_common_group(list(find_duplicates(self.files, max_entries=1, temp_folder=duplicates_folder)))
+        self.assertEqual(len(duplicates_folder.listdir()), len(self.files))
+
+    def test_report(self):
+        report_path = duplicates_folder.get_file_path('report.csv')
+        self.assertEqual(write_duplicates_report(find_duplicates(self.files), report_path), 1)
+        with open(report_path, newline='') as file:
+            rows = list(csv.DictReader(file))
+        self.assertEqual([row['Name'] for row in rows], ['common_0', 'common_1', 'common_2', 'reordered'])
+        self.assertEqual({row['Group'] for row in rows}, {'1'})
+
+
+if __name__ == '__main__':
+    unittest.main()
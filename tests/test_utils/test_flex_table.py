@@ -1,4 +1,5 @@
 import unittest
+from decimal import Decimal
 from tabbyset.testing import TestCaseAssertions
 from tabbyset.utils.flex_table import FlexTable, ascii_table
 from tabbyset.testing.diff import ColoredString, ConsoleColor
@@ -39,6 +40,56 @@ class TestFlexTable(TestCaseAssertions):
         self.assertNotIn('col1', self.non_empty_flex_table.columns)
         self.assertIn('col11', self.non_empty_flex_table.columns)
 
+    def test_columns_order(self):
+        flex_table = FlexTable([{'B': 1}, {'A': 1, 'C': 1}])
+        self.assertEqual(flex_table.columns, ['B', 'A', 'C'])
+        flex_table.append({'D': 1, 'A': 2})
+        self.assertEqual(flex_table.columns, ['B', 'A', 'C', 'D'])
+        flex_table.insert(0, {'C': 0})
+        self.assertEqual(flex_table.columns, ['C', 'B', 'A', 'D'])
+        flex_table['A'] = 0
+        self.assertEqual(flex_table.columns, ['C', 'A', 'B', 'D'])
+        flex_table.remove_columns(['B', 'X'])
+        self.assertEqual(flex_table.columns, ['C', 'A', 'D'])
+        flex_table.pop(0)
+        self.assertEqual(flex_table.columns, ['A', 'C', 'D'])
+        flex_table.reverse()
+        self.assertEqual(flex_table.columns, ['D', 'A', 'C'])
+        flex_table.clear()
+        self.assertEqual(flex_table.columns, [])
+
+    def test_columns_after_direct_row_changes(self):
+        flex_table = FlexTable([{'A': 1}, {'B': 2}])
+        self.assertEqual(flex_table.columns, ['A', 'B'])
+        flex_table[1]['C'] = 3
+        for row in flex_table:
+            row.pop('A', None)
+        flex_table.invalidate_caches()
+        self.assertEqual(flex_table.columns, ['B', 'C'])
+        flex_table.rows[0].update({'D': 4})
+        flex_table.invalidate_caches()
+        self.assertEqual(flex_table.columns, ['D', 'B', 'C'])
+
+    def test_appended_rows_are_shared(self):
+        row = {'A': '1'}
+        flex_table = FlexTable([row])
+        self.assertIs(flex_table[0], row)
+        row['A'] = '2'
+        self.assertEqual(flex_table['A'], ['2'])
+        self.assertIs(flex_table.rows, flex_table.rows)
+        self.assertEqual(flex_table.rows, [{'A': '2'}])
+
+    def test_direct_row_changes_need_invalidation(self):
+        flex_table = FlexTable([{'A': '1'}, {'A': '2'}]).create_index('A')
+        table_hash = hash(flex_table)
+        self.assertEqual(flex_table.count({'A': '1'}), 1)
+        flex_table.query({'A': '1'})[0]['A'] = '3'
+        flex_table.invalidate_caches()
+        self.assertEqual(flex_table.count({'A': '3'}), 1)
+        self.assertEqual(flex_table.count({'A': '1'}), 0)
+        self.assertNotEqual(hash(flex_table), table_hash)
+        self.assertEqual(hash(flex_table), hash(FlexTable([{'A': '3'}, {'A': '2'}])))
+
     def test_setitem_negative(self):
         self.assertRaises(TypeError, self.non_empty_flex_table.__setitem__, {}, 0)
 
@@ -94,6 +145,54 @@ class TestFlexTable(TestCaseAssertions):
         with self.assertRaises(ValueError):
             table.index({'Action': 'Nonexistent'})
 
+    def test_index_on_column(self):
+        self.big_table.create_index('col2').create_index('col1')
+        self.assertEqual(self.big_table.indexed_columns, ['col2', 'col1'])
+        self.assertEqual(self.big_table.count({'col2': '10.0'}), 1)
+        self.assertEqual(self.big_table.index({'col1': 'value10'}), 10)
+        self.assertIn({'col1': 'value10', 'col2': 10}, self.big_table)
+        self.assertNotIn({'col1': 'value10', 'col2': 11}, self.big_table)
+        self.assertEqual(list(self.big_table.query({'col2': '> 990', 'col1': 'value995'})),
+                         [{'col1': 'value995', 'col2': 995}])
+        self.big_table.append({'col1': 'value10', 'col2': 'NaN'})
+        self.assertEqual(self.big_table.count({'col1': 'value10'}), 2)
+        self.big_table[0]['col1'] = 'value10'
+        self.big_table.invalidate_caches()
+        self.assertEqual(self.big_table.count({'col1': 'value10'}), 3)
+        self.big_table.reverse()
+        self.assertEqual(self.big_table.index({'col1': 'value10'}), 0)
+        self.big_table.drop_index('col1').drop_index('col2')
+        self.assertEqual(self.big_table.indexed_columns, [])
+        self.assertEqual(self.big_table.count({'col1': 'value10'}), 3)
+
+    def test_ordered_index_on_column(self):
+        self.big_table.create_index('col2', ordered=True)
+        self.assertEqual(self.big_table.count({'col2': '> 990'}), 9)
+        self.assertEqual(self.big_table.count({'col2': '>= 990'}), 10)
+        self.assertEqual(self.big_table.count({'col2': '< 10.5'}), 11)
+        self.assertEqual(self.big_table.count({'col2': '<= 10'}), 11)
+        self.assertEqual(self.big_table.count({'col2': '10'}), 1)
+        self.assertEqual(list(self.big_table.query({'col2': '> 997'})),
+                         [{'col1': 'value998', 'col2': 998}, {'col1': 'value999', 'col2': 999}])
+        self.big_table.append({'col1': 'value1000', 'col2': 1000})
+        self.assertEqual(self.big_table.count({'col2': '> 990'}), 10)
+        self.big_table.append({'col1': 'value1001'})
+        self.assertEqual(self.big_table.count({'col1': 'value995', 'col2': '> 990'}), 1)
+        with self.assertRaises(TypeError):
+            self.big_table.count({'col2': '> 990'})
+
+    def test_ordered_index_on_mixed_column(self):
+        rows = [{'A': 'x', 'P': '200'}, {'A': 'y', 'P': 'abc'}, {'A': 'x', 'P': '50'}, {'A': 'y', 'P': 'NaN'}]
+        table = FlexTable(rows)
+        indexed_table = FlexTable(rows).create_index('A').create_index('P', ordered=True)
+        # The mixed column is scanned as without the index, so the result depends on the order of the statements
+        for query in ({'A': 'x', 'P': '> 100'}, {'A': 'x', 'P': '<= 100'}):
+            with self.subTest(query=query):
+                self.assertEqual(list(indexed_table.query(query)), list(table.query(query)))
+        for query_table in (table, indexed_table):
+            with self.assertRaises(TypeError):
+                query_table.count({'P': '> 100', 'A': 'x'})
+
     def test_pop(self):
         table = FlexTable([{'Action': 'Quote'}, {'Action': 'Trade'}, {'Action': 'Quote'}])
         self.assertEqual(table.pop(1), {'Action': 'Trade'})
@@ -193,6 +292,60 @@ class TestFlexTable(TestCaseAssertions):
         table1 += {'col1': 'value2', 'col2': 3}
         self.assertEqual(table1, FlexTable([{'col1': 'value1', 'col2': 2}, {'col1': 'value2', 'col2': 3}]))
 
+    def test_numeric_column(self):
+        table = FlexTable([{'Price': '1.5', 'Qty': '10'}, {'Qty': '5'}, {'Price': '', 'Qty': '-2'}])
+        prices = table.numeric_column('Price')
+        self.assertEqual(list(prices.values), [1.5, 0.0, 0.0])
+        self.assertEqual([bool(is_empty) for is_empty in prices.mask], [False, True, True])
+        self.assertEqual(list(table.numeric_column('Qty', 'int64').values), [10, 5, -2])
+        with self.subTest('Cached until changed'):
+            self.assertIs(table.numeric_column('Price'), prices)
+            table[1] = {'Price': '2', 'Qty': '5'}
+            self.assertEqual(list(table.numeric_column('Price').values), [1.5, 2.0, 0.0])
+            table.append({'Price': '3'})
+            self.assertEqual(list(table.numeric_column('Price').values), [1.5, 2.0, 0.0, 3.0])
+        with self.subTest('Invalid value'):
+            with self.assertRaises(ValueError):
+                table.numeric_column('Price', 'int64')
+            table.append({'Price': 'abc'})
+            with self.assertRaisesRegex(ValueError, 'row 4'):
+                table.numeric_column('Price')
+        with self.subTest('Fractional int64'):
+            for value in ('1.5', 1.5, Decimal('1.5'), 'nan', str(2 ** 63)):
+                with self.assertRaises(ValueError):
+                    FlexTable([{'Qty': '1'}, {'Qty': value}]).numeric_column('Qty', 'int64')
+            integral = FlexTable([{'Qty': '2.0'}, {'Qty': '1e3'}, {'Qty': 7.0}, {'Qty': Decimal('3.00')}])
+            self.assertEqual(list(integral.numeric_column('Qty', 'int64').values), [2, 1000, 7, 3])
+
+    def test_hash_is_stable(self):
+        # The hash is used to generate the ids of the test cases, so it must not change between versions
+        table = FlexTable([{'Action': 'Quote', 'Price': '100', 'Empty': ''},
+                           {'Action': 'Trade', 'Price': '101', 'Qty': '5'},
+                           {'Action': 'Quote', 'Qty': '7', 'Empty': ''}])
+        self.assertEqual(hash(table), 286078361235404854)
+
+    def test_hash_cache(self):
+        table = FlexTable([{'col1': 'a', 'col2': 'b'}, {'col1': 'c'}])
+
+        def assert_hash_updated():
+            self.assertEqual(hash(table), hash(FlexTable(list(table))))
+
+        original_hash = hash(table)
+        self.assertEqual(hash(table), original_hash)
+        table[0] = {'col1': 'a', 'col2': 'd'}
+        assert_hash_updated()
+        table.append({'col1': 'e'})
+        assert_hash_updated()
+        table.sort(key=lambda row: row['col1'], reverse=True)
+        assert_hash_updated()
+        table.remove_column('col2')
+        assert_hash_updated()
+        table['col3'] = 'f'
+        assert_hash_updated()
+        table.pop()
+        assert_hash_updated()
+        self.assertNotEqual(hash(table), original_hash)
+
     def test_hash(self):
         original_table = self.big_table
         with self.subTest('Same table'):
@@ -0,0 +1,95 @@
+import unittest
+from tabbyset import TestsTracker, FileParsingException
+from tabbyset.file_formats.csv1 import Csv1Writer
+from tabbyset.testing import TestCaseAssertions
+import os
+from unittest import mock
+from tabbyset.utils import Folder, walk_tests_folder, read_tests_files, TestsFilesCache
+
+temp_folder = Folder.mount_from_current_module('./__temp__')
+fs_utils_folder = temp_folder.mount_subfolder('fs_utils')
+
+
+class TestParallelReading(TestCaseAssertions):
+
+    def setUp(self):
+        self.folder = fs_utils_folder.mount_subfolder('valid')
+        self.files = []
+        for file_index in range(4):
+            file_path = self.folder.get_file_path(f'tests_{file_index}.csv')
+            test_cases = [TestsTracker.new_test(f'test_{file_index}_{i}', [{'Action': 'Quote', 'Price': str(i)}])
+                          for i in range(3)]
+            TestsTracker.write_to_file(file_path, test_cases)
+            self.files.append(file_path)
+
+    def test_walk_tests_folder(self):
+        expected = list(walk_tests_folder(self.folder))
+        actual = list(walk_tests_folder(self.folder, workers=2))
+        self.assertEqual([rel_path for rel_path, _ in expected], [rel_path for rel_path, _ in actual])
+        for (_, expected_test_case), (_, actual_test_case) in zip(expected, actual):
+            self.assertTestCasesEqual(expected_test_case, actual_test_case)
+        unordered = list(walk_tests_folder(self.folder, workers=2, ordered=False))
+        self.assertCountEqual([tc.id for _, tc in expected], [tc.id for _, tc in unordered])
+
+    def test_read_folder(self):
+        expected = TestsTracker.read_folder(self.folder)
+        actual = TestsTracker.read_folder(self.folder, workers=2)
+        self.assertEqual([tc.id for tc in expected], [tc.id for tc in actual])
+
+    def test_parsing_exception(self):
+        invalid_file_path = fs_utils_folder.get_file_path('invalid.csv')
+        with open(invalid_file_path, 'w') as file:
+            file.write('TEST_CASE_START\nname\n\n\nA,B\n1,2\n')
+        with self.assertRaises(FileParsingException) as context:
+            list(read_tests_files(self.files + [invalid_file_path], workers=2))
+        self.assertEqual(context.exception.file_path, invalid_file_path)
+        self.assertEqual(context.exception.line_number, 6)
+
+
+class TestTestsFilesCache(TestCaseAssertions):
+
+    def setUp(self):
+        self.folder = fs_utils_folder.mount_subfolder('cached')
+        self.folder.clear()
+        self.cache_folder = fs_utils_folder.mount_subfolder('cache')
+        self.cache_folder.clear()
+        self.file_path = self.folder.get_file_path('tests.csv')
+        self.test_cases = [TestsTracker.new_test(f'test_{i}', [{'Action': 'Quote', 'Price': str(i)}])
+                           for i in range(3)]
+        TestsTracker.write_to_file(self.file_path, self.test_cases)
+
+    def test_read_from_cache(self):
+        cache = TestsFilesCache(self.cache_folder)
+        expected = TestsTracker.read_file(self.file_path, cache=cache)
+        with mock.patch('tabbyset.utils.fs_utils.Csv1Reader', side_effect=AssertionError('File is parsed')):
+            actual = TestsTracker.read_file(self.file_path, cache=cache)
+            walked = [tc for _, tc in walk_tests_folder(self.folder, cache=cache)]
+        for expected_test_case, actual_test_case, walked_test_case in zip(expected, actual, walked):
+            self.assertTestCasesEqual(expected_test_case, actual_test_case)
+            self.assertTestCasesEqual(expected_test_case, walked_test_case)
+            self.assertEqual(expected_test_case.id, actual_test_case.id)
+
+    def test_changed_file(self):
+        cache = TestsFilesCache(self.cache_folder)
+        TestsTracker.read_folder(self.folder, cache=cache)
+        TestsTracker.write_to_file(self.file_path, self.test_cases[:1])
+        stat = os.stat(self.file_path)
+        os.utime(self.file_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+        actual = TestsTracker.read_folder(self.folder, cache=cache)
+        self.assertEqual([tc.id for tc in self.test_cases[:1]], [tc.id for tc in actual])
+
+    def test_options(self):
+        cache = TestsFilesCache(self.cache_folder)
+        TestsTracker.read_file(self.file_path, cache=cache)
+        self.assertIsNone(cache.get(self.file_path, 'csv2'))
+        self.assertIsNotNone(cache.get(self.file_path, 'csv1'))
+
+    def test_eviction(self):
+        cache = TestsFilesCache(self.cache_folder, max_size=1)
+        TestsTracker.read_file(self.file_path, cache=cache)
+        self.assertIsNone(cache.get(self.file_path, 'csv1'))
+        self.assertEqual([], list(self.cache_folder.glob('*.tcache')))
+
+
+if __name__ == '__main__':
+    unittest.main()
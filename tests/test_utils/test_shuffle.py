@@ -0,0 +1,78 @@
+import io
+import unittest
+from tabbyset import TestsTracker
+from tabbyset.file_formats.csv2 import Csv2Reader, Csv2Writer
+from tabbyset.testing import TestCaseAssertions
+from tabbyset.utils import Folder, shuffle_csv1, shuffle_csv2
+
+temp_folder = Folder.mount_from_current_module('./__temp__')
+shuffle_folder = temp_folder.mount_subfolder('shuffle')
+
+
+class TestShuffle(TestCaseAssertions):
+
+    def setUp(self):
+        shuffle_folder.clear()
+        self.test_cases = [TestsTracker.new_test(f'test_{i}', [{'Action': 'Quote', 'Price': str(i)}])
+                           for i in range(10)]
+        self.test_cases[3].steps.append({'Action': 'Comment', 'Text': 'first line\nTEST_CASE_START,"quoted"'})
+
+    def read_ids(self, path, reader_type=None):
+        if reader_type is None:
+            return [test_case.id for test_case in TestsTracker.read_file(path)]
+        with reader_type(path) as reader:
+            return [test_case.id for test_case in reader]
+
+    def test_external_csv1(self):
+        input_path = shuffle_folder.get_file_path('input.csv')
+        TestsTracker.write_to_file(input_path, self.test_cases)
+        in_memory_path = shuffle_folder.get_file_path('in_memory.csv')
+        external_path = shuffle_folder.get_file_path('external.csv')
+        shuffle_csv1(input_path, in_memory_path, random_seed=42)
+        shuffle_csv1(input_path, external_path, random_seed=42, external=True)
+        expected_ids = self.read_ids(in_memory_path)
+        self.assertNotEqual(expected_ids, [test_case.id for test_case in self.test_cases])
+        self.assertEqual(self.read_ids(external_path), expected_ids)
+
+        output = io.StringIO(newline='')
+        shuffle_csv1(input_path, output, random_seed=42, external=True)
+        with open(external_path, newline='', encoding='utf-8') as external_file:
+            self.assertEqual(output.getvalue(), external_file.read())
+
+    def test_external_csv2(self):
+        input_path = shuffle_folder.get_file_path('input.csv2')
+        with Csv2Writer(input_path, global_columns=['Action', 'Price', 'Text']) as writer:
+            writer.write_many(self.test_cases)
+        in_memory_path = shuffle_folder.get_file_path('in_memory.csv2')
+        external_path = shuffle_folder.get_file_path('external.csv2')
+        shuffle_csv2(input_path, in_memory_path, random_seed=7)
+        shuffle_csv2(input_path, external_path, random_seed=7, external=True)
+        self.assertEqual(self.read_ids(external_path, Csv2Reader), self.read_ids(in_memory_path, Csv2Reader))
+        with Csv2Reader(external_path) as reader:
+            self.assertEqual(reader.global_columns, ['Action', 'Price', 'Text'])
+
+    def test_external_with_unescaped_quotes(self):
+        self.test_cases[1].steps.append({'Action': 'Comment', 'Text': '5" pipe'})
+        input_path = shuffle_folder.get_file_path('input.csv')
+        TestsTracker.write_to_file(input_path, self.test_cases)
+        with open(input_path, 'rb') as file:
+            content = file.read()
+        # csv.reader keeps the quote inside the unquoted cell as is
+        with open(input_path, 'wb') as file:
+            file.write(content.replace(b'"5"" pipe"', b'5" pipe'))
+        in_memory_path = shuffle_folder.get_file_path('in_memory.csv')
+        external_path = shuffle_folder.get_file_path('external.csv')
+        shuffle_csv1(input_path, in_memory_path, random_seed=42)
+        shuffle_csv1(input_path, external_path, random_seed=42, external=True)
+        expected_test_cases = TestsTracker.read_file(in_memory_path)
+        self.assertEqual(len(expected_test_cases), len(self.test_cases))
+        for expected, actual in zip(expected_test_cases, TestsTracker.read_file(external_path)):
+            self.assertTestCasesEqual(expected, actual)
+
+    def test_external_requires_path(self):
+        with self.assertRaises(ValueError):
+            shuffle_csv1(io.StringIO(''), io.StringIO(), external=True)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -2,7 +2,7 @@ import unittest
 from decimal import Decimal
 from tabbyset.utils.flex_table.table_queries import (
     Equal, NotEqual, GreaterThan, GreaterThanOrEqual, LessThan, LessThanOrEqual,
-    parse_query_statement, parse_dict_query, apply_query_to_dict
+    parse_query_statement, parse_dict_query, apply_query_to_dict, CompiledQuery
 )
 
 
@@ -97,6 +97,32 @@ class TestTableQueries(unittest.TestCase):
         value_dict = {'a': 5, 'b': 6}
         self.assertFalse(apply_query_to_dict(query_dict, value_dict))
 
+    def test_compiled_statement_matches_apply(self):
+        values = ['5', '5.0', '6', 5, 4.0, Decimal('7'), 'abc', '', 'Quote']
+        for statement in (Equal('5'), Equal('Quote'), NotEqual('5'), NotEqual('Quote'), GreaterThan(5),
+                          GreaterThanOrEqual('5.0'), LessThan(6), LessThanOrEqual(Decimal('5'))):
+            matcher = statement.compile()
+            for value in values:
+                with self.subTest(statement=type(statement).__name__, base=statement._base_value, value=value):
+                    try:
+                        expected = statement.apply(value)
+                    except TypeError:
+                        with self.assertRaises(TypeError):
+                            matcher(value)
+                        continue
+                    self.assertEqual(expected, matcher(value))
+                    self.assertEqual(expected, matcher(value), 'Cached result must be the same')
+
+    def test_compiled_query(self):
+        query = parse_dict_query({'a': '5', 'b': '!= x'})
+        self.assertIsInstance(query, CompiledQuery)
+        self.assertIs(parse_dict_query(query), query)
+        self.assertTrue(query({'a': '5.0', 'b': 'y'}))
+        self.assertFalse(query({'a': '5', 'b': 'x'}))
+        self.assertFalse(query({'b': 'y'}))
+        with self.assertRaises(TypeError):
+            query['c'] = Equal(1)
+
     def test_try_number_cast_handles_non_numeric(self):
         self.assertEqual(Equal('abc')._try_number_cast('abc'), 'abc')
         self.assertEqual(Equal('5')._try_number_cast('5'), Decimal('5'))
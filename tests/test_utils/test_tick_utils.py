@@ -1,6 +1,8 @@
 import unittest
 from decimal import Decimal, InvalidOperation
 from tabbyset.utils import round_to_tick, floor_to_tick, ceil_to_tick, is_multiple_of_tick
+from tabbyset.utils import (round_to_tick_many, floor_to_tick_many, ceil_to_tick_many, is_multiple_of_tick_many,
+                            round_column_to_tick, FlexTable)
 
 
 class TestTickUtils(unittest.TestCase):
@@ -95,3 +97,49 @@ class TestTickUtils(unittest.TestCase):
             self.assertEqual(round_to_tick('1.7', '0'), Decimal('1.7'))
         with self.assertRaises(InvalidOperation):
             round_to_tick('1.7', 'a')
+
+    def test_many(self):
+        prices = ['1.2', Decimal('1.7'), 2]
+        with self.subTest(tick_size='single'):
+            self.assertEqual(is_multiple_of_tick_many(prices, '0.5'), [False, False, True])
+            self.assertEqual(floor_to_tick_many(prices, '0.5'), [Decimal('1'), Decimal('1.5'), Decimal('2')])
+            self.assertEqual(ceil_to_tick_many(prices, '0.5'), [Decimal('1.5'), Decimal('2'), Decimal('2')])
+            self.assertEqual(round_to_tick_many(prices, '0.5'), [Decimal('1'), Decimal('1.5'), Decimal('2')])
+        with self.subTest(tick_size='per price'):
+            self.assertEqual(floor_to_tick_many(prices, ['0.5', '0.1', '0']), [Decimal('1'), Decimal('1.7'), Decimal('2')])
+        with self.assertRaises(InvalidOperation):
+            round_to_tick_many(prices, 'a')
+        with self.assertRaises(ValueError):
+            floor_to_tick_many(prices, ['0.5', '0.1'])
+
+    def test_round_column_to_tick(self):
+        table = FlexTable([{'Price': '1.2'}, {'Price': ''}, {'Qty': '1'}, {'Price': '1.5'}, {'Price': Decimal('1.8')}])
+        self.assertEqual(round_column_to_tick(table, 'Price', '0.5', mode='ceil'), 2)
+        self.assertEqual(table['Price'], ['1.5', '', '', '1.5', Decimal('2')])
+        round_column_to_tick(table, 'Price', ['1', '1', '1', '0', '1'], mode='floor')
+        self.assertEqual(table['Price'], ['1', '', '', '1.5', Decimal('2')])
+        with self.assertRaises(ValueError):
+            round_column_to_tick(table, 'Price', '1', mode='truncate')
+
+    def test_round_column_to_tick_formatting(self):
+        table = FlexTable([{'Price': '0.00000012'}, {'Price': '1.50'}, {'Price': '1.0'}, {'Price': '120'}])
+        self.assertEqual(round_column_to_tick(table, 'Price', '0.0000001'), 1)
+        self.assertEqual(table['Price'], ['0.0000001', '1.50', '1.0', '120'])
+        self.assertEqual(round_column_to_tick(table, 'Price', '100', mode='floor'), 4)
+        self.assertEqual(table['Price'], ['0', '0', '0', '100'])
+
+    def test_round_column_to_tick_sparse_tick_sizes(self):
+        table = FlexTable([{'Price': '1.2', 'TickSize': '0.5'}, {'Action': 'Cancel'}, {'Price': '', 'TickSize': ''},
+                           {'Price': '1.7', 'TickSize': '1'}])
+        self.assertEqual(round_column_to_tick(table, 'Price', table['TickSize']), 2)
+        self.assertEqual(table['Price'], ['1.0', '', '', '2'])
+        with self.assertRaises(InvalidOperation):
+            round_column_to_tick(FlexTable([{'Price': '1.2', 'TickSize': ''}]), 'Price', [''])
+
+    def test_round_column_to_tick_sizes_count(self):
+        table = FlexTable([{'Price': '1.2'}, {'Price': '1.7'}])
+        for tick_sizes in (['0.5'], ['0.5', '0.5', '0.5'], iter(['0.5'])):
+            with self.subTest(tick_sizes=tick_sizes):
+                with self.assertRaises(ValueError):
+                    round_column_to_tick(table, 'Price', tick_sizes)
+                self.assertEqual(table['Price'], ['1.2', '1.7'])